@@ -164,7 +164,12 @@ GECKODRIVER_LOG_PATH = 'log/selenium.log'  # 修改为现有的Selenium日志文
 DOWNLOAD_DRIVER = True  # 是否自动下载浏览器驱动
 DRIVER_PATH = None  # 自定义浏览器驱动路径，None表示自动查找
 FIREFOX_BINARY = detect_firefox_path()  # 自动检测Firefox安装路径
-CHROME_BINARY = detect_chrome_path()  # 自动检测Chrome安装路径
+CHROME_BINARY = os.environ.get("CHROME_BINARY") or detect_chrome_path()  # 优先使用环境变量CHROME_BINARY，否则自动检测Chrome安装路径
+STEALTH_MODE_DEFAULT = False  # 是否在Chrome启动时就注册隐身模式脚本，否则在首次请求stealth_mode时注册
+PAGE_LOAD_STRATEGY = 'normal'  # 页面加载策略：normal等待全部资源，eager只等待DOM，none不等待
+BROWSER_POOL_SIZE = 4  # BrowserPool最多同时运行的浏览器数量，每个实例是一个独立的浏览器进程
+HTTP_FAST_PATH = True  # 不需要等待元素、点击、滚动等交互的页面先尝试直接HTTP请求，需要脚本渲染时再使用浏览器
+DEBUG_SCREENSHOTS = False  # 获取页面失败时是否保存错误截图到src/logs/screenshots，用于排查问题
 
 # PDF生成相关配置
 PDF_MARGIN_TOP = 0.4
@@ -12,9 +12,9 @@ from loguru import logger
 from src.resume_generator import ResumeGenerator
 from src.resume_facade import ResumeFacade
 from src.resume_schemas.resume import Resume
-from src.style_manager import StyleManager
+from src.libs.resume_and_cover_builder.style_manager import StyleManager
 import config as cfg
-from src.utils.chrome_utils import browser_manager
+from src.utils.chrome_utils import browser_manager, browser_pool
 
 
 def clean_filename(name: str) -> str:
@@ -109,8 +109,7 @@ def create_cover_letter(parameters: dict, llm_api_key: str):
         # 加载简历文本
         try:
             logger.info("正在加载简历文本...")
-            with open(parameters["uploads"]["plainTextResume"], "r", encoding="utf-8") as file:
-                plain_text_resume = file.read()
+            resume_object = Resume.from_file(parameters["uploads"]["plainTextResume"])
             logger.info("简历文本加载成功")
         except FileNotFoundError:
             logger.error("找不到简历文件")
@@ -187,7 +186,6 @@ def create_cover_letter(parameters: dict, llm_api_key: str):
         # 初始化简历生成器
         logger.info("初始化简历生成器...")
         resume_generator = ResumeGenerator()
-        resume_object = Resume(plain_text_resume)
         resume_generator.set_resume_object(resume_object)
         logger.info("简历生成器初始化成功")
 
@@ -322,8 +320,7 @@ def create_resume_pdf_job_tailored(parameters: dict, llm_api_key: str):
         # 加载简历文本
         try:
             logger.info("正在加载简历文本...")
-            with open(parameters["uploads"]["plainTextResume"], "r", encoding="utf-8") as file:
-                plain_text_resume = file.read()
+            resume_object = Resume.from_file(parameters["uploads"]["plainTextResume"])
             logger.info("简历文本加载成功")
         except FileNotFoundError:
             logger.error("找不到简历文件")
@@ -400,7 +397,6 @@ def create_resume_pdf_job_tailored(parameters: dict, llm_api_key: str):
         # 初始化简历生成器
         logger.info("初始化简历生成器...")
         resume_generator = ResumeGenerator()
-        resume_object = Resume(plain_text_resume)
         resume_generator.set_resume_object(resume_object)
         logger.info("简历生成器初始化成功")
 
@@ -527,8 +523,7 @@ def create_resume_pdf(parameters: dict, llm_api_key: str):
         # 加载简历文本
         try:
             logger.info("正在加载简历文本...")
-            with open(parameters["uploads"]["plainTextResume"], "r", encoding="utf-8") as file:
-                plain_text_resume = file.read()
+            resume_object = Resume.from_file(parameters["uploads"]["plainTextResume"])
             logger.info("简历文本加载成功")
         except FileNotFoundError:
             logger.error("找不到简历文件")
@@ -579,7 +574,6 @@ def create_resume_pdf(parameters: dict, llm_api_key: str):
         # 初始化简历生成器
         logger.info("初始化简历生成器...")
         resume_generator = ResumeGenerator()
-        resume_object = Resume(plain_text_resume)
         resume_generator.set_resume_object(resume_object)
         logger.info("简历生成器初始化成功")
 
@@ -755,6 +749,10 @@ def main():
         print("请查看日志了解详情。")
     finally:
         # 确保资源被正确释放
+        try:
+            browser_pool.close()
+        except Exception:
+            pass
         try:
             browser_manager.close()
         except Exception:
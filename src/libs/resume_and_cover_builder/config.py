@@ -51,6 +51,18 @@ class GlobalConfig:
         # OpenAI配置
         self.OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
         
+        # LLM响应缓存配置。缓存中包含完整的简历和求职信文本，默认放在用户缓存目录，
+        # 不写入当前工作目录，避免被误提交到仓库
+        self.LLM_CACHE_ENABLED = os.environ.get("LLM_CACHE_ENABLED", "True").lower() == "true"
+        self.LLM_CACHE_PATH = Path(os.environ.get("LLM_CACHE_PATH", Path.home() / ".cache" / "aihawk" / "llm_responses.sqlite3"))
+        self.LLM_CACHE_TTL_DAYS = float(os.environ.get("LLM_CACHE_TTL_DAYS", "7"))
+        # 简历和求职信生成是否也使用持久化缓存。默认只缓存职位信息提取这类确定性调用，
+        # 重新生成同一份简历时仍会调用LLM得到新的结果
+        self.LLM_GENERATION_CACHE_ENABLED = os.environ.get("LLM_GENERATION_CACHE_ENABLED", "False").lower() == "true"
+
+        # 是否把生成的求职信HTML写入output/debug_html.html供调试
+        self.DEBUG_HTML_ENABLED = os.environ.get("DEBUG_HTML_ENABLED", "False").lower() == "true"
+
         # 模拟数据配置
         self.USE_MOCK_DATA = True  # 默认启用模拟数据，避免LinkedIn访问失败
         self.MOCK_DATA_CHANCE = 0.8  # 当LinkedIn访问失败时使用模拟数据的概率
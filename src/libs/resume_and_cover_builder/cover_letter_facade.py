@@ -10,8 +10,11 @@ from src.logging import logger
 from src.libs.resume_and_cover_builder.job import Job
 from src.libs.resume_and_cover_builder.llm.llm_job_parser import LLMParser
 from src.libs.resume_and_cover_builder.config import global_config
-from src.libs.resume_and_cover_builder.llm.prompts import COVER_LETTER_GENERATION_PROMPT
-from src.style_manager import StyleManager
+from src.libs.resume_and_cover_builder.llm.prompts import COVER_LETTER_GENERATION_PROMPT, render_prompt
+from src.libs.resume_and_cover_builder.style_manager import StyleManager
+
+# 从LinkedIn职位URL中提取职位ID
+_JOB_ID_PATTERN = re.compile(r'view/(\d+)')
 
 class CoverLetterFacade:
     """求职信生成门面类"""
@@ -36,12 +39,13 @@ class CoverLetterFacade:
     def link_to_job(self, job_url: str) -> Dict[str, Any]:
         """从职位链接获取职位信息"""
         try:
-            # 初始化LLM解析器
-            self.llm_job_parser = LLMParser(
-                api_key=global_config.API_KEY,
-                model_type=global_config.MODEL_TYPE,
-                model=global_config.MODEL
-            )
+            # 初始化LLM解析器，多次调用时复用同一个解析器
+            if self.llm_job_parser is None:
+                self.llm_job_parser = LLMParser(
+                    api_key=global_config.API_KEY,
+                    model_type=global_config.MODEL_TYPE,
+                    model=global_config.MODEL
+                )
             
             # 获取职位信息
             job_info = self.llm_job_parser.parse_job(job_url)
@@ -76,7 +80,7 @@ class CoverLetterFacade:
     def _create_mock_job_data(self, job_url: str) -> Dict[str, Any]:
         """创建模拟职位数据"""
         # 从URL中提取一些信息
-        job_id = re.search(r'view/(\d+)', job_url)
+        job_id = _JOB_ID_PATTERN.search(job_url)
         job_id = job_id.group(1) if job_id else "未知ID"
         
         logger.warning(f"创建模拟数据，职位ID: {job_id}")
@@ -176,15 +180,15 @@ class CoverLetterFacade:
                 additional_info += f"公司地址: {company_address}\n"
             
             # 使用提示词模板
-            prompt = COVER_LETTER_GENERATION_PROMPT.format(
-                name=name,
-                email=email,
-                phone=phone,
-                company=company,
-                role=role,
-                job_description=self.job.description,
-                additional_info=additional_info
-            )
+            prompt = render_prompt(COVER_LETTER_GENERATION_PROMPT, {
+                "name": name,
+                "email": email,
+                "phone": phone,
+                "company": company,
+                "role": role,
+                "job_description": self.job.description,
+                "additional_info": additional_info
+            })
             
             # 使用LLM生成内容
             logger.debug(f"使用提示词: {prompt[:200]}...")  # 仅记录前200个字符
@@ -0,0 +1,116 @@
+"""
+LLM响应缓存模块，以提示词哈希为键把生成结果保存在本地SQLite中，相同输入在有效期内直接复用。
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from loguru import logger
+
+from src.libs.resume_and_cover_builder.config import global_config
+
+# 提示词版本，修改提示词模板时递增，使旧缓存失效
+PROMPT_VERSION = "v1"
+
+_connection = None
+_connection_lock = threading.Lock()
+
+
+def make_input_hash(*parts) -> str:
+    """
+    计算缓存键
+
+    Args:
+        parts: 影响生成结果的全部输入，如模型、温度和提示词
+
+    Returns:
+        str: SHA-256十六进制摘要
+    """
+    return hashlib.sha256("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """返回缓存数据库连接，首次使用时创建数据库和表"""
+    global _connection
+    if _connection is None:
+        cache_path = global_config.LLM_CACHE_PATH
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(cache_path), check_same_thread=False)
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                input_hash TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                model_id TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (input_hash, prompt_version, model_id)
+            )
+            """
+        )
+        connection.commit()
+        _connection = connection
+    return _connection
+
+
+def check_cache(input_hash: str, prompt_version: str, model: str) -> Optional[str]:
+    """
+    查询未过期的缓存响应
+
+    Args:
+        input_hash: make_input_hash计算的缓存键
+        prompt_version: 提示词版本
+        model: 模型名称
+
+    Returns:
+        Optional[str]: 缓存的响应，未命中或缓存不可用时返回None
+    """
+    if not global_config.LLM_CACHE_ENABLED:
+        return None
+    try:
+        with _connection_lock:
+            row = _get_connection().execute(
+                "SELECT response FROM llm_cache "
+                "WHERE input_hash = ? AND prompt_version = ? AND model_id = ? AND expires_at > ?",
+                (input_hash, prompt_version, model, time.time()),
+            ).fetchone()
+    except Exception as e:
+        logger.warning(f"读取LLM缓存失败: {str(e)}")
+        return None
+    if row:
+        logger.debug(f"LLM缓存命中: {input_hash[:12]}")
+        return row[0]
+    return None
+
+
+def save_to_cache(input_hash: str, prompt_version: str, model: str, response: str) -> None:
+    """
+    保存响应到缓存，有效期由LLM_CACHE_TTL_DAYS配置
+
+    Args:
+        input_hash: make_input_hash计算的缓存键
+        prompt_version: 提示词版本
+        model: 模型名称
+        response: 模型响应
+    """
+    if not global_config.LLM_CACHE_ENABLED or not response:
+        return
+    created_at = time.time()
+    expires_at = created_at + global_config.LLM_CACHE_TTL_DAYS * 86400
+    try:
+        with _connection_lock:
+            connection = _get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO llm_cache "
+                "(input_hash, prompt_version, model_id, response, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (input_hash, prompt_version, model, response, created_at, expires_at),
+            )
+            # 顺便清理过期条目，避免缓存文件无限增长
+            connection.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (created_at,))
+            connection.commit()
+    except Exception as e:
+        logger.warning(f"写入LLM缓存失败: {str(e)}")
@@ -9,6 +9,7 @@ from langchain_openai import ChatOpenAI
 from langchain_ollama import ChatOllama
 from src.libs.resume_and_cover_builder.utils import LoggerChatModel
 from src.libs.resume_and_cover_builder.config import global_config
+from src.libs.resume_and_cover_builder.llm.prompts import render_prompt
 from pathlib import Path
 from dotenv import load_dotenv
 import openai
@@ -265,7 +266,7 @@ class LLMCoverLetter:
         
         # 使用字符串格式化替换变量
         try:
-            user_prompt = prompt_template.format(**format_vars)
+            user_prompt = render_prompt(prompt_template, format_vars)
             logger.debug("成功格式化提示模板")
         except KeyError as e:
             logger.error(f"模板变量错误: {str(e)}")
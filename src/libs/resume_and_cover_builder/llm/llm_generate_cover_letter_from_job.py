@@ -6,7 +6,8 @@ import os
 import textwrap
 from loguru import logger
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
+from langchain_core.prompts import SystemMessagePromptTemplate, HumanMessagePromptTemplate
+from src.libs.resume_and_cover_builder.llm.prompts import chat_prompt_from_template
 from langchain_openai import ChatOpenAI
 from langchain_ollama import ChatOllama
 from src.libs.resume_and_cover_builder.config import global_config
@@ -109,7 +110,7 @@ class LLMCoverLetterJobDescription(LLMCoverLetter):
         cleaned_text = re.sub(r'<think>.*', '', cleaned_text, flags=re.DOTALL)
         
         # 创建提示模板，专门用于提取公司名称
-        prompt = ChatPromptTemplate.from_template("""
+        prompt = chat_prompt_from_template("""
         请从以下职位描述中提取公司名称。如果有多个可能的公司名称，请选择最可能是招聘方的公司。
         职位描述：
         {text}
@@ -193,7 +194,7 @@ class LLMCoverLetterJobDescription(LLMCoverLetter):
         cleaned_text = re.sub(r'<think>.*', '', cleaned_text, flags=re.DOTALL)
         
         # 创建提示模板，专门用于提取职位名称
-        prompt = ChatPromptTemplate.from_template("""
+        prompt = chat_prompt_from_template("""
         请从以下职位描述中提取职位名称/职位标题。
         职位描述：
         {text}
@@ -256,7 +257,7 @@ class LLMCoverLetterJobDescription(LLMCoverLetter):
         
         try:
             # 创建摘要提示模板
-            prompt = ChatPromptTemplate.from_template(self.strings.summarize_prompt_template)
+            prompt = chat_prompt_from_template(self.strings.summarize_prompt_template)
             logger.debug("已创建摘要提示模板")
             
             # 构建处理链
@@ -341,7 +342,7 @@ class LLMCoverLetterJobDescription(LLMCoverLetter):
                 logger.debug("使用默认求职信提示模板")
             
             # 创建提示
-            prompt = ChatPromptTemplate.from_template(prompt_template)
+            prompt = chat_prompt_from_template(prompt_template)
             
             # 生成求职信
             chain = prompt | self.llm_cheap | StrOutputParser()
@@ -6,7 +6,7 @@ import os
 import textwrap
 from src.libs.resume_and_cover_builder.utils import LoggerChatModel
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate
+from src.libs.resume_and_cover_builder.llm.prompts import chat_prompt_from_template
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -84,7 +84,7 @@ class LLMResumer:
         header_prompt_template = self._preprocess_template_string(
             self.strings.prompt_header
         )
-        prompt = ChatPromptTemplate.from_template(header_prompt_template)
+        prompt = chat_prompt_from_template(header_prompt_template)
         chain = prompt | self.llm_cheap | StrOutputParser()
         input_data = {
             "personal_information": self.resume.personal_information
@@ -105,7 +105,7 @@ class LLMResumer:
         education_prompt_template = self._preprocess_template_string(self.strings.prompt_education)
         logger.debug(f"Education template: {education_prompt_template}")
 
-        prompt = ChatPromptTemplate.from_template(education_prompt_template)
+        prompt = chat_prompt_from_template(education_prompt_template)
         logger.debug(f"Prompt: {prompt}")
         
         chain = prompt | self.llm_cheap | StrOutputParser()
@@ -133,7 +133,7 @@ class LLMResumer:
         work_experience_prompt_template = self._preprocess_template_string(self.strings.prompt_working_experience)
         logger.debug(f"Work experience template: {work_experience_prompt_template}")
 
-        prompt = ChatPromptTemplate.from_template(work_experience_prompt_template)
+        prompt = chat_prompt_from_template(work_experience_prompt_template)
         logger.debug(f"Prompt: {prompt}")
         
         chain = prompt | self.llm_cheap | StrOutputParser()
@@ -161,7 +161,7 @@ class LLMResumer:
         projects_prompt_template = self._preprocess_template_string(self.strings.prompt_projects)
         logger.debug(f"Side projects template: {projects_prompt_template}")
 
-        prompt = ChatPromptTemplate.from_template(projects_prompt_template)
+        prompt = chat_prompt_from_template(projects_prompt_template)
         logger.debug(f"Prompt: {prompt}")
         
         chain = prompt | self.llm_cheap | StrOutputParser()
@@ -189,7 +189,7 @@ class LLMResumer:
         achievements_prompt_template = self._preprocess_template_string(self.strings.prompt_achievements)
         logger.debug(f"Achievements template: {achievements_prompt_template}")
 
-        prompt = ChatPromptTemplate.from_template(achievements_prompt_template)
+        prompt = chat_prompt_from_template(achievements_prompt_template)
         logger.debug(f"Prompt: {prompt}")
 
         chain = prompt | self.llm_cheap | StrOutputParser()
@@ -218,7 +218,7 @@ class LLMResumer:
         certifications_prompt_template = self._preprocess_template_string(self.strings.prompt_certifications)
         logger.debug(f"Certifications template: {certifications_prompt_template}")
 
-        prompt = ChatPromptTemplate.from_template(certifications_prompt_template)
+        prompt = chat_prompt_from_template(certifications_prompt_template)
         logger.debug(f"Prompt: {prompt}")
 
         chain = prompt | self.llm_cheap | StrOutputParser()
@@ -244,17 +244,16 @@ class LLMResumer:
         additional_skills_prompt_template = self._preprocess_template_string(self.strings.prompt_additional_skills)
         
         skills = set()
-        if self.resume.experience_details:
-            for exp in self.resume.experience_details:
-                if exp.skills_acquired:
-                    skills.update(exp.skills_acquired)
+        for skills_acquired in self.resume.experience_column('skills_acquired'):
+            if skills_acquired:
+                skills.update(skills_acquired)
 
         if self.resume.education_details:
             for edu in self.resume.education_details:
                 if edu.exam:
                     for exam in edu.exam:
                         skills.update(exam.keys())
-        prompt = ChatPromptTemplate.from_template(additional_skills_prompt_template)
+        prompt = chat_prompt_from_template(additional_skills_prompt_template)
         chain = prompt | self.llm_cheap | StrOutputParser()
         input_data = {
             "languages": self.resume.languages,
@@ -6,7 +6,7 @@ import os
 from src.libs.resume_and_cover_builder.llm.llm_generate_resume import LLMResumer
 from src.libs.resume_and_cover_builder.utils import LoggerChatModel
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate
+from src.libs.resume_and_cover_builder.llm.prompts import chat_prompt_from_template
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
 from loguru import logger
@@ -31,7 +31,7 @@ class LLMResumeJobDescription(LLMResumer):
         Args:
             job_description_text (str): The plain text job description to be used.
         """
-        prompt = ChatPromptTemplate.from_template(self.strings.summarize_prompt_template)
+        prompt = chat_prompt_from_template(self.strings.summarize_prompt_template)
         chain = prompt | self.llm_cheap | StrOutputParser()
         output = chain.invoke({"text": job_description_text})
         self.job_description = output
@@ -113,17 +113,16 @@ class LLMResumeJobDescription(LLMResumer):
             self.strings.prompt_additional_skills
         )
         skills = set()
-        if self.resume.experience_details:
-            for exp in self.resume.experience_details:
-                if exp.skills_acquired:
-                    skills.update(exp.skills_acquired)
+        for skills_acquired in self.resume.experience_column('skills_acquired'):
+            if skills_acquired:
+                skills.update(skills_acquired)
 
         if self.resume.education_details:
             for edu in self.resume.education_details:
                 if edu.exam:
                     for exam in edu.exam:
                         skills.update(exam.keys())
-        prompt = ChatPromptTemplate.from_template(additional_skills_prompt_template)
+        prompt = chat_prompt_from_template(additional_skills_prompt_template)
         chain = prompt | self.llm_cheap | StrOutputParser()
         output = chain.invoke({
             "languages": self.resume.languages,
@@ -1,7 +1,14 @@
+import copy
+import hashlib
+import html
+import importlib.util
+import json
 import os
 import tempfile
 import textwrap
+import threading
 import time
+from functools import cached_property
 import re  # For email validation
 from src.libs.resume_and_cover_builder.utils import LoggerChatModel
 from langchain_core.output_parsers import StrOutputParser
@@ -11,11 +18,17 @@ from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from loguru import logger
 from pathlib import Path
+from urllib.parse import urlsplit
 from langchain_core.prompt_values import StringPromptValue
 from langchain_core.runnables import RunnablePassthrough
 from langchain_text_splitters import TokenTextSplitter
 from langchain_community.embeddings import OpenAIEmbeddings, OllamaEmbeddings
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.faiss import dependable_faiss_import
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_core.documents import Document
+from langchain_core.messages import HumanMessage, SystemMessage
+import numpy as np
 from src.libs.resume_and_cover_builder.config import global_config
 from langchain_community.document_loaders import TextLoader
 from requests.exceptions import HTTPError as HTTPStatusError  # HTTP error handling
@@ -33,15 +46,19 @@ from langchain.prompts import (
     SystemMessagePromptTemplate,
 )
 from langchain_community.document_loaders import SeleniumURLLoader, WebBaseLoader
+from src.libs.resume_and_cover_builder.llm.cache import PROMPT_VERSION, check_cache, make_input_hash, save_to_cache
 from src.libs.resume_and_cover_builder.llm.prompts import (
     LINKEDIN_SYSTEM_PROMPT,
     JOB_INFORMATION_EXTRACTION_PROMPT,
-    SKILL_MATCHING_PROMPT
+    SKILL_MATCHING_PROMPT,
+    JOB_FIELDS_EXTRACTION_PROMPT,
+    render_prompt
 )
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+import soupsieve
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
-from src.utils.chrome_utils import browser_manager
+from src.utils.chrome_utils import browser_manager, browser_pool
 
 # Load environment variables from the .env file
 load_dotenv()
@@ -53,6 +70,479 @@ if not os.path.exists(log_folder):
 log_path = Path(log_folder).resolve()
 logger.add(log_path / "gpt_resume.log", rotation="1 day", compression="zip", retention="7 days", level="DEBUG")
 
+# 优先使用基于libxml2的lxml解析HTML，未安装时回退到纯Python的html.parser
+if importlib.util.find_spec("lxml") is not None:
+    HTML_PARSER = "lxml"
+else:
+    logger.warning("未安装lxml，使用html.parser解析HTML，可运行: pip install lxml")
+    HTML_PARSER = "html.parser"
+
+# 优先用orjson解析LLM返回的JSON，未安装时使用标准库json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 不需要DOM的页面优先用selectolax(Lexbor)提取正文，未安装时用正则去标签
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    logger.debug("未安装selectolax，使用正则提取页面正文，可运行: pip install selectolax")
+    LexborHTMLParser = None
+
+# 正则去标签：先去掉脚本、样式和注释，再把标签替换为换行
+_HTML_NON_TEXT_PATTERN = re.compile(r'<(script|style|noscript)\b[^>]*>.*?</\1\s*>|<!--.*?-->', re.DOTALL | re.IGNORECASE)
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def _html_to_text(html_content: str) -> str:
+    """不构建BeautifulSoup DOM，从HTML中提取正文，每行去除首尾空白并丢弃空行"""
+    text = None
+    if LexborHTMLParser is not None:
+        try:
+            tree = LexborHTMLParser(html_content)
+            tree.strip_tags(["script", "style", "noscript"])
+            root = tree.body or tree.root
+            text = root.text(separator='\n') if root is not None else ""
+        except Exception as e:
+            logger.warning(f"selectolax提取正文失败，改用正则: {str(e)}")
+            text = None
+    if text is None:
+        text = html.unescape(_HTML_TAG_PATTERN.sub('\n', _HTML_NON_TEXT_PATTERN.sub('', html_content)))
+    return '\n'.join(line for line in map(str.strip, text.splitlines()) if line)
+
+
+# 信息提取使用的聊天模板，模块加载时构建一次，避免每次提取重复解析模板
+EXTRACTION_CHAT_PROMPT = ChatPromptTemplate.from_messages([
+    SystemMessagePromptTemplate.from_template(LINKEDIN_SYSTEM_PROMPT),
+    HumanMessagePromptTemplate.from_template(
+        """
+        从以下职位描述中提取信息，回答问题：
+        
+        职位描述内容:
+        {context}
+        
+        问题: {question}
+        
+        请只回答问题，不要添加解释或多余的信息。
+        如果信息不在上下文中，请回答"未提供"。
+        """
+    )
+])
+
+# 正文文本短于该长度时直接把全文作为上下文，跳过嵌入和向量检索
+FULL_CONTEXT_TEXT_LIMIT = 8000
+
+# 进程级的文本片段向量缓存，键为 (模型类型, 模型名称, 片段哈希)。
+# 同一进程解析多个职位时，页眉页脚等重复片段无需再次嵌入
+FRAGMENT_EMBEDDING_CACHE_SIZE = 5000
+_fragment_embedding_cache: Dict[tuple, List[float]] = {}
+_fragment_embedding_lock = threading.Lock()
+
+# 多字段合并提取使用的聊天模板
+JOB_FIELDS_CHAT_PROMPT = ChatPromptTemplate.from_messages([
+    SystemMessagePromptTemplate.from_template(LINKEDIN_SYSTEM_PROMPT),
+    HumanMessagePromptTemplate.from_template(JOB_FIELDS_EXTRACTION_PROMPT)
+])
+
+# 职位字段 -> (字段说明, 检索查询, 单独提取时的问题)
+JOB_FIELDS = {
+    "company": ("公司名称", "Company name", "What is the company's name?"),
+    "title": ("职位名称", "Job title", "What is the role or title sought in this job description?"),
+    "location": ("工作地点", "Location", "What is the location mentioned in this job description?"),
+    "description": ("职位描述", "Job description", "What is the job description of the company?"),
+    "recruiter": ("招聘人员或招聘经理及其联系方式", "Recruiter or hiring manager",
+                  "Who is the recruiter or hiring manager for this position? Extract any contact information."),
+    "requirements": ("岗位要求，包括必备技能和经验、教育背景、软技能，分点列出", "Job requirements",
+                     "What are the key requirements of this job, including required skills, experience, education and soft skills?"),
+    "recruiter_email": ("招聘人员的电子邮箱地址", "Recruiter email",
+                        "What is the recruiter's email address in this job description?"),
+}
+
+# 提取岗位要求时送入LLM的正文最大长度，以及用于逐词压缩空白的正则
+REQUIREMENTS_TEXT_LIMIT = 4000
+# 岗位要求只需一个简短列表：限制生成长度，并在出现连续空行或模型复述原文时提前停止
+REQUIREMENTS_MAX_TOKENS = 300
+REQUIREMENTS_STOP_SEQUENCES = ["\n\n\n", "职位描述:"]
+# 正文过短或是登录页、404页时不调用LLM提取岗位要求。
+# 正常职位页面也常带有"Sign in"之类的导航文字，所以只对较短的页面检查这些特征
+REQUIREMENTS_MIN_TEXT_LENGTH = 200
+BOILERPLATE_PAGE_MAX_LENGTH = 1500
+_BOILERPLATE_PAGE_PATTERN = re.compile(
+    r'sign in to linkedin|join linkedin|page not found|\b404\b|请登录|登录后查看|页面不存在', re.IGNORECASE
+)
+# 摘要最终截断到200字符，约合120个令牌，多生成的部分只会被丢弃
+SUMMARY_MAX_TOKENS = 120
+_NON_WHITESPACE_PATTERN = re.compile(r'\S+')
+
+# 职位分析类生成任务共用的系统提示词及其LangChain格式的系统消息
+JOB_ANALYST_SYSTEM_PROMPT = "你是一位专业的职位分析专家，擅长提取和总结职位信息。请提供简洁、准确和有用的回答。"
+JOB_ANALYST_SYSTEM_CHAT_MESSAGE = SystemMessage(content=JOB_ANALYST_SYSTEM_PROMPT)
+
+# 各模型类型把通用的生成参数转换为langchain模型调用参数，所有提供商都通过self.llm调用。
+# Ollama创建时已设置停止序列，调用时再传stop会报错，所以只使用模型自身的停止序列
+_GENERATION_KWARGS = {
+    "openai": lambda max_tokens, temperature, stop: {
+        "max_tokens": max_tokens, "temperature": temperature, "stop": stop,
+    },
+    "gemini": lambda max_tokens, temperature, stop: {
+        "generation_config": {"max_output_tokens": max_tokens, "temperature": temperature}, "stop": stop,
+    },
+    "ollama": lambda max_tokens, temperature, stop: {
+        "num_predict": max_tokens, "temperature": temperature,
+    },
+}
+
+# 合并提取缺失字段时，并发单独提取的最大线程数
+FIELD_EXTRACTION_MAX_WORKERS = 3
+
+# 从LLM响应中截取JSON对象
+_JSON_OBJECT_PATTERN = re.compile(r'\{.*\}', re.DOTALL)
+
+# 以下正则在模块加载时预编译，避免每次调用时重复查找编译缓存
+# LLM输出中的思考标记（包括未闭合的标记）
+_THINK_PATTERN = re.compile(r'<think>.*?</think>|<think>.*', re.DOTALL)
+_EMAIL_PATTERN = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_JOB_ID_PATTERN = re.compile(r'view/(\d+)')
+_MATCH_SCORE_PATTERN = re.compile(r'(\d+)%')
+# 技能匹配分析响应的逐行分类：各部分标题（以序号开头或包含标题关键词，按优先级排列）、列表项和普通文本
+_SKILL_RESPONSE_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?P<required_skills>1\.|[^\n]*?关键技能)"
+    r"|(?P<matching_skills>2\.|[^\n]*?匹配技能)"
+    r"|(?P<missing_skills>3\.|[^\n]*?缺少的技能)"
+    r"|(?P<match_score>4\.|[^\n]*?匹配度评分)"
+    r"|(?P<recommendations>[56]\.|[^\n]*?建议)"
+    r"|(?P<bullet>-)"
+    r"|(?P<text>\S)"
+    r")[^\n]*",
+    re.MULTILINE,
+)
+_MULTI_NEWLINE_PATTERN = re.compile(r'\n+')
+_SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+
+def _truncate_sentences(text: str, limit: int) -> str:
+    """
+    按完整句子截断文本，句子间按一个空格计长度，保留的句子总长不超过limit
+    
+    只扫描一遍句子分隔符并记录截断位置，不构建句子列表，也不反复拼接字符串。
+    """
+    kept_end = 0
+    length = 0
+    start = 0
+    for separator in _SENTENCE_SPLIT_PATTERN.finditer(text):
+        length += separator.start() - start
+        if length > limit:
+            break
+        kept_end = separator.start()
+        length += 1
+        start = separator.end()
+    else:
+        # 最后一句之后没有分隔符
+        if length + len(text) - start <= limit:
+            kept_end = len(text)
+    return text[:kept_end].strip()
+
+# 提取结果中常见的回答前缀
+_COMMON_PREFIX_PATTERNS = tuple(re.compile(prefix, re.IGNORECASE) for prefix in (
+    r"^The company(?:'s)? name is ",
+    r"^The company is ",
+    r"^The job title is ",
+    r"^The role is ",
+    r"^The position is ",
+    r"^The location is ",
+    r"^The job description is ",
+    r"^公司名称[是为：:]\s*",
+    r"^公司[是为：:]\s*",
+    r"^职位名称[是为：:]\s*",
+    r"^职位[是为：:]\s*",
+    r"^地点[是为：:]\s*",
+    r"^职位描述[是为：:]\s*",
+))
+# 上述前缀可能的首字符，首字符不在其中时可跳过全部前缀正则
+_PREFIX_FIRST_CHARS = frozenset("Tt公职地")
+# 需要清理的字符（标签起始和常见空白），回答中不含这些字符且首字符不是前缀首字符时可原样返回
+_CLEAN_TRIGGER_CHARS = frozenset("< \t\n\r\f\v\xa0\u3000")
+
+# 表示未找到信息的回答（小写），清理后命中其中之一时视为"未提供"
+_NOT_FOUND = frozenset({"none", "unknown", "not found", "not provided", "未找到", "未知", "无"})
+
+# 从职位描述正文中识别职位名称的陈述，例如"We are looking for a Software Engineer..."
+_JOB_TITLE_STATEMENT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"(?:looking for|hiring|seeking) (?:an?|the) ([A-Za-z\s]+?)(?: to | who |[,\.])",
+    r"(?:开放|招聘|寻找|诚聘)(?:一名|一位|)[（(]?([^，,：:()（）]{2,30})[)）]?(?:岗位|职位)?",
+))
+
+# 页面文本中的招聘人员信息
+_RECRUITER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"(?:recruiter|hiring manager|contact)(?:\s*:|\s+is|\s+at)\s+([A-Za-z\s\.]+)",
+    r"(?:招聘人员|招聘经理|联系人)(?:\s*:|\s+是|\s+为)?\s+([^\n,，.。]{2,30})",
+))
+
+# 职位要求部分的标题
+_REQUIREMENT_HEADER_PATTERN = re.compile(r'(requirements|qualifications|skills|要求|资格|技能)', re.IGNORECASE)
+
+# 职位描述正文中的职位要求段落。段落正文逐字符惰性匹配（不跨越空行），遇到空行、文本结尾或
+# 停止标题（包括出现在行中间的）即结束；列表项正文的字符类不含换行，无法回溯进下一项。
+# 两者都不使用嵌套量词，避免在不匹配的长文本上产生指数级回溯（不使用仅3.11+支持的占有量词）
+_REQUIREMENT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    r"(?:Requirements|Qualifications|Skills Required|What You Need|Required Skills|Experience)\s*[:\-–]?\s*([^\n](?:[^\n]|\n(?!\n))*?)(?:\n\n|\Z|Responsibilities|About Us|Benefits|How to Apply)",
+    r"(?:要求|资格要求|技能要求|所需技能|资质要求|经验要求|岗位要求)\s*[:：\-–]?\s*([^\n](?:[^\n]|\n(?!\n))*?)(?:\n\n|\Z|职责|岗位职责|工作职责|关于我们|公司介绍|福利待遇|如何申请)",
+    # 更通用的模式，尝试捕获位于段落中的要求
+    r"(?:required skills|requirements|qualifications)[\s\S]{0,20}?(?:include|are|:)[\s\S]{0,10}((?:\s*(?:[-•*]|\d+\.|[A-Za-z0-9]+\))[\w \t,.]+(?:\n|$))+)",
+    r"(?:技能要求|岗位要求|资格要求)[\s\S]{0,20}?(?:包括|是|：|:)[\s\S]{0,10}((?:\s*(?:[-•*]|\d+\.|[A-Za-z0-9]+\))[\w \t,.]+(?:\n|$))+)",
+))
+
+# LinkedIn职位详情中各部分小标题可能包含的关键词
+SECTION_HEADING_KEYWORDS = {
+    # 职责部分可能的标题关键词
+    "responsibilities": [
+        "responsibilities", "role responsibilities", "job responsibilities", 
+        "duties", "what you'll do", "职责", "工作职责", "岗位职责", "你将要做什么"
+    ],
+    # 要求部分可能的标题关键词
+    "requirements": [
+        "requirements", "qualifications", "skills", "experience", "what you need", 
+        "what we're looking for", "required skills", "要求", "资格", "技能", 
+        "经验", "我们在寻找", "必备技能"
+    ],
+    # 福利部分可能的标题关键词
+    "benefits": [
+        "benefits", "perks", "what we offer", "compensation", "salary", 
+        "package", "福利", "薪资", "待遇", "我们提供"
+    ],
+    # 公司介绍部分可能的标题关键词
+    "company_info": [
+        "about us", "company", "who we are", "our team", "团队介绍", 
+        "公司介绍", "关于我们", "我们是谁"
+    ]
+}
+# 每个部分的关键词合并为一个正则，标题文本只需扫描一次
+_SECTION_HEADING_PATTERNS = {
+    section_key: re.compile("|".join(map(re.escape, keywords)))
+    for section_key, keywords in SECTION_HEADING_KEYWORDS.items()
+}
+
+# 无法识别结构时，用于从职位描述全文中启发式识别各部分：
+# 各部分的小标题关键词，以及表示该部分结束的下一个小标题关键词
+SECTION_TEXT_KEYWORDS = {
+    "responsibilities": (
+        "职责|工作职责|岗位职责|责任|Responsibilities|Duties|What You['’]ll Do",
+        "要求|资格|技能|经验|福利|薪资|待遇|公司介绍|关于我们|Requirements|Qualifications|Skills|Experience|Benefits|About Us",
+    ),
+    "requirements": (
+        "要求|资格|技能|经验|Requirements|Qualifications|Skills|Experience",
+        "职责|工作职责|岗位职责|责任|福利|薪资|待遇|公司介绍|关于我们|Responsibilities|Duties|Benefits|About Us",
+    ),
+    "benefits": (
+        "福利|薪资|待遇|Benefits|Perks|What We Offer|Compensation",
+        "职责|工作职责|岗位职责|责任|要求|资格|技能|经验|公司介绍|关于我们|Responsibilities|Duties|Requirements|Qualifications|About Us",
+    ),
+    "company_info": (
+        "公司介绍|关于我们|About Us|Company|Who We Are",
+        "职责|工作职责|岗位职责|责任|要求|资格|技能|经验|福利|薪资|待遇|Responsibilities|Duties|Requirements|Qualifications|Benefits",
+    ),
+}
+# 所有小标题合并为一个正则，命名分组即部分名称；每个部分的结束标题单独编译
+_SECTION_TEXT_HEADER_PATTERN = re.compile(
+    "(?:" + "|".join(f"(?P<{key}>{heads})" for key, (heads, _) in SECTION_TEXT_KEYWORDS.items()) + r")[：:]\s*",
+    re.IGNORECASE,
+)
+_SECTION_TEXT_END_PATTERNS = {
+    key: re.compile(f"(?:{ends})[：:]", re.IGNORECASE)
+    for key, (_, ends) in SECTION_TEXT_KEYWORDS.items()
+}
+
+
+def _split_text_sections(text: str) -> Dict[str, str]:
+    """
+    按小标题把职位描述全文切分为各部分
+
+    只在小标题和结束标题之间跳转，每个字符最多被扫描一次，
+    不需要在正文的每个位置上尝试结束标题的前瞻匹配。
+
+    Args:
+        text: 职位描述全文
+
+    Returns:
+        Dict[str, str]: 部分名称 -> 内容，每个部分只保留第一次出现的非空内容
+    """
+    sections = {}
+    pos = 0
+    while True:
+        header = _SECTION_TEXT_HEADER_PATTERN.search(text, pos)
+        if not header:
+            break
+        section_key = header.lastgroup
+        body_start = header.end()
+        if body_start >= len(text):
+            break
+        # 正文至少包含一个字符，结束标题从下一个位置开始查找
+        end = _SECTION_TEXT_END_PATTERNS[section_key].search(text, body_start + 1)
+        body_end = end.start() if end else len(text)
+        content = text[body_start:body_end].strip()
+        if content and section_key not in sections:
+            sections[section_key] = content
+        pos = body_end
+    return sections
+
+# 判断页面是否为职位详情页的关键词，合并为一个不区分大小写的正则，一次扫描完成匹配
+JOB_PAGE_INDICATORS = ("job-details", "职位详情", "工作职责", "要求", "岗位职责",
+                       "job description", "responsibilities", "requirements")
+_JOB_PAGE_INDICATOR_PATTERN = re.compile("|".join(map(re.escape, JOB_PAGE_INDICATORS)), re.IGNORECASE)
+
+# 位置关键词（按优先级排列），合并正则用于单次遍历DOM，单独的正则用于按优先级筛选
+LOCATION_KEYWORDS = ('remote', '远程', 'hybrid', '混合', 'onsite', '现场', 'in-office', '办公室')
+_LOCATION_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, LOCATION_KEYWORDS)), re.IGNORECASE)
+_LOCATION_KEYWORD_PATTERNS = tuple(re.compile(re.escape(keyword), re.IGNORECASE) for keyword in LOCATION_KEYWORDS)
+
+# 从HTML元数据中提取各类信息时使用的候选选择器，按优先级排列
+METADATA_SELECTORS = {
+    "company name": (
+        ".job-details-jobs-unified-top-card__company-name",  # 职位卡片中的公司名称
+        ".jobs-unified-top-card__company-name",              # 旧版职位卡片
+        ".jobs-company__name",                               # 公司名称组件
+        ".company-name",                                     # 通用公司名类
+        ".topcard__org-name-link",                           # 顶部卡片中的公司名链接
+        "a[data-tracking-control-name='public_jobs_topcard-org-name']",  # 公司链接
+        "meta[property='og:site_name']",                     # Open Graph 站点名称
+    ),
+    "job title": (
+        ".job-details-jobs-unified-top-card__job-title",     # 职位顶部卡片标题
+        ".t-24.job-details-jobs-unified-top-card__job-title", # 带样式的职位标题
+        ".jobs-unified-top-card__job-title",                 # 旧版职位标题
+        ".topcard__title",                                   # 经典页面顶部卡片标题
+        "h1.job-title",                                      # H1标题的职位
+        "title",                                             # 页面标题
+        "meta[property='og:title']",                         # Open Graph 标题
+    ),
+    "job description": (
+        "#job-details",                              # 主职位详情ID
+        ".jobs-description-content__text",           # 新版职位描述内容
+        ".jobs-description__content",                # 职位描述内容
+        ".jobs-box__html-content",                   # LinkedIn描述HTML内容
+        ".description-section",                      # 描述部分
+        ".description",                              # 通用描述类
+    ),
+    "location": (
+        ".job-details-jobs-unified-top-card__job-insight span:not(.job-details-jobs-unified-top-card__job-insight-view-model-secondary)",
+        ".jobs-unified-top-card__bullet",            # 职位卡片中的项目符号（通常是位置）
+        ".jobs-unified-top-card__workplace-type",    # 工作地点类型
+        ".topcard__flavor--bullet",                  # 经典页面的项目符号（位置）
+        ".location",                                 # 通用位置类
+        "meta[property='og:location']",              # 位置元数据
+    ),
+}
+
+# 预编译选择器：每类信息一个合并选择器用于单次遍历，另保留各自的选择器用于判断优先级
+_COMPILED_METADATA_SELECTORS = {
+    info_type: (
+        soupsieve.compile(", ".join(selectors)),
+        tuple(soupsieve.compile(selector) for selector in selectors),
+    )
+    for info_type, selectors in METADATA_SELECTORS.items()
+}
+
+
+def _select_first_by_priority(soup, info_type: str) -> List[tuple]:
+    """
+    一次遍历DOM，找出每个候选选择器命中的第一个元素
+
+    Args:
+        soup: BeautifulSoup对象
+        info_type: METADATA_SELECTORS中的信息类型
+
+    Returns:
+        List[tuple]: 按选择器优先级排列的 (选择器, 元素) 列表
+    """
+    union, compiled = _COMPILED_METADATA_SELECTORS[info_type]
+    first_matches = [None] * len(compiled)
+    remaining = len(compiled)
+    for element in union.select(soup):
+        for rank, selector in enumerate(compiled):
+            if first_matches[rank] is None and selector.match(element):
+                first_matches[rank] = element
+                remaining -= 1
+        if not remaining:
+            break
+    selectors = METADATA_SELECTORS[info_type]
+    return [(selectors[rank], element) for rank, element in enumerate(first_matches) if element is not None]
+
+
+# LinkedIn职位页面中需要定位的class/id到字段桶的映射
+_LINKEDIN_ELEMENT_CLASSES = {
+    "job-details-jobs-unified-top-card__job-title": "job_title",
+    "job-details-jobs-unified-top-card__company-name": "company_name",
+    "job-details-jobs-unified-top-card__job-insight": "job_insight",
+    "jobs-description-content__text--stretch": "description_stretch",
+    "jobs-description__content": "description_content",
+    "job-card-job-posting-card-wrapper": "job_cards",
+}
+_LINKEDIN_ELEMENT_IDS = {
+    "job-details": "job_details",
+}
+# Caterpillar页面中标识职位描述段落的关键词，以及作为段落的标签
+_CATERPILLAR_KEYWORD_PATTERN = re.compile(
+    "职位描述|工作职责|岗位要求|job description|responsibilities|requirements|qualifications", re.IGNORECASE
+)
+_CATERPILLAR_PARAGRAPH_TAGS = frozenset({'p', 'div', 'li', 'span'})
+
+# URL中常见的不代表公司名称的域名部分
+_COMMON_DOMAINS = frozenset({'careers', 'jobs', 'career', 'job', 'work', 'apply'})
+
+# 相似职位卡片内各字段的class
+_JOB_CARD_FIELD_CLASSES = {
+    "job-card-job-posting-card-wrapper__title": "title",
+    "job-card-job-posting-card-wrapper__entity-lockup": "company",
+    "job-card-job-posting-card-wrapper__footer-item": "location",
+}
+
+
+def _index_linkedin_elements(soup) -> Dict[str, List]:
+    """
+    一次遍历DOM，按class/id把LinkedIn页面关心的元素归入各字段桶
+
+    Args:
+        soup: BeautifulSoup对象
+
+    Returns:
+        Dict[str, List]: 字段桶名 -> 按文档顺序排列的元素列表
+    """
+    buckets = {}
+    for element in soup.find_all(True):
+        bucket = _LINKEDIN_ELEMENT_IDS.get(element.get("id"))
+        if bucket:
+            buckets.setdefault(bucket, []).append(element)
+        for class_name in element.get("class") or ():
+            bucket = _LINKEDIN_ELEMENT_CLASSES.get(class_name)
+            if bucket:
+                buckets.setdefault(bucket, []).append(element)
+    return buckets
+
+
+# 进程内共享的模型客户端：相同配置的解析器复用同一个客户端，从而复用其HTTP连接池和keep-alive连接
+_model_clients = {}
+_model_clients_lock = threading.Lock()
+
+
+def _get_shared_client(key: tuple, factory):
+    """
+    获取共享的模型客户端，不存在时调用factory创建
+
+    Args:
+        key: 客户端配置，如 (用途, 模型类型, 模型名称, API密钥)
+        factory: 创建客户端的函数，返回值可以为None
+
+    Returns:
+        共享的客户端
+    """
+    with _model_clients_lock:
+        if key not in _model_clients:
+            _model_clients[key] = factory()
+        return _model_clients[key]
+
 
 class LLMParser:
     """LLM解析器类，用于从职位描述中提取信息"""
@@ -61,6 +551,8 @@ class LLMParser:
         """
         初始化LLMParser
         
+        模型和嵌入模型在首次使用时才创建，见llm和embeddings属性。
+        
         Args:
             api_key: API密钥
             model_type: 模型类型，"openai"、"ollama"或"gemini"
@@ -72,22 +564,42 @@ class LLMParser:
         self.body_html = None
         self.vectorstore = None  # 初始化 vectorstore
         self.fragments = []  # 初始化 fragments 列表
-        self.embeddings = None  # 初始化 embeddings
-        self.llm = None  # 初始化 llm
+        self._full_text = None  # 短页面的完整正文，设置后检索直接返回全文
+        self._soup = None  # 当前页面解析后的BeautifulSoup对象
+        self._query_embeddings = {}  # 检索查询的向量缓存
+        self._body_hash = None  # 当前页面HTML的哈希，用于识别重复设置的同一页面
+        self._extraction_cache = {}  # 当前页面的LLM提取结果，键为 (question, retrieval_query)
+        self._linkedin_sections = None  # 当前页面的LinkedIn结构化部分
+        self._page_text = ""  # 当前页面的正文文本
         
         logger.info(f"初始化LLMParser，模型类型: {self.model_type}，模型: {self.model_name}")
         
-        # 根据模型类型初始化不同的模型
+        if self.model_type == "openai":
+            if not api_key:
+                raise ValueError("使用OpenAI模型需要提供API密钥")
+        elif self.model_type == "gemini":
+            if not api_key:
+                raise ValueError("使用Gemini模型需要提供Google API密钥")
+        elif self.model_type != "ollama":
+            raise ValueError(f"不支持的模型类型: {self.model_type}")
+    
+    @cached_property
+    def llm(self):
+        """LLM客户端，首次访问时获取，相同配置的解析器共享同一个客户端"""
+        return _get_shared_client(("llm", self.model_type, self.model_name, self.api_key), self._create_llm)
+    
+    @cached_property
+    def embeddings(self):
+        """嵌入模型，首次访问时获取，相同配置的解析器共享；没有可用的嵌入模型时为None"""
+        return _get_shared_client(("embeddings", self.model_type, self.model_name, self.api_key), self._create_embeddings)
+    
+    def _create_llm(self):
+        """根据模型类型创建LLM"""
         if self.model_type == "ollama":
             logger.info("使用Ollama模型")
             # 使用完整的模型名称
             logger.info(f"Ollama模型名称: {self.model_name}")
-            
-            self.embeddings = OllamaEmbeddings(
-                base_url="http://localhost:11434",
-                model=self.model_name
-            )
-            self.llm = Ollama(
+            return Ollama(
                 base_url="http://localhost:11434",
                 model=self.model_name,
                 temperature=0.7,
@@ -98,65 +610,83 @@ class LLMParser:
                 repeat_penalty=1.1,
                 stop=["<|im_end|>", "</answer>"]
             )
-        elif self.model_type == "openai":
+        if self.model_type == "openai":
             logger.info("使用OpenAI模型")
-            if not api_key:
-                raise ValueError("使用OpenAI模型需要提供API密钥")
-            self.embeddings = OpenAIEmbeddings(openai_api_key=self.api_key)
-            self.llm = ChatOpenAI(
+            return ChatOpenAI(
                 openai_api_key=self.api_key,
                 model=self.model_name,
                 temperature=0.5
             )
-        elif self.model_type == "gemini":
-            logger.info("使用Gemini模型")
-            try:
-                # 尝试导入Gemini相关库
-                from langchain_google_genai import ChatGoogleGenerativeAI
-                
-                if not api_key:
-                    raise ValueError("使用Gemini模型需要提供Google API密钥")
-                
-                # 配置HTTP选项（代理设置）
-                http_options = {}
-                if global_config.PROXY_ENABLED and (global_config.PROXY_HTTP or global_config.PROXY_HTTPS):
-                    http_options["proxy"] = {
-                        "http": global_config.PROXY_HTTP,
-                        "https": global_config.PROXY_HTTPS,
-                    }
-                    logger.info("已为Gemini API配置代理设置")
-                
-                # 使用Gemini模型
-                self.llm = ChatGoogleGenerativeAI(
-                    model=self.model_name,
-                    google_api_key=self.api_key,
-                    temperature=0.7,
-                    convert_system_message_to_human=True,
-                    http_options=http_options
-                )
-                
-                # 暂时使用OpenAI的嵌入模型（可以后续改为使用Gemini的嵌入模型）
-                try:
-                    from langchain_google_genai import GoogleGenerativeAIEmbeddings
-                    self.embeddings = GoogleGenerativeAIEmbeddings(
-                        model="models/embedding-001",
-                        google_api_key=self.api_key,
-                        http_options=http_options
-                    )
-                    logger.info("使用Google嵌入模型")
-                except ImportError:
-                    logger.warning("无法导入GoogleGenerativeAIEmbeddings，使用OpenAI嵌入模型")
-                    if api_key:
-                        self.embeddings = OpenAIEmbeddings(openai_api_key=global_config.OPENAI_API_KEY)
-                    else:
-                        logger.warning("没有可用的嵌入模型")
-                        self.embeddings = None
-                
-            except ImportError:
-                logger.error("未安装Gemini库，请运行: pip install langchain-google-genai google-generativeai")
-                raise ValueError("未安装Gemini库，请运行: pip install langchain-google-genai google-generativeai")
-        else:
-            raise ValueError(f"不支持的模型类型: {self.model_type}")
+        
+        logger.info("使用Gemini模型")
+        try:
+            # 尝试导入Gemini相关库
+            from langchain_google_genai import ChatGoogleGenerativeAI
+        except ImportError:
+            logger.error("未安装Gemini库，请运行: pip install langchain-google-genai google-generativeai")
+            raise ValueError("未安装Gemini库，请运行: pip install langchain-google-genai google-generativeai")
+        
+        # 使用Gemini模型
+        return ChatGoogleGenerativeAI(
+            model=self.model_name,
+            google_api_key=self.api_key,
+            temperature=0.7,
+            convert_system_message_to_human=True,
+            http_options=self._gemini_http_options()
+        )
+    
+    def _create_embeddings(self):
+        """根据模型类型创建嵌入模型，没有可用的嵌入模型时返回None"""
+        if self.model_type == "ollama":
+            return OllamaEmbeddings(
+                base_url="http://localhost:11434",
+                model=self.model_name
+            )
+        if self.model_type == "openai":
+            return OpenAIEmbeddings(openai_api_key=self.api_key)
+        
+        # 暂时使用OpenAI的嵌入模型（可以后续改为使用Gemini的嵌入模型）
+        try:
+            from langchain_google_genai import GoogleGenerativeAIEmbeddings
+            embeddings = GoogleGenerativeAIEmbeddings(
+                model="models/embedding-001",
+                google_api_key=self.api_key,
+                http_options=self._gemini_http_options()
+            )
+            logger.info("使用Google嵌入模型")
+            return embeddings
+        except ImportError:
+            logger.warning("无法导入GoogleGenerativeAIEmbeddings，使用OpenAI嵌入模型")
+            if self.api_key:
+                return OpenAIEmbeddings(openai_api_key=global_config.OPENAI_API_KEY)
+            logger.warning("没有可用的嵌入模型")
+            return None
+    
+    @cached_property
+    def _extraction_chain(self):
+        """非Ollama模型预先组装的单字段提取链"""
+        if self.model_type == "ollama":
+            return None
+        return EXTRACTION_CHAT_PROMPT | self.llm | StrOutputParser()
+    
+    @cached_property
+    def _fields_chain(self):
+        """非Ollama模型预先组装的多字段提取链"""
+        if self.model_type == "ollama":
+            return None
+        return JOB_FIELDS_CHAT_PROMPT | self.llm | StrOutputParser()
+    
+    @staticmethod
+    def _gemini_http_options() -> Dict[str, Any]:
+        """配置Gemini的HTTP选项（代理设置）"""
+        http_options = {}
+        if global_config.PROXY_ENABLED and (global_config.PROXY_HTTP or global_config.PROXY_HTTPS):
+            http_options["proxy"] = {
+                "http": global_config.PROXY_HTTP,
+                "https": global_config.PROXY_HTTPS,
+            }
+            logger.info("已为Gemini API配置代理设置")
+        return http_options
     
     def parse_job(self, job_url: str) -> Dict[str, Any]:
         """
@@ -166,7 +696,8 @@ class LLMParser:
             job_url: 工作详情页URL
             
         Returns:
-            Dict[str, Any]: 包含职位结构化信息的字典
+            Dict[str, Any]: 包含职位结构化信息的字典；页面获取或解析失败时返回模拟数据，
+                其中is_mock为True
         """
         try:
             logger.info(f"开始解析职位页面: {job_url}")
@@ -185,53 +716,144 @@ class LLMParser:
             
             # 解析HTML内容
             job_info = self.parse_job_html(html_content, job_url)
-            
-            # 确保返回数据包含必要的字段
-            if not job_info.get('company'):
-                logger.warning("提取的公司名称为空，尝试从URL提取")
-                job_info['company'] = self._extract_company_from_url(job_url)
-            
-            if not job_info.get('title'):
-                job_info['title'] = job_info.get('role', '未知职位')
-            
-            if not job_info.get('title'):
-                logger.warning("提取的职位名称为空，使用默认值")
-                job_info['title'] = '未知职位'
-            
-            if not job_info.get('company'):
-                logger.warning("提取的公司名称为空，使用默认值")
-                job_info['company'] = '未知公司'
-            
-            # 确保返回数据格式一致，并记录关键信息
-            result = {
-                'title': job_info.get('title', '未知职位'),
-                'company': job_info.get('company', '未知公司'),
-                'location': job_info.get('location', '未知地点'),
-                'description': job_info.get('description', ''),
-                'recruiter': job_info.get('recruiter', ''),
-                'url': job_url
-            }
-            
-            logger.info(f"职位解析完成: {result['title']} @ {result['company']}")
-            return result
+            return self._finalize_job_info(job_info, job_url)
             
         except Exception as e:
             logger.error(f"解析职位页面失败: {str(e)}")
             logger.exception("详细错误信息")
             return self._create_mock_job_data(job_url)
     
-    def _get_job_page_content(self, url: str) -> Optional[str]:
-        """获取职位页面内容"""
+    def parse_jobs(self, job_urls: List[str], max_workers: int = 4) -> Dict[str, Dict[str, Any]]:
+        """
+        批量解析多个职位页面
+        
+        页面通过browser_pool在多个浏览器实例上并发获取；获取完成后各页面的LLM提取
+        相互独立，同样使用线程池并发执行。
+        
+        Args:
+            job_urls: 工作详情页URL列表
+            max_workers: 并发解析的最大线程数
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: 以URL为键的职位结构化信息
+        """
+        if hasattr(global_config, 'TEST_MODE') and global_config.TEST_MODE:
+            logger.warning("测试模式已启用，返回模拟职位数据")
+            return {job_url: self._create_mock_job_data(job_url) for job_url in job_urls}
+        
+        logger.info(f"开始批量解析 {len(job_urls)} 个职位页面")
+        # 先在主线程创建模型，各解析器副本共享同一个实例
+        _ = self.llm
+        _ = self.embeddings
+        try:
+            pages = browser_pool.get_page_contents(
+                job_urls, max_workers=max_workers,
+                fetch=lambda manager, job_url: self._get_job_page_content(job_url, manager)
+            )
+        finally:
+            # 页面获取完成后立即关闭池中额外创建的浏览器，只保留browser_manager单例
+            browser_pool.close()
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._parse_job_page, job_url, html_content): job_url
+                for job_url, html_content in pages.items()
+                if html_content
+            }
+            for future in as_completed(futures):
+                job_url = futures[future]
+                try:
+                    results[job_url] = future.result()
+                except Exception as e:
+                    logger.error(f"解析职位页面失败: {job_url}, {str(e)}")
+                    results[job_url] = self._create_mock_job_data(job_url)
+        
+        for job_url, html_content in pages.items():
+            if not html_content:
+                logger.warning(f"无法获取职位页面内容: {job_url}，返回模拟数据")
+                results[job_url] = self._create_mock_job_data(job_url)
+        
+        logger.info(f"批量解析完成，共 {len(results)} 个职位")
+        return {job_url: results[job_url] for job_url in job_urls}
+    
+    def _parse_job_page(self, job_url: str, html_content: str) -> Dict[str, Any]:
+        """在独立的解析器副本上解析单个页面，供并发解析使用"""
+        worker = copy.copy(self)
+        worker.body_html = None
+        worker.vectorstore = None
+        worker.fragments = []
+        worker._full_text = None
+        worker._soup = None
+        worker._body_hash = None
+        worker._extraction_cache = {}
+        worker._linkedin_sections = None
+        job_info = worker.parse_job_html(html_content, job_url)
+        return self._finalize_job_info(job_info, job_url)
+    
+    def _finalize_job_info(self, job_info: Dict[str, Any], job_url: str) -> Dict[str, Any]:
+        """
+        补全缺失字段并整理为统一的返回格式
+        
+        Args:
+            job_info: parse_job_html的解析结果
+            job_url: 工作详情页URL
+            
+        Returns:
+            Dict[str, Any]: 包含职位结构化信息的字典
+        """
+        # 确保返回数据包含必要的字段
+        if not job_info.get('company'):
+            logger.warning("提取的公司名称为空，尝试从URL提取")
+            job_info['company'] = self._extract_company_from_url(job_url)
+        
+        if not job_info.get('title'):
+            job_info['title'] = job_info.get('role', '未知职位')
+        
+        if not job_info.get('title'):
+            logger.warning("提取的职位名称为空，使用默认值")
+            job_info['title'] = '未知职位'
+        
+        if not job_info.get('company'):
+            logger.warning("提取的公司名称为空，使用默认值")
+            job_info['company'] = '未知公司'
+        
+        # 确保返回数据格式一致，并记录关键信息
+        result = {
+            'title': job_info.get('title', '未知职位'),
+            'company': job_info.get('company', '未知公司'),
+            'location': job_info.get('location', '未知地点'),
+            'description': job_info.get('description', ''),
+            'recruiter': job_info.get('recruiter', ''),
+            'url': job_url
+        }
+        
+        logger.info(f"职位解析完成: {result['title']} @ {result['company']}")
+        return result
+    
+    def _get_job_page_content(self, url: str, manager=None) -> Optional[str]:
+        """
+        获取职位页面内容
+
+        Args:
+            url: 职位页面URL
+            manager: 使用的浏览器管理器，默认使用browser_manager单例
+
+        Returns:
+            Optional[str]: 页面HTML内容，获取失败时为None
+        """
+        if manager is None:
+            manager = browser_manager
         try:
             logger.info(f"开始获取页面内容: {url}")
             
             # 根据URL判断是否为LinkedIn职位页面
             if "linkedin.com" in url.lower() and ("/jobs/" in url.lower() or "/job/" in url.lower()):
                 logger.info("检测到LinkedIn职位页面，使用专用爬取方法")
-                content = self._get_linkedin_page_content(url)
+                content = self._get_linkedin_page_content(url, manager)
             else:
                 # 使用标准方法获取页面内容
-                content = browser_manager.get_page_content(url)
+                content = manager.get_page_content(url)
             
             # 记录获取的内容大小
             if content:
@@ -244,16 +866,19 @@ class LLMParser:
             logger.error(f"获取页面内容失败: {str(e)}")
             return None
             
-    def _get_linkedin_page_content(self, url: str) -> Optional[str]:
+    def _get_linkedin_page_content(self, url: str, manager=None) -> Optional[str]:
         """
         获取LinkedIn职位页面的内容
         
         Args:
             url: LinkedIn职位页面URL
+            manager: 使用的浏览器管理器，默认使用browser_manager单例
             
         Returns:
             Optional[str]: 页面HTML内容
         """
+        if manager is None:
+            manager = browser_manager
         try:
             logger.info(f"正在获取LinkedIn页面内容: {url}")
             
@@ -279,33 +904,31 @@ class LLMParser:
                 ".jobs-box--fadein"
             ]
             
-            # 尝试多个选择器
+            # 一次页面加载内等待任一选择器出现，避免每个选择器都重新加载页面
             html_content = None
-            for selector in job_selectors:
-                try:
-                    html_content = browser_manager.get_page_content(
-                        url=url,
-                        wait_for_selector=selector,
-                        wait_time=8,  # 增加等待时间
-                        scroll=True,  # 滚动加载更多内容
-                        scroll_wait=1.5,
-                        max_scrolls=3,
-                        check_content_size=True,
-                        browser_options=browser_options
-                    )
-                    
-                    if html_content and len(html_content) > 5000:
-                        logger.info(f"使用选择器 {selector} 成功获取LinkedIn页面内容")
-                        break
-                    else:
-                        logger.warning(f"选择器 {selector} 获取的内容不完整，尝试下一个")
-                except Exception as e:
-                    logger.warning(f"使用选择器 {selector} 获取LinkedIn内容失败: {str(e)}")
+            try:
+                html_content = manager.get_page_content(
+                    url=url,
+                    wait_for_selector=job_selectors,
+                    wait_time=8,  # 增加等待时间
+                    scroll=True,  # 滚动加载更多内容
+                    scroll_wait=1.5,
+                    max_scrolls=3,
+                    check_content_size=True,
+                    browser_options=browser_options
+                )
+                
+                if html_content and len(html_content) > 5000:
+                    logger.info("成功获取LinkedIn页面内容")
+                else:
+                    logger.warning("通过选择器获取的内容不完整")
+            except Exception as e:
+                logger.warning(f"使用选择器获取LinkedIn内容失败: {str(e)}")
             
             # 如果所有选择器都失败，则尝试不使用选择器直接获取页面
             if not html_content:
                 logger.warning("所有选择器都失败，尝试不使用选择器直接获取页面")
-                html_content = browser_manager.get_page_content(
+                html_content = manager.get_page_content(
                     url=url,
                     wait_time=10,
                     scroll=True,
@@ -316,18 +939,12 @@ class LLMParser:
             # 验证内容是否包含职位信息
             if html_content:
                 # 检查是否包含关键词
-                key_indicators = ["job-details", "职位详情", "工作职责", "要求", "岗位职责", 
-                                 "job description", "responsibilities", "requirements"]
-                
-                html_lower = html_content.lower()
-                found_indicators = [ind for ind in key_indicators if ind.lower() in html_lower]
-                
-                if not found_indicators:
+                if not _JOB_PAGE_INDICATOR_PATTERN.search(html_content):
                     logger.warning("获取的页面内容可能不是职位详情页，未找到关键词指标")
                     # 尝试更激进的获取方式
                     browser_options["page_load_strategy"] = "normal"  # 等待完整加载
                     browser_options["stealth_mode"] = True
-                    html_content = browser_manager.get_page_content(
+                    html_content = manager.get_page_content(
                         url=url,
                         wait_time=15,  # 等待更长时间
                         scroll=True,
@@ -344,7 +961,7 @@ class LLMParser:
     def _create_mock_job_data(self, job_url: str) -> Dict[str, Any]:
         """创建模拟职位数据"""
         # 从URL中提取一些信息
-        job_id = re.search(r'view/(\d+)', job_url)
+        job_id = _JOB_ID_PATTERN.search(job_url)
         job_id = job_id.group(1) if job_id else "未知ID"
         
         logger.warning(f"创建模拟数据，职位ID: {job_id}")
@@ -356,7 +973,9 @@ class LLMParser:
             "description": "这是一个模拟的职位描述，由于无法访问实际的职位页面而生成。",
             "location": "远程",
             "recruiter": "模拟招聘人员",
-            "url": job_url
+            "url": job_url,
+            # 标记为模拟数据，调用方据此判断获取是否失败，不缓存该结果
+            "is_mock": True
         }
 
     @staticmethod
@@ -370,14 +989,42 @@ class LLMParser:
         """
         return textwrap.dedent(template)
     
-    def set_body_html(self, html_content):
-        """设置HTML内容并提取正文文本"""
+    def set_body_html(self, html_content, parse_dom: bool = True):
+        """
+        设置HTML内容并提取正文文本
+        
+        Args:
+            html_content: 页面HTML
+            parse_dom: 是否需要DOM。为False时用正则提取正文，跳过BeautifulSoup解析；
+                之后需要从HTML元数据中提取信息时再按需解析
+        """
         try:
+            body_hash = hashlib.blake2b((html_content or "").encode("utf-8"), digest_size=8).hexdigest()
+            if html_content and body_hash == self._body_hash:
+                logger.debug("HTML内容未变化，复用已处理的页面和提取结果")
+                return True
+            
+            self._body_hash = body_hash
+            self._extraction_cache = {}
+            self._linkedin_sections = None
             self.body_html = html_content
-            soup = BeautifulSoup(html_content, 'html.parser')
+            self._soup = None
             
             # 提取正文文本
-            text_content = soup.get_text(separator='\n', strip=True)
+            if parse_dom:
+                text_content = self._get_soup().get_text(separator='\n', strip=True)
+            else:
+                text_content = _html_to_text(html_content)
+            self._page_text = text_content
+            self.vectorstore = None
+            self._full_text = None
+            
+            # 短页面整体放入上下文即可，无需分割和创建向量存储
+            if len(text_content) < FULL_CONTEXT_TEXT_LIMIT:
+                self._full_text = text_content
+                self.fragments = [text_content] if text_content else []
+                logger.debug(f"正文较短 ({len(text_content)} 字符)，跳过向量存储创建")
+                return True
             
             # 使用文本分割器将内容分割成片段
             text_splitter = RecursiveCharacterTextSplitter(
@@ -393,31 +1040,18 @@ class LLMParser:
             
             # 创建向量存储
             try:
-                if not hasattr(self, 'embeddings') or self.embeddings is None:
+                if self.embeddings is None:
                     logger.warning("没有可用的嵌入模型，跳过向量存储创建")
                     return True
                 
-                # 确保为Ollama embeddings指定模型名称
-                if self.model_type.lower() == "ollama":
-                    # 使用完整的模型名称
-                    logger.debug(f"使用Ollama embeddings，模型: {self.model_name}")
-                    embeddings = OllamaEmbeddings(
-                        model=self.model_name,
-                        base_url="http://localhost:11434"
-                    )
-                else:
-                    embeddings = self.embeddings
+                embeddings = self.embeddings
                 
                 if not self.fragments:
                     logger.warning("没有文本片段可用于创建向量存储")
                     return True
                 
                 # 创建向量存储
-                self.vectorstore = FAISS.from_texts(
-                    self.fragments,
-                    embedding=embeddings,
-                    metadatas=[{"source": f"chunk_{i}"} for i in range(len(self.fragments))]
-                )
+                self.vectorstore = self._build_vectorstore(self.fragments, embeddings)
                 logger.debug("Vectorstore created successfully.")
             except Exception as e:
                 logger.error(f"Error during vectorstore creation: {str(e)}")
@@ -428,8 +1062,76 @@ class LLMParser:
             return True
         except Exception as e:
             logger.error(f"Error processing HTML body: {str(e)}")
+            self._body_hash = None
             return False
 
+    def _get_soup(self) -> BeautifulSoup:
+        """返回当前页面解析后的BeautifulSoup对象，同一页面只解析一次"""
+        if self._soup is None:
+            # 解析前先去掉脚本、样式和注释，它们不参与任何提取，去掉后解析更快、DOM更小
+            self._soup = BeautifulSoup(_HTML_NON_TEXT_PATTERN.sub('', self.body_html or ""), HTML_PARSER)
+        return self._soup
+    
+    def _build_vectorstore(self, fragments: List[str], embeddings) -> FAISS:
+        """
+        使用float16标量量化索引创建向量存储，向量内存占用减半
+        
+        Args:
+            fragments: 文本片段列表
+            embeddings: 嵌入模型
+            
+        Returns:
+            FAISS: 向量存储
+        """
+        metadatas = [{"source": f"chunk_{i}"} for i in range(len(fragments))]
+        try:
+            faiss = dependable_faiss_import()
+            vectors = np.asarray(self._embed_fragments(fragments, embeddings), dtype="float32")
+            index = faiss.IndexScalarQuantizer(vectors.shape[1], faiss.ScalarQuantizer.QT_fp16)
+            index.add(vectors)
+            
+            ids = [str(i) for i in range(len(fragments))]
+            docstore = InMemoryDocstore({
+                doc_id: Document(page_content=fragment, metadata=metadata)
+                for doc_id, fragment, metadata in zip(ids, fragments, metadatas)
+            })
+            return FAISS(embeddings, index, docstore, dict(enumerate(ids)))
+        except Exception as e:
+            logger.warning(f"创建float16索引失败，使用默认索引: {str(e)}")
+            return FAISS.from_texts(fragments, embedding=embeddings, metadatas=metadatas)
+    
+    def _embed_fragments(self, fragments: List[str], embeddings) -> List[List[float]]:
+        """
+        嵌入文本片段，优先使用进程级缓存，只对未命中的片段调用嵌入模型
+        
+        Args:
+            fragments: 文本片段列表
+            embeddings: 嵌入模型
+            
+        Returns:
+            List[List[float]]: 与fragments一一对应的向量
+        """
+        keys = [
+            (self.model_type, self.model_name, hashlib.sha1(fragment.encode("utf-8")).hexdigest())
+            for fragment in fragments
+        ]
+        with _fragment_embedding_lock:
+            cached = [_fragment_embedding_cache.get(key) for key in keys]
+        
+        missing = [i for i, vector in enumerate(cached) if vector is None]
+        if missing:
+            new_vectors = embeddings.embed_documents([fragments[i] for i in missing])
+            with _fragment_embedding_lock:
+                for i, vector in zip(missing, new_vectors):
+                    cached[i] = vector
+                    _fragment_embedding_cache[keys[i]] = vector
+                # 超出容量时淘汰最早加入的条目
+                while len(_fragment_embedding_cache) > FRAGMENT_EMBEDDING_CACHE_SIZE:
+                    del _fragment_embedding_cache[next(iter(_fragment_embedding_cache))]
+        
+        logger.debug(f"片段向量缓存命中 {len(fragments) - len(missing)}/{len(fragments)}")
+        return cached
+    
     def _retrieve_context(self, query: str, top_k: int = 3) -> str:
         """
         Retrieves the most relevant text fragments using the retriever.
@@ -440,6 +1142,9 @@ class LLMParser:
             str: Concatenated text fragments.
         """
         try:
+            if self._full_text is not None:
+                return self._full_text
+            
             if not hasattr(self, 'vectorstore') or self.vectorstore is None:
                 logger.warning("Vectorstore not available, using all fragments")
                 # 如果没有向量存储，返回所有文本片段
@@ -448,10 +1153,14 @@ class LLMParser:
                     return ""
                 return "\n\n".join(self.fragments[:top_k])
             
-            retriever = self.vectorstore.as_retriever()
-            retrieved_docs = retriever.get_relevant_documents(query)[:top_k]
+            # 检索查询是固定的几种，缓存其向量避免重复调用嵌入模型
+            query_vector = self._query_embeddings.get(query)
+            if query_vector is None:
+                query_vector = self.embeddings.embed_query(query)
+                self._query_embeddings[query] = query_vector
+            retrieved_docs = self.vectorstore.similarity_search_by_vector(query_vector, k=top_k)
             context = "\n\n".join(doc.page_content for doc in retrieved_docs)
-            logger.debug(f"Context retrieved for query '{query}': {context[:200]}...")  # Log the first 200 characters
+            logger.opt(lazy=True).debug("Context retrieved for query '{}': {}...", lambda: query, lambda: context[:200])  # Log the first 200 characters
             return context
         except Exception as e:
             logger.error(f"Error retrieving context: {str(e)}")
@@ -467,58 +1176,131 @@ class LLMParser:
         Returns:
             str: The extracted information.
         """
+        # 同一页面的相同问题只调用一次LLM
+        cache_key = (question, retrieval_query)
+        if cache_key in self._extraction_cache:
+            return self._extraction_cache[cache_key]
+        
         # 尝试从HTML元数据中直接提取信息
         metadata_info = self._extract_from_metadata(retrieval_query)
         if metadata_info:
             logger.info(f"从元数据中直接提取到信息: {metadata_info}")
-            return self._clean_extraction_result(metadata_info)
+            result = self._clean_extraction_result(metadata_info)
+            self._extraction_cache[cache_key] = result
+            return result
             
         # 如果元数据提取失败，使用向量检索和LLM提取
         context = self._retrieve_context(retrieval_query)
         
-        # 创建带有系统提示的聊天模板
-        chat_prompt = ChatPromptTemplate.from_messages([
-            SystemMessagePromptTemplate.from_template(LINKEDIN_SYSTEM_PROMPT),
-            HumanMessagePromptTemplate.from_template(
-                """
-                从以下职位描述中提取信息，回答问题：
-                
-                职位描述内容:
-                {context}
-                
-                问题: {question}
-                
-                请只回答问题，不要添加解释或多余的信息。
-                如果信息不在上下文中，请回答"未提供"。
-                """
-            )
-        ])
-        
-        formatted_prompt = chat_prompt.format_messages(
-            context=context,
-            question=question
-        )
-        
         try:
             if self.model_type == "ollama":
                 # Ollama模型使用不同的提示处理方法
-                formatted_text = chat_prompt.format(
+                formatted_text = EXTRACTION_CHAT_PROMPT.format(
                     context=context,
                     question=question
                 )
                 result = self.llm.predict(formatted_text)
             else:
-                # OpenAI模型使用标准的格式化消息
-                chain = chat_prompt | self.llm | StrOutputParser()
-                result = chain.invoke({"context": context, "question": question})
+                # 其他模型复用初始化时组装的提取链
+                result = self._extraction_chain.invoke({"context": context, "question": question})
             
             extracted_info = result.strip()
-            logger.debug(f"LLM提取的信息: {extracted_info}")
-            return self._clean_extraction_result(extracted_info)
+            logger.debug("LLM提取的信息: {}", extracted_info)
+            cleaned = self._clean_extraction_result(extracted_info)
+            self._extraction_cache[cache_key] = cleaned
+            return cleaned
         except Exception as e:  
             logger.error(f"提取信息时出错: {str(e)}")
             return ""
     
+    def extract_job_fields(self, fields: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        一次LLM调用提取多个职位字段
+        
+        优先从HTML元数据中直接提取，剩余字段合并为一个要求返回JSON的请求；
+        JSON解析失败或缺少的字段回退为逐字段提取。
+        
+        Args:
+            fields: 要提取的字段，取值见JOB_FIELDS，默认提取全部
+            
+        Returns:
+            Dict[str, str]: 字段名到提取结果的映射
+        """
+        fields = list(fields or JOB_FIELDS)
+        results = {}
+        pending = []
+        for field in fields:
+            _, retrieval_query, question = JOB_FIELDS[field]
+            cached = self._extraction_cache.get((question, retrieval_query))
+            if cached is not None:
+                results[field] = cached
+                continue
+            metadata_info = self._extract_from_metadata(retrieval_query)
+            if metadata_info:
+                logger.info(f"从元数据中直接提取到{field}: {metadata_info}")
+                results[field] = self._clean_extraction_result(metadata_info)
+            else:
+                pending.append(field)
+        
+        if not pending:
+            return results
+        
+        # 合并各字段的检索上下文（去重）
+        contexts = dict.fromkeys(self._retrieve_context(JOB_FIELDS[field][1]) for field in pending)
+        context = "\n\n".join(c for c in contexts if c)
+        fields_text = "\n".join(f"- {field}: {JOB_FIELDS[field][0]}" for field in pending)
+        
+        parsed = {}
+        try:
+            if self.model_type == "ollama":
+                formatted_text = JOB_FIELDS_CHAT_PROMPT.format(context=context, fields=fields_text)
+                response = self.llm.predict(formatted_text)
+            else:
+                response = self._fields_chain.invoke({"context": context, "fields": fields_text})
+            logger.debug("LLM合并提取的响应: {}", response)
+            parsed = self._parse_json_response(response)
+        except Exception as e:
+            logger.error(f"合并提取职位字段时出错: {str(e)}")
+        
+        missing = []
+        for field in pending:
+            value = parsed.get(field)
+            if isinstance(value, list):
+                # 分点内容可能以数组形式返回
+                value = "\n".join(str(item) for item in value)
+            if isinstance(value, str) and value.strip():
+                results[field] = self._clean_extraction_result(value)
+                _, retrieval_query, question = JOB_FIELDS[field]
+                self._extraction_cache[(question, retrieval_query)] = results[field]
+            else:
+                logger.warning(f"合并提取未返回{field}，回退为单独提取")
+                missing.append(field)
+        
+        # 回退的单独提取互不依赖，并发调用LLM
+        if len(missing) == 1:
+            results[missing[0]] = self.extract_field(missing[0])
+        elif missing:
+            with ThreadPoolExecutor(max_workers=min(len(missing), FIELD_EXTRACTION_MAX_WORKERS)) as executor:
+                for field, value in zip(missing, executor.map(self.extract_field, missing)):
+                    results[field] = value
+        
+        return results
+    
+    @staticmethod
+    def _parse_json_response(response: str) -> Dict[str, Any]:
+        """从LLM响应中解析JSON对象，解析失败时返回空字典"""
+        cleaned = _THINK_PATTERN.sub('', response or "")
+        match = _JSON_OBJECT_PATTERN.search(cleaned)
+        if not match:
+            logger.warning("LLM响应中未找到JSON对象")
+            return {}
+        try:
+            parsed = _json_loads(match.group(0))
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError是它的子类
+            logger.warning(f"解析LLM响应的JSON失败: {str(e)}")
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+    
     def _extract_from_metadata(self, info_type: str) -> Optional[str]:
         """
         从HTML元数据中提取特定信息
@@ -533,44 +1315,21 @@ class LLMParser:
             return None
         
         try:
-            soup = BeautifulSoup(self.body_html, 'html.parser')
+            # 按纯文本处理的页面在这里才首次解析DOM
+            soup = self._get_soup()
             
             if info_type.lower() == "company name":
                 # 尝试从多个可能的元素中提取公司名称
-                selectors = [
-                    ".job-details-jobs-unified-top-card__company-name",  # 职位卡片中的公司名称
-                    ".jobs-unified-top-card__company-name",              # 旧版职位卡片
-                    ".jobs-company__name",                               # 公司名称组件
-                    ".company-name",                                     # 通用公司名类
-                    ".topcard__org-name-link",                           # 顶部卡片中的公司名链接
-                    "a[data-tracking-control-name='public_jobs_topcard-org-name']",  # 公司链接
-                    "meta[property='og:site_name']"                      # Open Graph 站点名称
-                ]
-                
-                for selector in selectors:
-                    elements = soup.select(selector)
-                    if elements and len(elements) > 0:
-                        if selector.startswith("meta"):
-                            # 元数据标签，获取content属性
-                            return elements[0].get("content")
-                        else:
-                            # 普通HTML元素，获取文本内容
-                            text = elements[0].get_text(strip=True)
-                            if text:
-                                return text
+                for selector, element in _select_first_by_priority(soup, "company name"):
+                    if selector.startswith("meta"):
+                        # 元数据标签，获取content属性
+                        return element.get("content")
+                    # 普通HTML元素，获取文本内容
+                    text = element.get_text(strip=True)
+                    if text:
+                        return text
                             
             elif info_type.lower() == "job title":
-                # 尝试从多个可能的元素中提取职位名称
-                selectors = [
-                    ".job-details-jobs-unified-top-card__job-title",     # 职位顶部卡片标题
-                    ".t-24.job-details-jobs-unified-top-card__job-title", # 带样式的职位标题
-                    ".jobs-unified-top-card__job-title",                 # 旧版职位标题
-                    ".topcard__title",                                   # 经典页面顶部卡片标题
-                    "h1.job-title",                                      # H1标题的职位
-                    "title",                                             # 页面标题
-                    "meta[property='og:title']"                          # Open Graph 标题
-                ]
-                
                 # 首先检查页面标题，因为通常它会包含职位名称和公司名称
                 page_title = soup.title.string if soup.title else None
                 if page_title:
@@ -585,87 +1344,54 @@ class LLMParser:
                         return title_parts[0].strip()
                 
                 # 如果从标题中未能提取，尝试从元素中提取
-                for selector in selectors:
-                    elements = soup.select(selector)
-                    if elements and len(elements) > 0:
-                        if selector.startswith("meta"):
-                            content = elements[0].get("content")
-                            if content:
-                                # 如果是OG标题，通常格式是"职位名称 | 公司名称 | LinkedIn"
-                                parts = content.split(' | ')
-                                if len(parts) > 1:
-                                    return parts[0].strip()
-                                return content
-                        else:
-                            # 普通HTML元素，获取文本内容
-                            text = elements[0].get_text(strip=True)
-                            if text and len(text) < 100:
-                                return text
+                for selector, element in _select_first_by_priority(soup, "job title"):
+                    if selector.startswith("meta"):
+                        content = element.get("content")
+                        if content:
+                            # 如果是OG标题，通常格式是"职位名称 | 公司名称 | LinkedIn"
+                            parts = content.split(' | ')
+                            if len(parts) > 1:
+                                return parts[0].strip()
+                            return content
+                    else:
+                        # 普通HTML元素，获取文本内容
+                        text = element.get_text(strip=True)
+                        if text and len(text) < 100:
+                            return text
                 
                 # 尝试从description或其他部分提取
                 job_details = soup.select_one("#job-details") or soup.select_one(".jobs-description-content__text")
                 if job_details:
                     # 尝试找出职位相关陈述，例如"We are looking for a Software Engineer..."
-                    patterns = [
-                        r"(?:looking for|hiring|seeking) (?:an?|the) ([A-Za-z\s]+?)(?: to | who |[,\.])",
-                        r"(?:开放|招聘|寻找|诚聘)(?:一名|一位|)[（(]?([^，,：:()（）]{2,30})[)）]?(?:岗位|职位)?"
-                    ]
-                    
                     text = job_details.get_text()
-                    for pattern in patterns:
-                        match = re.search(pattern, text, re.IGNORECASE)
+                    for pattern in _JOB_TITLE_STATEMENT_PATTERNS:
+                        match = pattern.search(text)
                         if match:
                             return match.group(1).strip()
                         
             elif info_type.lower() == "job description":
                 # 尝试提取职位描述
-                selectors = [
-                    "#job-details",                              # 主职位详情ID
-                    ".jobs-description-content__text",           # 新版职位描述内容
-                    ".jobs-description__content",                # 职位描述内容
-                    ".jobs-box__html-content",                   # LinkedIn描述HTML内容
-                    ".description-section",                      # 描述部分
-                    ".description"                               # 通用描述类
-                ]
-                
-                for selector in selectors:
-                    elements = soup.select(selector)
-                    if elements and len(elements) > 0:
-                        return elements[0].get_text(strip=True)
+                for _, element in _select_first_by_priority(soup, "job description"):
+                    return element.get_text(strip=True)
                         
             elif info_type.lower() == "location":
-                # 尝试提取位置信息
-                selectors = [
-                    ".job-details-jobs-unified-top-card__job-insight span:not(.job-details-jobs-unified-top-card__job-insight-view-model-secondary)",
-                    ".jobs-unified-top-card__bullet",            # 职位卡片中的项目符号（通常是位置）
-                    ".jobs-unified-top-card__workplace-type",    # 工作地点类型
-                    ".topcard__flavor--bullet",                  # 经典页面的项目符号（位置）
-                    ".location",                                 # 通用位置类
-                    "meta[property='og:location']"               # 位置元数据
-                ]
-                
                 # 首先尝试特定元素
-                for selector in selectors:
-                    elements = soup.select(selector)
-                    if elements and len(elements) > 0:
-                        if selector.startswith("meta"):
-                            # 元数据标签，获取content属性
-                            return elements[0].get("content")
-                        else:
-                            # 普通HTML元素，获取文本内容
-                            text = elements[0].get_text(strip=True)
-                            if text:
-                                return text
+                for selector, element in _select_first_by_priority(soup, "location"):
+                    if selector.startswith("meta"):
+                        # 元数据标签，获取content属性
+                        return element.get("content")
+                    # 普通HTML元素，获取文本内容
+                    text = element.get_text(strip=True)
+                    if text:
+                        return text
                 
-                # 尝试查找包含位置关键词的元素
-                location_keywords = ['remote', '远程', 'hybrid', '混合', 'onsite', '现场', 'in-office', '办公室']
-                for keyword in location_keywords:
-                    elements = soup.find_all(string=re.compile(keyword, re.IGNORECASE))
-                    if elements:
-                        # 查找最短且最可能是位置的文本
-                        locations = [el.strip() for el in elements if len(el.strip()) < 50]
-                        if locations:
-                            return min(locations, key=len)
+                # 尝试查找包含位置关键词的元素，一次遍历取出所有候选文本后按关键词优先级筛选
+                candidates = soup.find_all(string=_LOCATION_KEYWORD_PATTERN)
+                for pattern in _LOCATION_KEYWORD_PATTERNS:
+                    # 查找最短且最可能是位置的文本
+                    locations = [el.strip() for el in candidates if pattern.search(el) and len(el.strip()) < 50]
+                    if locations:
+                        return min(locations, key=len)
             
             # 特别处理招聘人员信息
             elif info_type.lower() == "recruiter or hiring manager":
@@ -684,13 +1410,9 @@ class LLMParser:
                 
                 # 如果招聘人员找不到，尝试在整个页面查找关键词
                 if not recruiter_elements:
-                    patterns = [
-                        r"(?:recruiter|hiring manager|contact)(?:\s*:|\s+is|\s+at)\s+([A-Za-z\s\.]+)",
-                        r"(?:招聘人员|招聘经理|联系人)(?:\s*:|\s+是|\s+为)?\s+([^\n,，.。]{2,30})"
-                    ]
-                    
-                    for pattern in patterns:
-                        matches = re.findall(pattern, soup.get_text(), re.IGNORECASE)
+                    page_text = soup.get_text()
+                    for pattern in _RECRUITER_PATTERNS:
+                        matches = pattern.findall(page_text)
                         if matches:
                             return matches[0].strip()
                 
@@ -700,8 +1422,7 @@ class LLMParser:
             elif info_type.lower() == "job requirements" or info_type.lower() == "requirements":
                 # 先查找明确的要求部分
                 requirement_headers = soup.find_all(['h2', 'h3', 'h4', 'strong', 'b'], 
-                                                   string=re.compile(r'(requirements|qualifications|skills|要求|资格|技能)', 
-                                                                    re.IGNORECASE))
+                                                   string=_REQUIREMENT_HEADER_PATTERN)
                 for header in requirement_headers:
                     # 查找头部后面的列表或段落
                     next_element = header.find_next_sibling()
@@ -719,19 +1440,11 @@ class LLMParser:
                 if job_details:
                     # 查找包含要求或资格关键词的段落
                     text = job_details.get_text()
-                    requirement_patterns = [
-                        r"(?:Requirements|Qualifications|Skills Required|What You Need|Required Skills|Experience)(?:\s*:|\s*-|\s*–)?\s*((?:.+\n?)+?)(?:\n\n|\Z|Responsibilities|About Us|Benefits|How to Apply)",
-                        r"(?:要求|资格要求|技能要求|所需技能|资质要求|经验要求|岗位要求)(?:\s*:|\s*：|\s*-|\s*–)?\s*((?:.+\n?)+?)(?:\n\n|\Z|职责|岗位职责|工作职责|关于我们|公司介绍|福利待遇|如何申请)",
-                        # 更通用的模式，尝试捕获位于段落中的要求
-                        r"(?:required skills|requirements|qualifications)[\s\S]{0,20}?(?:include|are|:)[\s\S]{0,10}((?:(?:\s*[-•*]\s*|\s*\d+\.\s*|(?:\s*[A-Za-z0-9]+\)\s*))(?:[\w\s,.]+)(?:\n|$))+)",
-                        r"(?:技能要求|岗位要求|资格要求)[\s\S]{0,20}?(?:包括|是|：|:)[\s\S]{0,10}((?:(?:\s*[-•*]\s*|\s*\d+\.\s*|(?:\s*[A-Za-z0-9]+\)\s*))(?:[\w\s,.]+)(?:\n|$))+)"
-                    ]
-                    
-                    for pattern in requirement_patterns:
-                        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+                    for pattern in _REQUIREMENT_PATTERNS:
+                        match = pattern.search(text)
                         if match:
                             requirements = match.group(1).strip()
-                            logger.debug(f"提取到职位要求: {requirements[:100]}...")
+                            logger.opt(lazy=True).debug("提取到职位要求: {}...", lambda: requirements[:100])
                             return requirements
             
             # 未找到任何匹配元素
@@ -753,52 +1466,50 @@ class LLMParser:
         """
         if not result:
             return "未提供"
+        
+        # 简短回答（如公司名）通常不含标签、空白和前缀首字符，无需逐步清理
+        if result[:1] not in _PREFIX_FIRST_CHARS and _CLEAN_TRIGGER_CHARS.isdisjoint(result):
+            return "未提供" if result.lower() in _NOT_FOUND else result
             
-        # 移除思考标记
-        import re
-        cleaned = re.sub(r'<think>.*?</think>', '', result, flags=re.DOTALL)
-        cleaned = re.sub(r'<think>.*', '', cleaned, flags=re.DOTALL)
+        # 移除思考标记（大多数回答不含该标记，先做子串判断）
+        cleaned = _THINK_PATTERN.sub('', result) if '<think>' in result else result
         
         # 移除换行符和多余空格
-        cleaned = cleaned.replace('\n', ' ').strip()
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        cleaned = ' '.join(cleaned.split())
         
         # 移除常见的回答格式
-        common_prefixes = [
-            r"^The company(?:'s)? name is ",
-            r"^The company is ",
-            r"^The job title is ",
-            r"^The role is ",
-            r"^The position is ",
-            r"^The location is ",
-            r"^The job description is ",
-            r"^公司名称[是为：:]\s*",
-            r"^公司[是为：:]\s*",
-            r"^职位名称[是为：:]\s*",
-            r"^职位[是为：:]\s*",
-            r"^地点[是为：:]\s*",
-            r"^职位描述[是为：:]\s*"
-        ]
-        
-        for prefix in common_prefixes:
-            cleaned = re.sub(prefix, '', cleaned, flags=re.IGNORECASE)
+        if cleaned[:1] in _PREFIX_FIRST_CHARS:
+            for prefix in _COMMON_PREFIX_PATTERNS:
+                cleaned = prefix.sub('', cleaned)
         
         # 如果清理后为空，返回"未提供"
-        if not cleaned or cleaned.isspace() or cleaned.lower() in ["none", "unknown", "not found", "not provided", "未找到", "未知", "无"]:
+        normalized = cleaned.strip().lower()
+        if not normalized or normalized in _NOT_FOUND:
             return "未提供"
             
         return cleaned
     
+    def extract_field(self, name: str) -> str:
+        """
+        按JOB_FIELDS中的配置提取单个职位字段
+        
+        Args:
+            name: 字段名，取值见JOB_FIELDS
+            
+        Returns:
+            str: 提取的字段内容
+        """
+        _, retrieval_query, question = JOB_FIELDS[name]
+        logger.debug("Starting {} extraction.", name)
+        return self._extract_information(question, retrieval_query)
+    
     def extract_job_description(self) -> str:
         """
         Extracts the company name from the job description.
         Returns:
             str: The extracted job description.
         """
-        question = "What is the job description of the company?"
-        retrieval_query = "Job description"
-        logger.debug("Starting job description extraction.")
-        return self._extract_information(question, retrieval_query)
+        return self.extract_field("description")
     
     def extract_company_name(self) -> str:
         """
@@ -806,15 +1517,7 @@ class LLMParser:
         Returns:
             str: The extracted company name.
         """
-        question = "What is the company's name?"
-        retrieval_query = "Company name"
-        logger.debug("Starting company name extraction.")
-        
-        # 使用加强版的信息提取方法
-        result = self._extract_information(question, retrieval_query)
-        logger.info(f"提取的公司名称: {result}")
-        
-        return result
+        return self.extract_field("company")
     
     def extract_role(self) -> str:
         """
@@ -822,15 +1525,7 @@ class LLMParser:
         Returns:
             str: The extracted role/title.
         """
-        question = "What is the role or title sought in this job description?"
-        retrieval_query = "Job title"
-        logger.debug("Starting role/title extraction.")
-        
-        # 使用加强版的信息提取方法
-        result = self._extract_information(question, retrieval_query)
-        logger.info(f"提取的职位名称: {result}")
-        
-        return result
+        return self.extract_field("title")
     
     def extract_location(self) -> str:
         """
@@ -838,10 +1533,7 @@ class LLMParser:
         Returns:
             str: The extracted location.
         """
-        question = "What is the location mentioned in this job description?"
-        retrieval_query = "Location"
-        logger.debug("Starting location extraction.")
-        return self._extract_information(question, retrieval_query)
+        return self.extract_field("location")
     
     def extract_recruiter_email(self) -> str:
         """
@@ -849,14 +1541,10 @@ class LLMParser:
         Returns:
             str: The extracted recruiter's email.
         """
-        question = "What is the recruiter's email address in this job description?"
-        retrieval_query = "Recruiter email"
-        logger.debug("Starting recruiter email extraction.")
-        email = self._extract_information(question, retrieval_query)
+        email = self.extract_field("recruiter_email")
         
-        # Validate the extracted email using regex
-        email_regex = r'[\w\.-]+@[\w\.-]+\.\w+'
-        if re.match(email_regex, email):
+        # Validate the extracted email using regex; the whole answer must be an address
+        if email and _EMAIL_PATTERN.fullmatch(email):
             logger.debug("Valid recruiter's email.")
             return email
         else:
@@ -869,10 +1557,7 @@ class LLMParser:
         Returns:
             str: The extracted recruiter information.
         """
-        question = "Who is the recruiter or hiring manager for this position? Extract any contact information."
-        retrieval_query = "Recruiter or hiring manager"
-        logger.debug("Starting recruiter information extraction.")
-        return self._extract_information(question, retrieval_query)
+        return self.extract_field("recruiter")
     
     def analyze_skill_match(self, candidate_skills: List[str]) -> Dict[str, Any]:
         """
@@ -899,13 +1584,13 @@ class LLMParser:
                 }
             
             # 构建提示词
-            prompt = SKILL_MATCHING_PROMPT.format(
-                job_description=job_description,
-                candidate_skills=", ".join(candidate_skills)
-            )
+            prompt = render_prompt(SKILL_MATCHING_PROMPT, {
+                "job_description": job_description,
+                "candidate_skills": ", ".join(candidate_skills)
+            })
             
             # 使用LLM分析匹配度
-            logger.debug(f"使用提示词进行技能匹配分析: {prompt[:200]}...")  # 仅记录前200个字符
+            logger.opt(lazy=True).debug("使用提示词进行技能匹配分析: {}...", lambda: prompt[:200])  # 仅记录前200个字符
             response = self.llm.predict(prompt)
             
             # 解析响应
@@ -936,50 +1621,37 @@ class LLMParser:
         try:
             # 提取匹配度分数
             match_score = 0
-            match_score_pattern = r'(\d+)%'
-            match = re.search(match_score_pattern, response)
+            match = _MATCH_SCORE_PATTERN.search(response)
             if match:
                 match_score = int(match.group(1))
             
             # 简单解析匹配技能和缺失技能
-            lines = response.split('\n')
-            matching_skills = []
-            missing_skills = []
-            recommendations = ""
+            skills = {"matching_skills": [], "missing_skills": []}
+            recommendations = []
             
-            # 解析各部分
+            # 一次扫描响应，逐行识别部分标题、列表项和普通文本（空行不会匹配）
             current_section = ""
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
+            for line_match in _SKILL_RESPONSE_LINE_PATTERN.finditer(response):
+                kind = line_match.lastgroup
+                line = line_match.group(0).strip()
                 
-                # 识别部分标题
-                if line.startswith('1.') or '关键技能' in line:
-                    current_section = "required_skills"
-                elif line.startswith('2.') or '匹配技能' in line:
-                    current_section = "matching_skills"
-                elif line.startswith('3.') or '缺少的技能' in line:
-                    current_section = "missing_skills"
-                elif line.startswith('4.') or '匹配度评分' in line:
-                    current_section = "match_score"
-                elif line.startswith('5.') or line.startswith('6.') or '建议' in line:
-                    current_section = "recommendations"
-                    recommendations += line + "\n"
-                elif current_section == "matching_skills" and line.startswith('-'):
+                if kind == "bullet" and current_section in skills:
                     skill = line.strip('- ').split('（')[0].split('(')[0].strip()
-                    matching_skills.append(skill)
-                elif current_section == "missing_skills" and line.startswith('-'):
-                    skill = line.strip('- ').split('（')[0].split('(')[0].strip()
-                    missing_skills.append(skill)
-                elif current_section == "recommendations":
-                    recommendations += line + "\n"
+                    skills[current_section].append(skill)
+                elif kind in ("bullet", "text"):
+                    if current_section == "recommendations":
+                        recommendations.append(line)
+                else:
+                    # 识别到部分标题
+                    current_section = kind
+                    if kind == "recommendations":
+                        recommendations.append(line)
             
             return {
                 "match_score": match_score,
-                "matching_skills": matching_skills,
-                "missing_skills": missing_skills,
-                "recommendations": recommendations.strip()
+                "matching_skills": skills["matching_skills"],
+                "missing_skills": skills["missing_skills"],
+                "recommendations": "\n".join(recommendations)
             }
         except Exception as e:
             logger.error(f"解析技能匹配响应出错: {str(e)}")
@@ -999,67 +1671,58 @@ class LLMParser:
         """
         if not hasattr(self, 'body_html') or not self.body_html:
             return {}
+        
+        # 同一页面只解析一次
+        if self._linkedin_sections is not None:
+            return self._linkedin_sections
             
         try:
             sections = {}
-            soup = BeautifulSoup(self.body_html, 'html.parser')
-            
+            soup = self._get_soup()
+            # 单次遍历DOM收集所有需要的元素，避免对每个字段分别执行选择器
+            elements = _index_linkedin_elements(soup)
+
             # 提取顶部卡片信息
             # 1. 提取职位标题
-            job_title_elements = soup.select(".job-details-jobs-unified-top-card__job-title, .t-24.job-details-jobs-unified-top-card__job-title")
+            job_title_elements = elements.get("job_title")
             if job_title_elements:
                 sections["job_title"] = job_title_elements[0].get_text(strip=True)
                 logger.info(f"提取到职位标题: {sections['job_title']}")
             
             # 2. 提取公司名称
-            company_elements = soup.select(".job-details-jobs-unified-top-card__company-name")
+            company_elements = elements.get("company_name")
             if company_elements:
                 sections["company_name"] = company_elements[0].get_text(strip=True)
                 logger.info(f"提取到公司名称: {sections['company_name']}")
             
             # 3. 提取位置信息
-            location_elements = soup.select(".job-details-jobs-unified-top-card__job-insight:first-child")
+            # 只取作为父元素第一个子元素的insight（等价于:first-child）
+            location_elements = [
+                el for el in elements.get("job_insight", ())
+                if el.find_previous_sibling() is None
+            ]
             if location_elements:
                 # 排除带有secondary类的元素(通常是额外信息)
-                location_text = ""
-                for el in location_elements[0].select("span:not(.job-details-jobs-unified-top-card__job-insight-view-model-secondary)"):
-                    location_text += el.get_text(strip=True) + " "
+                location_text = " ".join(
+                    el.get_text(strip=True)
+                    for el in location_elements[0].select("span:not(.job-details-jobs-unified-top-card__job-insight-view-model-secondary)")
+                ).strip()
                 if location_text:
-                    sections["location"] = location_text.strip()
+                    sections["location"] = location_text
                     logger.info(f"提取到位置信息: {sections['location']}")
             
             # 查找职位详情主区域
-            job_details = soup.select_one("#job-details") or soup.select_one(".jobs-description-content__text--stretch") or soup.select_one(".jobs-description__content")
+            job_details = next(
+                (elements[bucket][0] for bucket in ("job_details", "description_stretch", "description_content")
+                 if bucket in elements),
+                None,
+            )
             if not job_details:
                 logger.warning("无法找到职位详情主区域")
                 return sections
             
             # 尝试提取职位详情结构化内容
             # 1. 首先尝试通过结构识别各部分（寻找小标题）
-            sections_mapping = {
-                # 职责部分可能的标题关键词
-                "responsibilities": [
-                    "responsibilities", "role responsibilities", "job responsibilities", 
-                    "duties", "what you'll do", "职责", "工作职责", "岗位职责", "你将要做什么"
-                ],
-                # 要求部分可能的标题关键词
-                "requirements": [
-                    "requirements", "qualifications", "skills", "experience", "what you need", 
-                    "what we're looking for", "required skills", "要求", "资格", "技能", 
-                    "经验", "我们在寻找", "必备技能"
-                ],
-                # 福利部分可能的标题关键词
-                "benefits": [
-                    "benefits", "perks", "what we offer", "compensation", "salary", 
-                    "package", "福利", "薪资", "待遇", "我们提供"
-                ],
-                # 公司介绍部分可能的标题关键词
-                "company_info": [
-                    "about us", "company", "who we are", "our team", "团队介绍", 
-                    "公司介绍", "关于我们", "我们是谁"
-                ]
-            }
-            
             # 查找所有可能的部分标题元素
             heading_elements = job_details.select("h1, h2, h3, h4, h5, strong, b")
             current_section = None
@@ -1070,8 +1733,8 @@ class LLMParser:
                 
                 # 识别这个标题属于哪个部分
                 matched_section = None
-                for section_key, keywords in sections_mapping.items():
-                    if any(keyword in heading_text for keyword in keywords):
+                for section_key, pattern in _SECTION_HEADING_PATTERNS.items():
+                    if pattern.search(heading_text):
                         matched_section = section_key
                         break
                 
@@ -1080,33 +1743,25 @@ class LLMParser:
                     # 如果之前正在收集其他部分的内容，保存它
                     if current_section and section_content:
                         sections[current_section] = section_content.strip()
-                        section_content = ""
                     
                     # 开始收集新部分
                     current_section = matched_section
                     
                     # 尝试不同方法获取此部分内容
-                    # 方法1：找到下一个heading元素前的所有内容
-                    if i < len(heading_elements) - 1:
-                        next_sibling = heading.find_next_sibling()
-                        while next_sibling and next_sibling != heading_elements[i+1]:
-                            if hasattr(next_sibling, "get_text"):
-                                section_content += next_sibling.get_text(strip=True) + " "
-                            next_sibling = next_sibling.next_sibling
-                    # 方法2：如果是最后一个标题，获取它之后的所有内容
-                    else:
-                        next_sibling = heading.find_next_sibling()
-                        while next_sibling:
-                            if hasattr(next_sibling, "get_text"):
-                                section_content += next_sibling.get_text(strip=True) + " "
-                            next_sibling = next_sibling.next_sibling
+                    # 方法1/2：收集其后的兄弟元素，直到下一个heading元素（最后一个标题则收集到末尾）
+                    next_heading = heading_elements[i + 1] if i < len(heading_elements) - 1 else None
+                    # 文本片段先收集到列表，最后一次拼接
+                    sibling_texts = []
+                    for sibling in heading.find_next_siblings():
+                        if sibling is next_heading:
+                            break
+                        sibling_texts.append(sibling.get_text(strip=True))
+                    section_content = " ".join(sibling_texts)
                     
                     # 方法3：查找列表内容
                     ul_element = heading.find_next("ul")
                     if ul_element:
-                        list_items = []
-                        for li in ul_element.find_all("li"):
-                            list_items.append("• " + li.get_text(strip=True))
+                        list_items = ["• " + li.get_text(strip=True) for li in ul_element.find_all("li")]
                         if list_items:
                             section_content = "\n".join(list_items)
             
@@ -1115,7 +1770,7 @@ class LLMParser:
                 sections[current_section] = section_content.strip()
             
             # 如果没有成功提取到结构化内容，尝试全文提取
-            if not any(k in sections for k in sections_mapping.keys()):
+            if not any(k in sections for k in SECTION_HEADING_KEYWORDS):
                 logger.warning("无法识别结构化内容，尝试全文提取")
                 
                 # 提取整个职位描述
@@ -1123,36 +1778,28 @@ class LLMParser:
                 sections["description"] = job_description
                 
                 # 使用启发式方法尝试识别部分
-                patterns = {
-                    "responsibilities": [
-                        r"(?:职责|工作职责|岗位职责|责任|Responsibilities|Duties|What You['']ll Do)[：:]\s*([\s\S]+?)(?=(?:要求|资格|技能|经验|福利|薪资|待遇|公司介绍|关于我们|Requirements|Qualifications|Skills|Experience|Benefits|About Us)[：:]|\Z)",
-                    ],
-                    "requirements": [
-                        r"(?:要求|资格|技能|经验|Requirements|Qualifications|Skills|Experience)[：:]\s*([\s\S]+?)(?=(?:职责|工作职责|岗位职责|责任|福利|薪资|待遇|公司介绍|关于我们|Responsibilities|Duties|Benefits|About Us)[：:]|\Z)",
-                    ],
-                    "benefits": [
-                        r"(?:福利|薪资|待遇|Benefits|Perks|What We Offer|Compensation)[：:]\s*([\s\S]+?)(?=(?:职责|工作职责|岗位职责|责任|要求|资格|技能|经验|公司介绍|关于我们|Responsibilities|Duties|Requirements|Qualifications|About Us)[：:]|\Z)",
-                    ],
-                    "company_info": [
-                        r"(?:公司介绍|关于我们|About Us|Company|Who We Are)[：:]\s*([\s\S]+?)(?=(?:职责|工作职责|岗位职责|责任|要求|资格|技能|经验|福利|薪资|待遇|Responsibilities|Duties|Requirements|Qualifications|Benefits)[：:]|\Z)",
-                    ]
-                }
-                
-                for section_key, regex_patterns in patterns.items():
-                    for pattern in regex_patterns:
-                        match = re.search(pattern, job_description, re.IGNORECASE)
-                        if match and match.group(1).strip():
-                            sections[section_key] = match.group(1).strip()
-                            break
+                for section_key, section_text in _split_text_sections(job_description).items():
+                    sections.setdefault(section_key, section_text)
             
             # 增强提取: 查找职位卡片中的额外信息
-            job_cards = soup.select(".job-card-job-posting-card-wrapper")
+            job_cards = elements.get("job_cards")
             if job_cards and "similar_jobs" not in sections:
                 similar_jobs = []
                 for card in job_cards[:5]:  # 限制为最多5个相似职位
-                    job_title_element = card.select_one(".job-card-job-posting-card-wrapper__title")
-                    company_element = card.select_one(".job-card-job-posting-card-wrapper__entity-lockup")
-                    location_element = card.select_one(".job-card-job-posting-card-wrapper__footer-item")
+                    # 单次遍历卡片子元素，取各字段class第一次出现的元素，找齐即停止
+                    card_fields = {}
+                    for element in card.descendants:
+                        if not isinstance(element, Tag):
+                            continue
+                        for class_name in element.get("class") or ():
+                            field = _JOB_CARD_FIELD_CLASSES.get(class_name)
+                            if field and field not in card_fields:
+                                card_fields[field] = element
+                        if len(card_fields) == len(_JOB_CARD_FIELD_CLASSES):
+                            break
+                    job_title_element = card_fields.get("title")
+                    company_element = card_fields.get("company")
+                    location_element = card_fields.get("location")
                     
                     if job_title_element:
                         job_info = {
@@ -1167,6 +1814,7 @@ class LLMParser:
                     logger.info(f"提取到{len(similar_jobs)}个相似职位")
             
             logger.info(f"从LinkedIn职位详情中提取了{len(sections)}个部分: {list(sections.keys())}")
+            self._linkedin_sections = sections
             return sections
             
         except Exception as e:
@@ -1199,8 +1847,8 @@ class LLMParser:
         }
         
         try:
-            # 预处理HTML
-            self.set_body_html(html_content)
+            # 预处理HTML，只有LinkedIn和Caterpillar页面需要DOM做结构化提取
+            self.set_body_html(html_content, parse_dom="linkedin.com/jobs" in job_url or "caterpillar.com" in job_url)
             
             # 检测页面类型
             if "linkedin.com/jobs" in job_url:
@@ -1215,35 +1863,36 @@ class LLMParser:
                     result['requirements'] = sections.get('qualifications', '')
                     result['responsibilities'] = sections.get('responsibilities', '')
                 
-                # 提取公司名称
-                company_name = self.extract_company_name()
+                # 合并提取公司名称、职位名称、地点、招聘者信息，以及（如果之前未成功提取）职位描述
+                field_names = ["company", "title", "location", "recruiter"]
+                if not result['description']:
+                    field_names.append("description")
+                fields = self.extract_job_fields(field_names)
+                
+                company_name = fields.get("company")
                 if company_name:
                     result['company'] = company_name
                     logger.info(f"提取的公司名称: {company_name}")
                 
-                # 提取职位名称
-                job_title = self.extract_role()
+                job_title = fields.get("title")
                 if job_title:
                     result['title'] = job_title
                     logger.info(f"提取的职位名称: {job_title}")
                 
-                # 提取地点
-                location = self.extract_location()
+                location = fields.get("location")
                 if location:
                     result['location'] = location
                     logger.info(f"提取的地点: {location}")
                 
-                # 提取职位描述（如果之前未成功提取）
                 if not result['description']:
-                    job_description = self.extract_job_description()
+                    job_description = fields.get("description")
                     if job_description:
                         result['description'] = job_description
                         # 只记录截断的描述用于日志
                         desc_preview = job_description[:100] + "..." if len(job_description) > 100 else job_description
                         logger.info(f"提取的职位描述(截断): {desc_preview}")
                 
-                # 提取招聘者信息
-                recruiter = self.extract_recruiter_info()
+                recruiter = fields.get("recruiter")
                 if recruiter:
                     result['recruiter'] = recruiter
                     logger.info(f"提取的招聘者信息: {recruiter}")
@@ -1256,14 +1905,15 @@ class LLMParser:
                     result['description'] = job_description
                     
                 # 提取其他信息...
-                company_name = self.extract_company_name() or "Caterpillar"
+                fields = self.extract_job_fields(["company", "title", "location"])
+                company_name = fields.get("company") or "Caterpillar"
                 result['company'] = company_name
                 
-                job_title = self.extract_role()
+                job_title = fields.get("title")
                 if job_title:
                     result['title'] = job_title
                 
-                location = self.extract_location()
+                location = fields.get("location")
                 if location:
                     result['location'] = location
             
@@ -1271,24 +1921,25 @@ class LLMParser:
             else:
                 logger.info("使用通用解析逻辑")
                 
-                # 提取基本信息
-                company_name = self.extract_company_name()
+                # 一次LLM调用提取基本信息和岗位要求
+                fields = self.extract_job_fields(["company", "title", "location", "description", "requirements"])
+                company_name = fields.get("company")
                 if company_name:
                     result['company'] = company_name
                     
-                job_title = self.extract_role()
+                job_title = fields.get("title")
                 if job_title:
                     result['title'] = job_title
                     
-                location = self.extract_location()
+                location = fields.get("location")
                 if location:
                     result['location'] = location
                     
-                job_description = self.extract_job_description()
+                job_description = fields.get("description")
                 if job_description:
                     result['description'] = job_description
                     
-                job_requirements = self.extract_job_requirements()
+                job_requirements = fields.get("requirements") or self.extract_job_requirements()
                 if job_requirements:
                     result['requirements'] = job_requirements
             
@@ -1337,16 +1988,10 @@ class LLMParser:
             if not url:
                 return ""
             
-            # 移除http://和https://
-            clean_url = url.lower()
-            if clean_url.startswith('http'):
-                parts = clean_url.split('://', 1)
-                if len(parts) > 1:
-                    clean_url = parts[1]
-            
-            # 提取域名部分
-            domain_parts = clean_url.split('/', 1)
-            domain = domain_parts[0] if domain_parts else ""
+            # 解析域名和路径（缺少协议时补上，否则域名会被当作路径）
+            split_url = urlsplit(url if '://' in url else 'http://' + url)
+            domain = split_url.hostname or ""
+            path = split_url.path.lower()
             
             # 移除www.前缀
             if domain.startswith('www.'):
@@ -1358,8 +2003,8 @@ class LLMParser:
             # 处理不同的域名模式
             if "linkedin.com" in domain:
                 # 如果是LinkedIn，尝试从URL路径提取公司
-                if 'company/' in clean_url:
-                    company_path = clean_url.split('company/', 1)[1]
+                if 'company/' in path:
+                    company_path = path.split('company/', 1)[1]
                     company = company_path.split('/', 1)[0] if '/' in company_path else company_path
                     # 将连字符替换为空格
                     company = company.replace('-', ' ').title()
@@ -1373,8 +2018,7 @@ class LLMParser:
                     company = parts[-2]  # 取倒数第二个部分，例如example.com中的example
                     
                     # 常见的不代表公司名称的域名
-                    common_domains = ['careers', 'jobs', 'career', 'job', 'work', 'apply']
-                    if company.lower() in common_domains and len(parts) >= 3:
+                    if company in _COMMON_DOMAINS and len(parts) >= 3:
                         company = parts[-3]  # 取倒数第三个部分
                 
                 # 格式化公司名称
@@ -1396,9 +2040,10 @@ class LLMParser:
             str: 提取的职位描述
         """
         try:
-            from bs4 import BeautifulSoup
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
+            if html_content is self.body_html:
+                soup = self._get_soup()
+            else:
+                soup = BeautifulSoup(_HTML_NON_TEXT_PATTERN.sub('', html_content), HTML_PARSER)
             
             # Caterpillar特定的职位描述容器
             description = ""
@@ -1428,15 +2073,17 @@ class LLMParser:
                             break
             
             # 如果上面的方法失败，尝试查找包含特定关键词的段落
+            relevant_paragraphs = []
             if not description:
-                keywords = ["职位描述", "工作职责", "岗位要求", "job description", "responsibilities", "requirements", "qualifications"]
-                
-                paragraphs = soup.find_all(['p', 'div', 'li', 'span'])
-                relevant_paragraphs = []
+                # 先用正则找出包含关键词的文本节点，其所在的p/div/li/span祖先即为包含关键词的段落，
+                # 避免对每个元素调用get_text
+                paragraphs = {}
+                for keyword_string in soup.find_all(string=_CATERPILLAR_KEYWORD_PATTERN):
+                    for ancestor in keyword_string.parents:
+                        if ancestor.name in _CATERPILLAR_PARAGRAPH_TAGS:
+                            paragraphs.setdefault(id(ancestor), ancestor)
                 
-                for p in paragraphs:
-                    text = p.get_text().strip().lower()
-                    if text and any(keyword.lower() in text for keyword in keywords):
+                for p in paragraphs.values():
                         # 找到匹配的段落后，尝试获取其父元素或后续元素
                         parent = p.parent
                         if parent:
@@ -1445,11 +2092,11 @@ class LLMParser:
                                 relevant_paragraphs.append(parent_text)
                         
                         # 或者获取之后的同级元素
-                        next_siblings = list(p.next_siblings)
-                        if next_siblings:
-                            siblings_text = '\n'.join([sib.get_text().strip() for sib in next_siblings if hasattr(sib, 'get_text') and sib.get_text().strip()])
-                            if len(siblings_text) > 100:
-                                relevant_paragraphs.append(siblings_text)
+                        # 每个同级元素只取一次文本，空文本直接过滤
+                        sibling_texts = (sib.get_text().strip() for sib in p.next_siblings if hasattr(sib, 'get_text'))
+                        siblings_text = '\n'.join(filter(None, sibling_texts))
+                        if len(siblings_text) > 100:
+                            relevant_paragraphs.append(siblings_text)
             
             # 选择最长的相关段落
             if relevant_paragraphs:
@@ -1461,26 +2108,46 @@ class LLMParser:
             return ""
 
     def extract_job_requirements(self) -> str:
-        """从职位描述中提取岗位要求"""
+        """
+        从职位描述中提取岗位要求
+        
+        通用页面的岗位要求已随公司、职位等字段在一次JSON提取中得到，这里优先复用；
+        只有合并提取没有结果时才单独调用LLM。
+        """
         logger.info("提取岗位要求")
         
         if not self.body_html:
             logger.warning("HTML内容为空，无法提取岗位要求")
             return ""
-            
-        # 使用BeautifulSoup清理HTML
-        try:
-            soup = BeautifulSoup(self.body_html, 'html.parser')
-            text = soup.get_text()
-            clean_text = ' '.join(text.split())
-        except Exception as e:
-            logger.error(f"解析HTML时出错: {str(e)}")
-            clean_text = self.body_html
+        
+        # 合并提取时已得到岗位要求则直接复用
+        _, retrieval_query, question = JOB_FIELDS["requirements"]
+        cached = self._extraction_cache.get((question, retrieval_query))
+        if cached:
+            return cached
+            
+        # 复用set_body_html提取的正文，没有时直接去标签而不解析DOM；压缩空白时只处理截断长度以内的部分
+        source_text = self._page_text if self._page_text is not None else _html_to_text(self.body_html)
+        words = []
+        length = -1
+        for word in _NON_WHITESPACE_PATTERN.finditer(source_text):
+            words.append(word.group())
+            length += len(words[-1]) + 1
+            if length > REQUIREMENTS_TEXT_LIMIT:
+                break
+        clean_text = ' '.join(words)
             
         # 处理过长的文本
-        if len(clean_text) > 4000:
-            logger.warning(f"文本过长 ({len(clean_text)} 字符)，将被截断")
-            clean_text = clean_text[:4000]
+        if len(clean_text) > REQUIREMENTS_TEXT_LIMIT:
+            logger.warning(f"文本过长 ({len(source_text)} 字符)，将被截断")
+            clean_text = clean_text[:REQUIREMENTS_TEXT_LIMIT]
+        
+        if len(clean_text) < REQUIREMENTS_MIN_TEXT_LENGTH:
+            logger.info(f"正文过短 ({len(clean_text)} 字符)，不像职位页面，跳过岗位要求提取")
+            return ""
+        if len(clean_text) < BOILERPLATE_PAGE_MAX_LENGTH and _BOILERPLATE_PAGE_PATTERN.search(clean_text):
+            logger.info("页面疑似登录页或错误页，跳过岗位要求提取")
+            return ""
         
         # 构造提示
         prompt = f"""
@@ -1495,79 +2162,11 @@ class LLMParser:
         {clean_text}
         """
         
-        max_tokens = 500
-        temperature = 0.5
-        
-        # 根据模型类型进行不同的调用
-        try:
-            if self.model_type == "openai":
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "system", "content": "你是一位专业的职位分析专家，擅长提取和总结职位信息。请提供简洁、准确和有用的回答。"},
-                              {"role": "user", "content": prompt}],
-                    max_tokens=max_tokens,
-                    temperature=temperature
-                )
-                return response.choices[0].message.content.strip()
-            
-            elif self.model_type == "anthropic":
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    system="你是一位专业的职位分析专家，擅长提取和总结职位信息。请提供简洁、准确和有用的回答。",
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                return response.content[0].text.strip()
-            
-            elif self.model_type == "gemini":
-                # 使用langchain接口调用Gemini
-                system_prompt = "你是一位专业的职位分析专家，擅长提取和总结职位信息。请提供简洁、准确和有用的回答。"
-                user_prompt = prompt
-                
-                from langchain_core.messages import SystemMessage, HumanMessage
-                messages = [
-                    SystemMessage(content=system_prompt),
-                    HumanMessage(content=user_prompt)
-                ]
-                
-                try:
-                    response = self.llm.invoke(messages)
-                    if hasattr(response, "content"):
-                        return response.content.strip()
-                    else:
-                        return str(response).strip()
-                except Exception as e:
-                    logger.error(f"调用Gemini API时出错: {str(e)}")
-                    return "无法提取岗位要求：API调用失败"
-            
-            elif self.model_type == "ollama":
-                # 使用langchain接口调用Ollama
-                from langchain_core.messages import SystemMessage, HumanMessage
-                messages = [
-                    SystemMessage(content="你是一位专业的职位分析专家，擅长提取和总结职位信息。请提供简洁、准确和有用的回答。"),
-                    HumanMessage(content=prompt)
-                ]
-                
-                try:
-                    response = self.llm.invoke(messages)
-                    if hasattr(response, "content"):
-                        return response.content.strip()
-                    else:
-                        return str(response).strip()
-                except Exception as e:
-                    logger.error(f"调用Ollama API时出错: {str(e)}")
-                    return "无法提取岗位要求：API调用失败"
-            
-            else:
-                logger.error(f"不支持的模型类型: {self.model_type}")
-                return "不支持的模型类型"
-            
-        except Exception as e:
-            logger.error(f"生成文本时出错: {str(e)}")
-            return ""
+        return self._generate_text(prompt, max_tokens=REQUIREMENTS_MAX_TOKENS, temperature=0.5,
+                                   stop=REQUIREMENTS_STOP_SEQUENCES)
 
-    def _generate_text(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.3) -> str:
+    def _generate_text(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.3,
+                       stop: Optional[List[str]] = None) -> str:
         """
         使用LLM生成文本
         
@@ -1575,39 +2174,39 @@ class LLMParser:
             prompt: 提示词
             max_tokens: 最大生成令牌数
             temperature: 温度参数，控制随机性
+            stop: 停止序列，模型输出其中任一序列时结束生成
             
         Returns:
             str: 生成的文本
         """
+        build_kwargs = _GENERATION_KWARGS.get(self.model_type)
+        if build_kwargs is None:
+            logger.error(f"不支持的模型类型: {self.model_type}")
+            return ""
+        generation_kwargs = build_kwargs(max_tokens, temperature, stop)
+        
+        # 相同模型、生成参数和提示词的结果直接复用缓存；键只包含实际传给模型的参数
+        input_hash = make_input_hash(self.model_type, self.model_name,
+                                     json.dumps(generation_kwargs, sort_keys=True, ensure_ascii=False), prompt)
+        cached = check_cache(input_hash, PROMPT_VERSION, self.model_name)
+        if cached is not None:
+            return cached
+        
         try:
-            if self.model_type == "openai":
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "system", "content": "你是一位专业的职位分析专家，擅长提取和总结职位信息。请提供简洁、准确和有用的回答。"},
-                              {"role": "user", "content": prompt}],
-                    max_tokens=max_tokens,
-                    temperature=temperature
-                )
-                return response.choices[0].message.content.strip()
-            
-            elif self.model_type == "anthropic":
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    system="你是一位专业的职位分析专家，擅长提取和总结职位信息。请提供简洁、准确和有用的回答。",
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                return response.content[0].text.strip()
-            
-            else:
-                logger.error(f"不支持的模型类型: {self.model_type}")
-                return ""
-            
+            messages = [JOB_ANALYST_SYSTEM_CHAT_MESSAGE, HumanMessage(content=prompt)]
+            response = self.llm.bind(**generation_kwargs).invoke(messages)
+            content = getattr(response, "content", None)
+            text = content if content is not None else str(response)
+            return self._remember_response(input_hash, text.strip())
         except Exception as e:
             logger.error(f"生成文本时出错: {str(e)}")
             return ""
 
+    def _remember_response(self, input_hash: str, response: str) -> str:
+        """把成功的LLM响应写入缓存并原样返回"""
+        save_to_cache(input_hash, PROMPT_VERSION, self.model_name, response)
+        return response
+
     def _generate_job_summary(self, job_data: Dict[str, str]) -> str:
         """
         生成职位摘要
@@ -1649,29 +2248,22 @@ class LLMParser:
 """
             
             # 生成摘要
-            summary = self._generate_text(prompt, max_tokens=200, temperature=0.2)
+            summary = self._generate_text(prompt, max_tokens=SUMMARY_MAX_TOKENS, temperature=0.2)
             
             # 清理生成的摘要
             summary = summary.strip()
-            summary = re.sub(r'\n+', '\n', summary)  # 删除多余换行
+            summary = _MULTI_NEWLINE_PATTERN.sub('\n', summary)  # 删除多余换行
             
             # 如果摘要以职位标题开头，可能是重复信息，尝试删除
-            if summary.lower().startswith(job_title.lower()) or summary.lower().startswith(company_name.lower()):
-                # 尝试提取更精炼的部分
-                lines = summary.split('\n')
-                if len(lines) > 1:
-                    summary = '\n'.join(lines[1:])
+            if summary.lower().startswith((job_title.lower(), company_name.lower())):
+                # 尝试提取更精炼的部分：去掉第一行
+                first_newline = summary.find('\n')
+                if first_newline != -1:
+                    summary = summary[first_newline + 1:]
             
             # 如果摘要太长，尝试截断并保持完整句子
             if len(summary) > 200:
-                sentences = re.split(r'(?<=[.!?])\s+', summary)
-                truncated_summary = ""
-                for sentence in sentences:
-                    if len(truncated_summary) + len(sentence) <= 200:
-                        truncated_summary += sentence + " "
-                    else:
-                        break
-                summary = truncated_summary.strip()
+                summary = _truncate_sentences(summary, 200)
             
             return summary
             
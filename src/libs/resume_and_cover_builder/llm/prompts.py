@@ -1,8 +1,64 @@
 """
 提示词模板模块，包含各种用于简历和求职信生成的提示词。
 """
+import string
+from functools import lru_cache
+
+from langchain_core.prompts import ChatPromptTemplate
+
+
+@lru_cache(maxsize=None)
+def _compile_template(template):
+    """
+    把模板解析为(文本片段, 字段名)序列，每个模板只解析一次
+
+    Returns:
+        Optional[tuple]: 解析结果；模板包含格式说明、转换或属性访问等复杂字段时返回None
+    """
+    segments = []
+    for literal, field, format_spec, conversion in string.Formatter().parse(template):
+        if field is not None and (format_spec or conversion or not field.isidentifier()):
+            return None
+        segments.append((literal, field))
+    return tuple(segments)
+
+
+def render_prompt(template: str, values: dict) -> str:
+    """
+    用values填充模板中的{字段}，结果与template.format(**values)相同
+
+    Args:
+        template: 提示词模板
+        values: 字段名到值的映射
+
+    Returns:
+        str: 填充后的提示词
+
+    Raises:
+        KeyError: 模板中的字段在values中不存在
+    """
+    segments = _compile_template(template)
+    if segments is None:
+        return template.format_map(values)
+    parts = []
+    for literal, field in segments:
+        parts.append(literal)
+        if field is not None:
+            parts.append(str(values[field]))
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def chat_prompt_from_template(template: str) -> ChatPromptTemplate:
+    """
+    返回模板对应的ChatPromptTemplate，同一模板只解析一次
+
+    strings_feder_cr等模块中的提示词在每次生成时都会用到，
+    ChatPromptTemplate创建后不会被修改，可以在多次调用间共享。
+    """
+    return ChatPromptTemplate.from_template(template)
+
 
-# 简历优化提示词
 RESUME_OPTIMIZATION_PROMPT = """
 你是一位专业的简历优化专家，擅长根据职位描述定制简历。请根据以下职位描述，优化候选人的简历：
 
@@ -121,4 +177,17 @@ LINKEDIN_SYSTEM_PROMPT = """
 - About the Company / About Us / 关于公司 / 关于我们
 
 对于特定问题，根据上下文给出简洁、准确的回答，避免生成模板化回复。
-""" 
\ No newline at end of file
+""" 
+# 职位字段合并提取提示词，一次调用提取多个字段并以JSON返回
+JOB_FIELDS_EXTRACTION_PROMPT = """
+从以下职位描述中提取指定字段：
+
+职位描述内容:
+{context}
+
+需要提取的字段:
+{fields}
+
+请只返回一个JSON对象，键为上面列出的字段名，值为提取到的字符串，不要添加解释或多余的信息。
+如果某个字段的信息不在上下文中，对应的值请填写"未提供"。
+"""
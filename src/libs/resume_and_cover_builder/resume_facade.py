@@ -4,6 +4,7 @@ This module contains the FacadeManager class, which is responsible for managing
 # app/libs/resume_and_cover_builder/manager_facade.py
 import hashlib
 import inquirer
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 import re
@@ -14,7 +15,7 @@ from src.libs.resume_and_cover_builder.llm.llm_job_parser import LLMParser
 from src.job import Job
 from src.utils.chrome_utils import HTML_to_PDF
 from .config import global_config
-from src.style_manager import StyleManager
+from src.libs.resume_and_cover_builder.style_manager import StyleManager
 from src.utils.chrome_utils import browser_manager
 from src.logging import logger
 from src.resume_schemas.resume import Resume
@@ -22,7 +23,36 @@ from src.libs.resume_and_cover_builder.resume_generator import ResumeGenerator
 import config as cfg
 import os
 import time
-import random
+
+# 从LinkedIn职位URL中提取职位ID
+_JOB_ID_PATTERN = re.compile(r'view/(\d+)')
+
+# 无法访问职位页面时使用的模拟职位描述
+_MOCK_JOB_DESCRIPTION = """这是一个模拟的职位描述，由于无法访问实际的职位页面而生成。
+            
+            职位要求:
+            - 熟练掌握编程语言（如Python、Java或C++）
+            - 具有良好的沟通能力和团队协作精神
+            - 有解决复杂问题的能力
+            - 熟悉软件开发流程
+            
+            我们提供:
+            - 有竞争力的薪资
+            - 灵活的工作时间
+            - 职业发展机会
+            - 友好的工作环境
+            """
+
+
+@lru_cache(maxsize=256)
+def _job_link_hash(link: str) -> str:
+    """
+    根据职位链接生成输出文件名使用的短哈希，同一职位的简历和求职信共用
+    
+    继续使用md5以保持与已生成输出目录的命名一致。
+    """
+    return hashlib.md5(link.encode()).hexdigest()[:10]
+
 
 class ResumeFacade:
     def __init__(
@@ -58,6 +88,8 @@ class ResumeFacade:
         self.debug = debug
         self.driver = None
         self.job_info = {}
+        # 本次会话已解析的职位信息，按职位链接缓存，同一职位生成简历和求职信时不重复抓取
+        self._job_cache: Dict[str, Dict[str, Any]] = {}
         self.job_description_full = None
         self.selected_style = None  # Property to store the selected style
         
@@ -78,6 +110,15 @@ class ResumeFacade:
     def set_driver(self, driver):
          self.driver = driver
 
+    def _ensure_driver(self):
+        """返回生成PDF使用的浏览器驱动，首次使用时初始化浏览器"""
+        if self.driver is None:
+            if not browser_manager.is_initialized:
+                logger.info("浏览器未初始化，正在初始化...")
+                browser_manager.initialize_browser()
+            self.driver = browser_manager.driver
+        return self.driver
+
     def prompt_user(self, choices: list[str], message: str) -> str:
         """
         Prompt the user with the given message and choices.
@@ -109,15 +150,22 @@ class ResumeFacade:
     def link_to_job(self, job_url: str) -> Dict[str, Any]:
         """从职位链接获取职位信息"""
         try:
-            # 初始化LLM解析器
-            self.llm_job_parser = LLMParser(
-                api_key=global_config.API_KEY,
-                model_type=global_config.MODEL_TYPE,
-                model=global_config.MODEL
-            )
+            # 初始化LLM解析器，多次调用时复用同一个解析器
+            if getattr(self, "llm_job_parser", None) is None:
+                self.llm_job_parser = LLMParser(
+                    api_key=global_config.API_KEY,
+                    model_type=global_config.MODEL_TYPE,
+                    model=global_config.MODEL
+                )
             
-            # 获取职位信息
-            job_info = self.llm_job_parser.parse_job(job_url)
+            # 获取职位信息，已解析过的链接直接复用；获取失败时得到的模拟数据不缓存，下次调用重新获取
+            job_info = self._job_cache.get(job_url)
+            if job_info is None:
+                job_info = self.llm_job_parser.parse_job(job_url)
+                if job_info and not job_info.get('is_mock'):
+                    self._job_cache[job_url] = job_info
+            else:
+                logger.debug(f"复用已缓存的职位信息: {job_url}")
             logger.info(f"成功获取职位信息: {job_info.get('title', '未知职位')}")
             
             # 更新职位对象
@@ -147,31 +195,17 @@ class ResumeFacade:
             return mock_data
             
     def _create_mock_job_data(self, job_url: str) -> Dict[str, Any]:
-        """创建模拟职位数据"""
-        # 从URL中提取一些信息
-        job_id = re.search(r'view/(\d+)', job_url)
+        """创建模拟职位数据，同一链接总是得到相同的结果"""
+        # 从URL中提取职位ID
+        job_id = _JOB_ID_PATTERN.search(job_url)
         job_id = job_id.group(1) if job_id else "未知ID"
         
         logger.warning(f"创建模拟数据，职位ID: {job_id}")
         
-        # 根据ID生成一些随机数据
         return {
             "title": f"模拟职位 #{job_id[:4] if job_id != '未知ID' else '0000'}",
             "company": "模拟公司",
-            "description": """这是一个模拟的职位描述，由于无法访问实际的职位页面而生成。
-            
-            职位要求:
-            - 熟练掌握编程语言（如Python、Java或C++）
-            - 具有良好的沟通能力和团队协作精神
-            - 有解决复杂问题的能力
-            - 熟悉软件开发流程
-            
-            我们提供:
-            - 有竞争力的薪资
-            - 灵活的工作时间
-            - 职业发展机会
-            - 友好的工作环境
-            """,
+            "description": _MOCK_JOB_DESCRIPTION,
             "location": "远程",
             "recruiter": "模拟招聘人员",
             "url": job_url
@@ -193,20 +227,10 @@ class ResumeFacade:
         html_resume = self.resume_generator.create_resume_job_description_text(style_path, self.job.description)
 
         # Generate a unique name using the job URL hash
-        suggested_name = hashlib.md5(self.job.link.encode()).hexdigest()[:10]
+        suggested_name = _job_link_hash(self.job.link)
         
-        # 确保浏览器已初始化
-        from src.utils.chrome_utils import HTML_to_PDF, browser_manager
-        
-        # 如果浏览器未初始化，则初始化它
-        if not hasattr(self, 'driver') or self.driver is None:
-            if not browser_manager.is_initialized:
-                logger.info("浏览器未初始化，正在初始化...")
-                browser_manager.initialize_browser()
-            self.driver = browser_manager.driver
-            
         try:
-            result = HTML_to_PDF(html_resume, self.driver)
+            result = HTML_to_PDF(html_resume, self._ensure_driver())
             return result, suggested_name
         except Exception as e:
             logger.error(f"PDF生成失败: {str(e)}")
@@ -235,18 +259,8 @@ class ResumeFacade:
         
         html_resume = self.resume_generator.create_resume(style_path)
         
-        # 确保浏览器已初始化
-        from src.utils.chrome_utils import HTML_to_PDF, browser_manager
-        
-        # 如果浏览器未初始化，则初始化它
-        if not hasattr(self, 'driver') or self.driver is None:
-            if not browser_manager.is_initialized:
-                logger.info("浏览器未初始化，正在初始化...")
-                browser_manager.initialize_browser()
-            self.driver = browser_manager.driver
-        
         try:
-            result = HTML_to_PDF(html_resume, self.driver)
+            result = HTML_to_PDF(html_resume, self._ensure_driver())
             # 生成唯一文件名
             suggested_name = "resume_base"
             return result, suggested_name
@@ -295,21 +309,11 @@ class ResumeFacade:
         cover_letter_html = self.resume_generator.create_cover_letter_job_description(style_path, self.job.description)
 
         # Generate a unique name using the job URL hash
-        suggested_name = hashlib.md5(self.job.link.encode()).hexdigest()[:10]
+        suggested_name = _job_link_hash(self.job.link)
 
-        # 确保浏览器已初始化
-        from src.utils.chrome_utils import HTML_to_PDF, browser_manager
-        
-        # 如果浏览器未初始化，则初始化它
-        if not hasattr(self, 'driver') or self.driver is None:
-            if not browser_manager.is_initialized:
-                logger.info("浏览器未初始化，正在初始化...")
-                browser_manager.initialize_browser()
-            self.driver = browser_manager.driver
-        
         try:
             logger.info("开始将HTML转换为PDF...")
-            result = HTML_to_PDF(cover_letter_html, self.driver)
+            result = HTML_to_PDF(cover_letter_html, self._ensure_driver())
             logger.info(f"PDF生成成功，大小: {len(result)/1024:.2f} KB")
             return result, suggested_name
         except Exception as e:
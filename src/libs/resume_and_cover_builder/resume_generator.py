@@ -2,24 +2,199 @@
 This module is responsible for generating resumes and cover letters using the LLM model.
 """
 # app/libs/resume_and_cover_builder/resume_generator.py
-import json
 import yaml
+from functools import lru_cache
 from string import Template
-from typing import Any, Dict, Optional
+from typing import Dict, Optional
 from pathlib import Path
 import os
+import re
 from src.libs.resume_and_cover_builder.llm.llm_generate_resume import LLMResumer
 from src.libs.resume_and_cover_builder.llm.llm_generate_resume_from_job import LLMResumeJobDescription
 from src.libs.resume_and_cover_builder.llm.llm_generate_cover_letter_from_job import LLMCoverLetterJobDescription
+from src.libs.resume_and_cover_builder.llm.cache import PROMPT_VERSION, check_cache, make_input_hash, save_to_cache
 from .module_loader import load_module
 from .config import global_config
 from loguru import logger
 
+# 优先使用libyaml的C实现加载和导出YAML，PyYAML未带libyaml编译时回退到纯Python实现。
+# 导出使用非safe的Dumper，与之前yaml.dump的默认行为一致
+try:
+    from yaml import CSafeLoader as _SafeLoader, CDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, Dumper as _Dumper
+
+# 去除推理模型输出中的思考部分：先去掉完整的<think>块，再去掉未闭合的<think>到结尾
+_THINK_BLOCK_PATTERN = re.compile(r'<think>.*?</think>', re.DOTALL)
+_UNCLOSED_THINK_PATTERN = re.compile(r'<think>.*', re.DOTALL)
+
+# 简历正文缓存的最大条目数
+BODY_CACHE_MAX_ENTRIES = 16
+
+# 求职信正文外层的HTML结构，正文插入在前后两段之间
+_COVER_LETTER_PREFIX = """
+                <div class="cover-letter">
+                    <div class="header">
+                        <h1>求职信</h1>
+                    </div>
+                    <div class="content">
+                        """
+_COVER_LETTER_SUFFIX = """
+                    </div>
+                </div>
+                """
+
+# 求职信在简历样式之外追加的样式
+_COVER_LETTER_EXTRA_CSS = """
+                /* 求职信特定样式 */
+                .cover-letter {
+                    max-width: 800px;
+                    margin: 0 auto;
+                    padding: 20px;
+                    font-family: inherit;
+                }
+                .cover-letter .header {
+                    margin-bottom: 30px;
+                    text-align: center;
+                }
+                .cover-letter .header h1 {
+                    margin-bottom: 10px;
+                    color: inherit;
+                }
+                .cover-letter .content {
+                    line-height: 1.6;
+                    text-align: justify;
+                }
+                .cover-letter p {
+                    margin-bottom: 15px;
+                }
+                .cover-letter h3, .cover-letter h4 {
+                    margin-top: 20px;
+                    margin-bottom: 10px;
+                }
+                .cover-letter ul {
+                    padding-left: 20px;
+                    margin-bottom: 15px;
+                }
+                .cover-letter li {
+                    margin-bottom: 5px;
+                }
+            """
+
+
+@lru_cache(maxsize=16)
+def _read_css(path: str, mtime: float) -> str:
+    """读取样式文件，以路径和修改时间为键缓存，文件修改后会重新读取"""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=4)
+def _get_html_template(template_text: str) -> Template:
+    """返回HTML模板对象，同一模板文本只构建一次"""
+    return Template(template_text)
+
+
+@lru_cache(maxsize=4)
+def _load_strings_module(path: str, name: str, mtime: float):
+    """导入提示词字符串模块，以路径和修改时间为键缓存"""
+    return load_module(path, name)
+
+
+def _load_strings(strings_path, name: str):
+    """返回提示词字符串模块，同一文件未修改时只执行一次"""
+    return _load_strings_module(str(strings_path), name, os.path.getmtime(strings_path))
+
+
+def _load_style_css(style_path) -> str:
+    """返回样式文件内容，同一文件未修改时只读取一次"""
+    return _read_css(str(style_path), os.path.getmtime(style_path))
+
+
+
+def _iter_responsibilities(responsibilities):
+    """逐条返回职责描述，兼容单键字典列表（YAML中的responsibility: ...）和已展平的字符串列表"""
+    for item in responsibilities or ():
+        if isinstance(item, dict):
+            yield from item.values()
+        else:
+            yield item
+
+
+def _format_personal_information(personal):
+    return (f"{key}: {value}" for key, value in personal.items())
+
+
+def _format_education(education):
+    return (" | ".join(f"{key}: {value}" for key, value in edu.items()) for edu in education)
+
+
+def _format_experience(experience):
+    for exp in experience:
+        yield f"职位: {exp.get('position', '未知职位')}"
+        yield f"公司: {exp.get('company', '未知公司')}"
+        yield f"时间: {exp.get('employment_period', '未知时间')}"
+        
+        # 主要职责
+        if 'key_responsibilities' in exp:
+            yield "主要职责:"
+            yield from (f"- {desc}" for desc in _iter_responsibilities(exp['key_responsibilities']))
+        
+        # 获得的技能
+        if 'skills_acquired' in exp:
+            yield "技能:"
+            yield ", ".join(exp['skills_acquired'])
+        
+        yield ""
+
+
+def _format_projects(projects):
+    for proj in projects:
+        yield f"项目名称: {proj.get('name', '未知项目')}"
+        yield f"描述: {proj.get('description', '无描述')}"
+        if 'link' in proj and proj['link'] != 'N/A':
+            yield f"链接: {proj['link']}"
+        yield ""
+
+
+def _format_languages(languages):
+    return (f"{lang.get('language', '未知语言')}: {lang.get('proficiency', '未知水平')}" for lang in languages)
+
+
+def _format_comma_list(items):
+    return (", ".join(items),)
+
+
+# 简历提示词的各个部分：(简历字段, 标题行, 格式化函数)，格式化函数返回该部分的各行
+_RESUME_PROMPT_SECTIONS = (
+    ('personal_information', "## 个人信息", _format_personal_information),
+    ('education_details', "\n## 教育经历", _format_education),
+    ('experience_details', "\n## 工作经历", _format_experience),
+    ('projects', "\n## 项目经历", _format_projects),
+    ('skills', "\n## 技能", _format_comma_list),
+    ('languages', "\n## 语言", _format_languages),
+    ('interests', "\n## 兴趣爱好", _format_comma_list),
+)
+
+
 class ResumeGenerator:
     def __init__(self):
         self.resume_object = None
+        # 简历数据在进程内基本不变，缓存其文本形式；更换简历对象时清空
+        self._yaml_text_cache: Optional[str] = None
+        self._formatted_prompt_cache: Optional[str] = None
+        # 上次解析的简历文件修改时间及结果，文件未变化时重新加载无需再解析YAML
+        self._resume_file_mtime: Optional[float] = None
+        self._loaded_resume_data = None
+        # 本次会话已生成的简历正文和求职信，按缓存键保存，换用其他样式时不再调用LLM
+        self._body_cache: Dict[str, str] = {}
         self.load_resume_data()
     
+    def _invalidate_resume_caches(self):
+        """简历对象变化后清空文本缓存"""
+        self._yaml_text_cache = None
+        self._formatted_prompt_cache = None
+    
     def load_resume_data(self):
         """从yaml文件加载简历数据"""
         # 尝试寻找简历文件
@@ -28,29 +203,44 @@ class ResumeGenerator:
         if not resume_path.exists():
             logger.warning(f"找不到简历文件: {resume_path}，将使用空简历")
             self.resume_object = {}
+            self._invalidate_resume_caches()
             return
         
         try:
+            mtime = resume_path.stat().st_mtime
+            if mtime == self._resume_file_mtime and self._loaded_resume_data is not None:
+                logger.debug("简历文件未变化，复用已解析的数据: {}", resume_path)
+                if self.resume_object is not self._loaded_resume_data:
+                    self.resume_object = self._loaded_resume_data
+                    self._invalidate_resume_caches()
+                return
+            
             # 读取并解析YAML文件
-            with open(resume_path, 'r', encoding='utf-8') as f:
-                resume_data = yaml.safe_load(f)
+            resume_data = yaml.load(resume_path.read_bytes(), Loader=_SafeLoader)
             
             logger.info(f"成功加载简历数据: {resume_path}")
             self.resume_object = resume_data
+            self._resume_file_mtime = mtime
+            self._loaded_resume_data = resume_data
         except Exception as e:
             logger.error(f"加载简历数据失败: {str(e)}")
             self.resume_object = {}
+        self._invalidate_resume_caches()
     
     def set_resume_object(self, resume_object):
         """设置要使用的简历对象"""
         if resume_object:
             self.resume_object = resume_object
-            logger.debug(f"简历对象已设置: {type(resume_object)}")
+            self._invalidate_resume_caches()
+            logger.debug("简历对象已设置: {}", type(resume_object))
         else:
             logger.warning("尝试设置空简历对象，保持使用已加载的简历数据")
          
     def _convert_resume_to_text(self):
         """将简历对象转换为文本格式"""
+        if self._yaml_text_cache is not None:
+            return self._yaml_text_cache
+        
         if not self.resume_object:
             logger.warning("简历对象为空，加载默认简历数据")
             self.load_resume_data()
@@ -61,15 +251,16 @@ class ResumeGenerator:
             
         try:
             # 将字典转换为YAML格式的字符串
-            resume_text = yaml.dump(self.resume_object, default_flow_style=False, allow_unicode=True)
-            logger.debug(f"简历对象已转换为文本，长度: {len(resume_text)} 字符")
+            resume_text = yaml.dump(self.resume_object, Dumper=_Dumper, default_flow_style=False, allow_unicode=True)
+            logger.debug("简历对象已转换为文本，长度: {} 字符", len(resume_text))
+            self._yaml_text_cache = resume_text
             return resume_text
         except Exception as e:
             logger.error(f"将简历对象转换为文本时出错: {str(e)}")
             # 尝试使用字符串转换
             try:
                 resume_text = str(self.resume_object)
-                logger.debug(f"使用str()转换简历对象，长度: {len(resume_text)} 字符")
+                logger.debug("使用str()转换简历对象，长度: {} 字符", len(resume_text))
                 return resume_text
             except:
                 logger.error("无法将简历对象转换为文本")
@@ -77,6 +268,9 @@ class ResumeGenerator:
 
     def _format_resume_for_prompt(self):
         """格式化简历数据，使其更适合LLM提示"""
+        if self._formatted_prompt_cache is not None:
+            return self._formatted_prompt_cache
+        
         if not self.resume_object:
             logger.warning("简历对象为空，加载默认简历数据")
             self.load_resume_data()
@@ -86,100 +280,38 @@ class ResumeGenerator:
             return "未提供简历信息"
         
         try:
-            # 检查resume_object是否为Resume类的实例
-            if hasattr(self.resume_object, 'to_dict'):
-                # 如果是Resume对象，使用to_dict方法转换为字典
-                resume_dict = self.resume_object.to_dict()
-                logger.debug("已将Resume对象转换为字典格式")
-            elif isinstance(self.resume_object, dict):
-                # 如果已经是字典，直接使用
-                resume_dict = self.resume_object
+            resume_object = self.resume_object
+            # 从YAML加载的简历是普通字典，最常见，先按精确类型判断
+            if type(resume_object) is dict:
+                resume_dict = resume_object
                 logger.debug("使用现有的字典格式简历数据")
-            elif hasattr(self.resume_object, '__str__'):
-                # 如果是其他可转换为字符串的对象
-                resume_text = str(self.resume_object)
-                logger.debug(f"使用__str__方法转换简历对象，长度: {len(resume_text)} 字符")
-                return resume_text
             else:
-                # 无法处理的类型
-                logger.warning(f"无法处理的简历对象类型: {type(self.resume_object)}")
-                return "无法处理的简历格式"
+                to_dict = getattr(resume_object, 'to_dict', None)
+                if to_dict is not None:
+                    # 如果是Resume对象，使用to_dict方法转换为字典
+                    resume_dict = to_dict()
+                    logger.debug("已将Resume对象转换为字典格式")
+                elif isinstance(resume_object, dict):
+                    resume_dict = resume_object
+                    logger.debug("使用现有的字典格式简历数据")
+                else:
+                    # 其他对象直接使用字符串表示
+                    resume_text = str(resume_object)
+                    logger.debug("使用__str__方法转换简历对象，长度: {} 字符", len(resume_text))
+                    self._formatted_prompt_cache = resume_text
+                    return resume_text
             
-            # 构建格式化的简历文本
+            # 构建格式化的简历文本，各部分按_RESUME_PROMPT_SECTIONS的顺序输出
             formatted_text = []
-            
-            # 个人信息
-            personal = resume_dict.get('personal_information', {})
-            if personal:
-                formatted_text.append("## 个人信息")
-                for key, value in personal.items():
-                    formatted_text.append(f"{key}: {value}")
-            
-            # 教育经历
-            education = resume_dict.get('education_details', [])
-            if education:
-                formatted_text.append("\n## 教育经历")
-                for edu in education:
-                    edu_text = []
-                    for key, value in edu.items():
-                        edu_text.append(f"{key}: {value}")
-                    formatted_text.append(" | ".join(edu_text))
-            
-            # 工作经历
-            experience = resume_dict.get('experience_details', [])
-            if experience:
-                formatted_text.append("\n## 工作经历")
-                for exp in experience:
-                    formatted_text.append(f"职位: {exp.get('position', '未知职位')}")
-                    formatted_text.append(f"公司: {exp.get('company', '未知公司')}")
-                    formatted_text.append(f"时间: {exp.get('employment_period', '未知时间')}")
-                    
-                    # 主要职责
-                    if 'key_responsibilities' in exp:
-                        formatted_text.append("主要职责:")
-                        for resp in exp['key_responsibilities']:
-                            for _, desc in resp.items():
-                                formatted_text.append(f"- {desc}")
-                    
-                    # 获得的技能
-                    if 'skills_acquired' in exp:
-                        formatted_text.append("技能:")
-                        formatted_text.append(", ".join(exp['skills_acquired']))
-                    
-                    formatted_text.append("")
-            
-            # 项目经历
-            projects = resume_dict.get('projects', [])
-            if projects:
-                formatted_text.append("\n## 项目经历")
-                for proj in projects:
-                    formatted_text.append(f"项目名称: {proj.get('name', '未知项目')}")
-                    formatted_text.append(f"描述: {proj.get('description', '无描述')}")
-                    if 'link' in proj and proj['link'] != 'N/A':
-                        formatted_text.append(f"链接: {proj['link']}")
-                    formatted_text.append("")
-            
-            # 技能
-            skills = resume_dict.get('skills', [])
-            if skills:
-                formatted_text.append("\n## 技能")
-                formatted_text.append(", ".join(skills))
-            
-            # 语言
-            languages = resume_dict.get('languages', [])
-            if languages:
-                formatted_text.append("\n## 语言")
-                for lang in languages:
-                    formatted_text.append(f"{lang.get('language', '未知语言')}: {lang.get('proficiency', '未知水平')}")
-            
-            # 兴趣爱好
-            interests = resume_dict.get('interests', [])
-            if interests:
-                formatted_text.append("\n## 兴趣爱好")
-                formatted_text.append(", ".join(interests))
+            for key, header, format_section in _RESUME_PROMPT_SECTIONS:
+                value = resume_dict.get(key)
+                if value:
+                    formatted_text.append(header)
+                    formatted_text.extend(format_section(value))
             
             result = "\n".join(formatted_text)
-            logger.debug(f"简历已格式化，长度: {len(result)} 字符")
+            logger.debug("简历已格式化，长度: {} 字符", len(result))
+            self._formatted_prompt_cache = result
             return result
             
         except Exception as e:
@@ -187,25 +319,62 @@ class ResumeGenerator:
             # 尝试直接使用字符串表示
             try:
                 resume_text = str(self.resume_object)
-                logger.debug(f"使用字符串表示作为备选，长度: {len(resume_text)} 字符")
+                logger.debug("使用字符串表示作为备选，长度: {} 字符", len(resume_text))
                 return resume_text
             except:
                 logger.error("无法将简历对象转换为文本")
                 return "简历数据无法处理"
 
-    def _create_resume(self, gpt_answerer: Any, style_path):
-        """创建简历HTML"""
-        # 设置简历对象
+    def _generate_cached(self, kind: str, key_parts: tuple, generate, refresh: bool = False) -> str:
+        """
+        带缓存地调用LLM生成内容
+        
+        先查本次会话的内存缓存，再查持久化的LLM响应缓存（仅在LLM_GENERATION_CACHE_ENABLED
+        开启时使用），都未命中时才调用generate。
+        
+        Args:
+            kind: 生成内容的类型，参与缓存键
+            key_parts: 决定生成结果的全部输入，如提示词模块、简历文本和职位描述
+            generate: 实际调用LLM的函数
+            refresh: 为True时跳过缓存重新生成，并用新结果替换缓存
+            
+        Returns:
+            str: 生成的内容
+        """
+        input_hash = make_input_hash(kind, global_config.MODEL_TYPE, global_config.MODEL, *key_parts)
+        if not refresh:
+            result = self._body_cache.get(input_hash)
+            if result is not None:
+                logger.debug("复用本次会话已生成的内容: {}", kind)
+                return result
+        
+        use_persistent = global_config.LLM_GENERATION_CACHE_ENABLED
+        result = None
+        if use_persistent and not refresh:
+            result = check_cache(input_hash, PROMPT_VERSION, global_config.MODEL)
+        if result is None:
+            result = generate()
+            if use_persistent:
+                save_to_cache(input_hash, PROMPT_VERSION, global_config.MODEL, result)
+        
+        if result:
+            if len(self._body_cache) >= BODY_CACHE_MAX_ENTRIES:
+                # 丢弃最早加入的条目
+                del self._body_cache[next(iter(self._body_cache))]
+            self._body_cache[input_hash] = result
+        return result
+
+    def _create_resume(self, answerer_class, strings_path, style_path, job_description_text: Optional[str] = None,
+                       refresh: bool = False):
+        """创建简历HTML，refresh为True时不使用缓存的生成结果"""
         resume_text = self._format_resume_for_prompt()
-        gpt_answerer.set_resume(resume_text)
         
         # 读取模板HTML
-        template = Template(global_config.html_template)
+        template = _get_html_template(global_config.html_template)
         
         try:
             # 读取CSS样式
-            with open(style_path, "r") as f:
-                style_css = f.read()
+            style_css = _load_style_css(style_path)
         except FileNotFoundError:
             logger.error(f"样式文件未找到: {style_path}")
             raise ValueError(f"样式文件未找到: {style_path}")
@@ -213,98 +382,84 @@ class ResumeGenerator:
             logger.error(f"读取CSS文件时出错: {str(e)}")
             raise RuntimeError(f"读取CSS文件时出错: {str(e)}")
         
-        # 生成简历HTML
-        body_html = gpt_answerer.generate_html_resume()
+        def generate():
+            strings = _load_strings(strings_path, global_config.STRINGS_MODULE_NAME)
+            gpt_answerer = answerer_class(global_config.API_KEY, strings)
+            if job_description_text is not None:
+                gpt_answerer.set_job_description_from_text(job_description_text)
+            gpt_answerer.set_resume(resume_text)
+            return gpt_answerer.generate_html_resume()
+        
+        # 生成简历HTML，正文与样式无关，相同的简历和职位换用其他样式时不再调用LLM
+        body_html = self._generate_cached(
+            answerer_class.__name__,
+            (str(strings_path), resume_text, job_description_text or ""),
+            generate,
+            refresh,
+        )
         
         # 应用模板
         return template.substitute(body=body_html, style_css=style_css)
 
-    def create_resume(self, style_path):
-        """创建标准简历"""
-        strings = load_module(global_config.STRINGS_MODULE_RESUME_PATH, global_config.STRINGS_MODULE_NAME)
-        gpt_answerer = LLMResumer(global_config.API_KEY, strings)
-        return self._create_resume(gpt_answerer, style_path)
-
-    def create_resume_job_description_text(self, style_path: str, job_description_text: str):
-        """创建针对特定职位的简历"""
-        strings = load_module(global_config.STRINGS_MODULE_RESUME_JOB_DESCRIPTION_PATH, global_config.STRINGS_MODULE_NAME)
-        gpt_answerer = LLMResumeJobDescription(global_config.API_KEY, strings)
-        gpt_answerer.set_job_description_from_text(job_description_text)
-        return self._create_resume(gpt_answerer, style_path)
-
-    def create_cover_letter_job_description(self, style_path: str, job_description_text: str):
-        """创建针对特定职位的求职信"""
+    def create_resume(self, style_path, refresh: bool = False):
+        """创建标准简历，refresh为True时重新调用LLM生成"""
+        return self._create_resume(LLMResumer, global_config.STRINGS_MODULE_RESUME_PATH, style_path, refresh=refresh)
+
+    def create_resume_job_description_text(self, style_path: str, job_description_text: str, refresh: bool = False):
+        """创建针对特定职位的简历，refresh为True时重新调用LLM生成"""
+        return self._create_resume(
+            LLMResumeJobDescription,
+            global_config.STRINGS_MODULE_RESUME_JOB_DESCRIPTION_PATH,
+            style_path,
+            job_description_text,
+            refresh=refresh,
+        )
+
+    def create_cover_letter_job_description(self, style_path: str, job_description_text: str, refresh: bool = False):
+        """创建针对特定职位的求职信，refresh为True时重新调用LLM生成"""
         logger.debug("开始创建针对特定职位的求职信")
-        logger.debug(f"使用样式路径: {style_path}")
+        logger.debug("使用样式路径: {}", style_path)
         
         # 确保样式路径存在
         if not os.path.exists(style_path):
             logger.error(f"样式文件不存在: {style_path}")
             raise FileNotFoundError(f"样式文件不存在: {style_path}")
             
-        strings = load_module(global_config.STRINGS_MODULE_COVER_LETTER_JOB_DESCRIPTION_PATH, global_config.STRINGS_MODULE_NAME)
-        logger.debug(f"已加载求职信字符串模块: {global_config.STRINGS_MODULE_COVER_LETTER_JOB_DESCRIPTION_PATH}")
-        
-        # 初始化求职信生成器
-        gpt_answerer = LLMCoverLetterJobDescription(global_config.API_KEY, strings)
+        strings_path = global_config.STRINGS_MODULE_COVER_LETTER_JOB_DESCRIPTION_PATH
         
         # 将简历对象格式化为对LLM更友好的文本
         resume_text = self._format_resume_for_prompt()
-        logger.debug(f"简历文本准备完成: {len(resume_text)} 字符")
+        logger.debug("简历文本准备完成: {} 字符", len(resume_text))
         
-        # 设置简历和职位描述
-        gpt_answerer.set_resume(resume_text)
-        gpt_answerer.set_job_description_from_text(job_description_text)
+        def generate():
+            strings = _load_strings(strings_path, global_config.STRINGS_MODULE_NAME)
+            logger.debug("已加载求职信字符串模块: {}", strings_path)
+            
+            # 初始化求职信生成器，设置简历和职位描述
+            gpt_answerer = LLMCoverLetterJobDescription(global_config.API_KEY, strings)
+            gpt_answerer.set_resume(resume_text)
+            gpt_answerer.set_job_description_from_text(job_description_text)
+            return gpt_answerer.generate_cover_letter()
         
-        # 生成求职信HTML
-        cover_letter_html = gpt_answerer.generate_cover_letter()
-        logger.debug(f"求职信HTML生成成功: {len(cover_letter_html)} 字符")
+        # 生成求职信HTML，相同的简历和职位描述直接复用缓存
+        cover_letter_html = self._generate_cached(
+            LLMCoverLetterJobDescription.__name__,
+            (str(strings_path), resume_text, job_description_text),
+            generate,
+            refresh,
+        )
+        logger.debug("求职信HTML生成成功: {} 字符", len(cover_letter_html))
         
         # 应用HTML模板
-        template = Template(global_config.html_template)
+        template = _get_html_template(global_config.html_template)
         
         try:
             # 读取样式文件内容
-            with open(style_path, "r", encoding="utf-8") as f:
-                original_style_css = f.read()
-                logger.debug(f"成功读取样式CSS，长度: {len(original_style_css)} 字符")
+            original_style_css = _load_style_css(style_path)
+            logger.debug("成功读取样式CSS，长度: {} 字符", len(original_style_css))
             
             # 添加额外的求职信特定样式
-            style_css = original_style_css + """
-                /* 求职信特定样式 */
-                .cover-letter {
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    font-family: inherit;
-                }
-                .cover-letter .header {
-                    margin-bottom: 30px;
-                    text-align: center;
-                }
-                .cover-letter .header h1 {
-                    margin-bottom: 10px;
-                    color: inherit;
-                }
-                .cover-letter .content {
-                    line-height: 1.6;
-                    text-align: justify;
-                }
-                .cover-letter p {
-                    margin-bottom: 15px;
-                }
-                .cover-letter h3, .cover-letter h4 {
-                    margin-top: 20px;
-                    margin-bottom: 10px;
-                }
-                .cover-letter ul {
-                    padding-left: 20px;
-                    margin-bottom: 15px;
-                }
-                .cover-letter li {
-                    margin-bottom: 5px;
-                }
-            """
+            style_css = original_style_css + _COVER_LETTER_EXTRA_CSS
             logger.debug("已添加求职信特定样式")
                 
             # 替换模板中的变量
@@ -316,40 +471,32 @@ class ResumeGenerator:
             # 包装HTML以确保样式应用正确
             if not cover_letter_html.strip().startswith('<div class="cover-letter">'):
                 # 移除思考部分
-                import re
-                cover_letter_html = re.sub(r'<think>.*?</think>', '', cover_letter_html, flags=re.DOTALL)
-                cover_letter_html = re.sub(r'<think>.*', '', cover_letter_html, flags=re.DOTALL)
+                if '<think>' in cover_letter_html:
+                    cover_letter_html = _THINK_BLOCK_PATTERN.sub('', cover_letter_html)
+                    cover_letter_html = _UNCLOSED_THINK_PATTERN.sub('', cover_letter_html)
                 
                 # 如果是纯文本格式，转换为正确的HTML格式
                 if not ('<div' in cover_letter_html or '<p>' in cover_letter_html):
                     paragraphs = cover_letter_html.strip().split('\n\n')
-                    formatted_paragraphs = [f"<p>{p.replace('\n', '<br>')}</p>" for p in paragraphs if p.strip()]
+                    formatted_paragraphs = ['<p>' + p.replace('\n', '<br>') + '</p>' for p in paragraphs if p.strip()]
                     cover_letter_html = '\n'.join(formatted_paragraphs)
                 
                 # 包装在适当的HTML结构中
-                cover_letter_html = f"""
-                <div class="cover-letter">
-                    <div class="header">
-                        <h1>求职信</h1>
-                    </div>
-                    <div class="content">
-                        {cover_letter_html}
-                    </div>
-                </div>
-                """
+                cover_letter_html = _COVER_LETTER_PREFIX + cover_letter_html + _COVER_LETTER_SUFFIX
                 logger.debug("已将内容包装在适当的HTML结构中")
             
             complete_html = template.substitute(body=cover_letter_html, style_css=style_css)
-            logger.debug(f"完整HTML生成成功，长度: {len(complete_html)} 字符")
+            logger.debug("完整HTML生成成功，长度: {} 字符", len(complete_html))
             
-            # 写入调试输出
-            try:
-                debug_file = Path("output") / "debug_html.html"
-                with open(debug_file, "w", encoding="utf-8") as f:
-                    f.write(complete_html)
-                logger.debug(f"已将调试HTML保存到: {debug_file}")
-            except Exception as debug_e:
-                logger.warning(f"保存调试HTML失败: {str(debug_e)}")
+            # 调试时写入完整HTML，默认关闭以免每封求职信都写一次磁盘
+            if global_config.DEBUG_HTML_ENABLED:
+                try:
+                    debug_file = Path("output") / "debug_html.html"
+                    with open(debug_file, "w", encoding="utf-8") as f:
+                        f.write(complete_html)
+                    logger.debug("已将调试HTML保存到: {}", debug_file)
+                except Exception as debug_e:
+                    logger.warning(f"保存调试HTML失败: {str(debug_e)}")
             
             # 返回完整HTML
             return complete_html
@@ -1,8 +1,12 @@
 import os
+import re
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import logging
 
+# 样式文件首行的注释头：/* 样式名称 $ 作者链接 */，一次匹配同时完成校验和拆分
+_STYLE_HEADER_PATTERN = re.compile(r'/\*(.*?)\$(.*)\*/', re.DOTALL)
+
 # Configure logging
 logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -13,6 +17,9 @@ class StyleManager:
         current_file = Path(__file__).resolve()
         project_root = current_file.parent.parent.parent.parent
         self.styles_directory = project_root / "src" / "libs" / "resume_and_cover_builder" / "resume_style"
+        # 样式目录扫描结果，目录修改时间不变时直接复用
+        self._styles_cache: Optional[Dict[str, Tuple[str, str]]] = None
+        self._styles_cache_mtime: Optional[float] = None
 
         logging.debug(f"Project root determined as: {project_root}")
         logging.debug(f"Styles directory set to: {self.styles_directory}")
@@ -27,6 +34,12 @@ class StyleManager:
         if not self.styles_directory:
             logging.warning("Styles directory is not set.")
             return styles_to_files
+        try:
+            dir_mtime = self.styles_directory.stat().st_mtime
+        except OSError:
+            dir_mtime = None
+        if self._styles_cache is not None and dir_mtime is not None and dir_mtime == self._styles_cache_mtime:
+            return dict(self._styles_cache)
         logging.debug(f"Reading styles directory: {self.styles_directory}")
         try:
             files = [f for f in self.styles_directory.iterdir() if f.is_file()]
@@ -35,15 +48,17 @@ class StyleManager:
                 logging.debug(f"Processing file: {file_path}")
                 with file_path.open("r", encoding="utf-8") as file:
                     first_line = file.readline().strip()
-                    logging.debug(f"First line of file {file_path.name}: {first_line}")
-                    if first_line.startswith("/*") and first_line.endswith("*/"):
-                        content = first_line[2:-2].strip()
-                        if "$" in content:
-                            style_name, author_link = content.split("$", 1)
-                            style_name = style_name.strip()
-                            author_link = author_link.strip()
-                            styles_to_files[style_name] = (file_path.name, author_link)
-                            logging.info(f"Added style: {style_name} by {author_link}")
+                logging.debug(f"First line of file {file_path.name}: {first_line}")
+                header = _STYLE_HEADER_PATTERN.fullmatch(first_line)
+                if header:
+                    style_name = header.group(1).strip()
+                    author_link = header.group(2).strip()
+                    styles_to_files[style_name] = (file_path.name, author_link)
+                    logging.info(f"Added style: {style_name} by {author_link}")
+            # 只缓存完整扫描的结果，目录增删文件后修改时间变化会触发重新扫描
+            self._styles_cache = styles_to_files
+            self._styles_cache_mtime = dir_mtime
+            styles_to_files = dict(styles_to_files)
         except FileNotFoundError:
             logging.error(f"Directory {self.styles_directory} not found.")
         except PermissionError:
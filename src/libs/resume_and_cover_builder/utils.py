@@ -3,10 +3,12 @@ This module contains utility functions for the Resume and Cover Letter Builder s
 """
 
 # app/libs/resume_and_cover_builder/utils.py
+import atexit
 import json
 import openai
+import queue
+import threading
 import time
-from datetime import datetime
 from typing import Dict, List, Optional, Union, Any
 from langchain_core.messages.ai import AIMessage
 from langchain_core.prompt_values import StringPromptValue
@@ -24,6 +26,82 @@ from langchain_core.messages import (
 from src.libs.resume_and_cover_builder.config import global_config
 from pydantic import Field, PrivateAttr, BaseModel
 
+# 调用费用估算使用的每令牌单价（美元）
+PROMPT_PRICE_PER_TOKEN = 0.00000015
+COMPLETION_PRICE_PER_TOKEN = 0.0000006
+
+
+# 优先用orjson序列化调用日志，未安装时使用标准库json
+try:
+    import orjson
+
+    def _dumps_log_entry(log_entry: Dict[str, Any]) -> str:
+        return orjson.dumps(log_entry, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+except ImportError:
+    def _dumps_log_entry(log_entry: Dict[str, Any]) -> str:
+        return json.dumps(log_entry, ensure_ascii=False)
+
+# parse_llmresult从响应中保留的元数据键
+_RESPONSE_METADATA_KEYS = frozenset({"model_name"})
+_USAGE_METADATA_KEYS = frozenset({"input_tokens", "output_tokens", "total_tokens"})
+
+
+class _CallLogWriter:
+    """
+    在后台线程中追加写入调用日志，请求线程只需把日志行放入队列
+    
+    每个日志文件保持一个打开的句柄，队列清空时刷新到磁盘，进程退出前写完剩余日志。
+    """
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def write(self, path, line: str):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="llm-call-log-writer", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.close)
+        self._queue.put((str(path), line))
+
+    def _run(self):
+        files = {}
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                path, line = item
+                try:
+                    file = files.get(path)
+                    if file is None:
+                        file = files[path] = open(path, "a", encoding="utf-8", buffering=1 << 16)
+                    file.write(line)
+                    file.write("\n")
+                    if self._queue.empty():
+                        file.flush()
+                except Exception as e:
+                    logger.error(f"写入LLM调用日志失败: {str(e)}")
+        finally:
+            for file in files.values():
+                try:
+                    file.close()
+                except Exception:
+                    pass
+
+    def close(self):
+        """写完队列中剩余的日志并关闭文件"""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout=5)
+
+
+_call_log_writer = _CallLogWriter()
+
 
 class LLMLogger:
 
@@ -47,7 +125,7 @@ class LLMLogger:
                 for i, prompt in enumerate(prompts.messages)
             }
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        current_time = time.strftime("%Y-%m-%d %H:%M:%S")
 
         # Extract token usage details from the response
         token_usage = parsed_reply["usage_metadata"]
@@ -57,13 +135,9 @@ class LLMLogger:
 
         # Extract model details from the response
         model_name = parsed_reply["response_metadata"]["model_name"]
-        prompt_price_per_token = 0.00000015
-        completion_price_per_token = 0.0000006
 
         # Calculate the total cost of the API call
-        total_cost = (input_tokens * prompt_price_per_token) + (
-            output_tokens * completion_price_per_token
-        )
+        total_cost = input_tokens * PROMPT_PRICE_PER_TOKEN + output_tokens * COMPLETION_PRICE_PER_TOKEN
 
         # Create a log entry with all relevant information
         log_entry = {
@@ -77,10 +151,8 @@ class LLMLogger:
             "total_cost": total_cost,
         }
 
-        # Write the log entry to the log file in JSON format
-        with open(calls_log, "a", encoding="utf-8") as f:
-            json_string = json.dumps(log_entry, ensure_ascii=False, indent=4)
-            f.write(json_string + "\n")
+        # Write the log entry to the log file as one JSON object per line, off the request thread
+        _call_log_writer.write(calls_log, _dumps_log_entry(log_entry))
 
 
 class LoggerChatModel:
@@ -95,7 +167,7 @@ class LoggerChatModel:
             llm: 被包装的LLM模型
         """
         self.llm = llm
-        logger.debug(f"初始化LoggerChatModel，使用LLM: {type(llm).__name__}")
+        logger.debug("初始化LoggerChatModel，使用LLM: {}", type(llm).__name__)
     
     def __call__(self, messages):
         """
@@ -107,7 +179,7 @@ class LoggerChatModel:
         Returns:
             模型的响应
         """
-        logger.debug(f"调用__call__方法，消息类型: {type(messages)}")
+        logger.debug("调用__call__方法，消息类型: {}", type(messages))
         
         # 处理不同类型的消息
         try:
@@ -117,9 +189,9 @@ class LoggerChatModel:
                 messages = messages.messages
             
             # 尝试调用LLM API
-            logger.debug(f"开始调用LLM API，消息数量: {len(messages) if isinstance(messages, list) else '未知'}")
+            logger.debug("开始调用LLM API，消息数量: {}", len(messages) if isinstance(messages, list) else '未知')
             reply = self.llm.invoke(messages)
-            logger.debug(f"收到LLM响应: {type(reply).__name__}")
+            logger.debug("收到LLM响应: {}", type(reply).__name__)
             
             # 解析响应
             try:
@@ -157,7 +229,7 @@ class LoggerChatModel:
         Returns:
             dict: 包含响应内容和元数据的字典
         """
-        logger.debug(f"解析LLM响应: {type(llmresult).__name__}")
+        logger.debug("解析LLM响应: {}", type(llmresult).__name__)
         
         try:
             # 构建基本响应结构
@@ -174,29 +246,28 @@ class LoggerChatModel:
             }
             
             # 尝试提取内容
-            if hasattr(llmresult, "content"):
-                parsed_result["content"] = llmresult.content
+            content = getattr(llmresult, "content", None)
+            if content is not None:
+                parsed_result["content"] = content
             elif isinstance(llmresult, str):
                 parsed_result["content"] = llmresult
-            elif hasattr(llmresult, "choices") and llmresult.choices:
-                parsed_result["content"] = llmresult.choices[0].message.content
             else:
-                # 最后尝试
-                parsed_result["content"] = str(llmresult)
+                choices = getattr(llmresult, "choices", None)
+                # 最后尝试直接转换为字符串
+                parsed_result["content"] = choices[0].message.content if choices else str(llmresult)
             
-            # 尝试提取元数据
-            if hasattr(llmresult, "response_metadata") and llmresult.response_metadata:
-                if isinstance(llmresult.response_metadata, dict):
-                    for key, value in llmresult.response_metadata.items():
-                        if key in parsed_result["response_metadata"]:
-                            parsed_result["response_metadata"][key] = value
+            # 尝试提取元数据和使用情况，只保留已知的键
+            response_metadata = getattr(llmresult, "response_metadata", None)
+            if response_metadata and isinstance(response_metadata, dict):
+                parsed_result["response_metadata"].update(
+                    (key, value) for key, value in response_metadata.items() if key in _RESPONSE_METADATA_KEYS
+                )
             
-            # 尝试提取使用情况
-            if hasattr(llmresult, "usage_metadata") and llmresult.usage_metadata:
-                if isinstance(llmresult.usage_metadata, dict):
-                    for key, value in llmresult.usage_metadata.items():
-                        if key in parsed_result["usage_metadata"]:
-                            parsed_result["usage_metadata"][key] = value
+            usage_metadata = getattr(llmresult, "usage_metadata", None)
+            if usage_metadata and isinstance(usage_metadata, dict):
+                parsed_result["usage_metadata"].update(
+                    (key, value) for key, value in usage_metadata.items() if key in _USAGE_METADATA_KEYS
+                )
             
             logger.debug("成功解析LLM响应")
             return parsed_result
@@ -1,9 +1,23 @@
 """
 样式管理器模块
-从libs/resume_and_cover_builder导入StyleManager类并重新导出
+兼容旧的导入路径，StyleManager定义在src.libs.resume_and_cover_builder.style_manager中，
+首次访问属性时才导入，项目内部请直接从定义处导入
 """
+from typing import TYPE_CHECKING
 
-from src.libs.resume_and_cover_builder.style_manager import StyleManager
+if TYPE_CHECKING:
+    # 仅供类型检查和静态分析声明导出名称，运行时由__getattr__按需导入
+    from src.libs.resume_and_cover_builder.style_manager import StyleManager
 
-# 重新导出StyleManager类
-__all__ = ['StyleManager'] 
\ No newline at end of file
+__all__ = ['StyleManager']
+
+
+def __getattr__(name):
+    if name == 'StyleManager':
+        from src.libs.resume_and_cover_builder.style_manager import StyleManager
+        return StyleManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,19 +1,23 @@
 import os
+import re
+import base64
+import json
 import time
 import urllib.parse
 import tempfile
 import subprocess
+import shutil
 import random
+import threading
+import functools
+import contextlib
+import platform
+import queue
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from src.logging import logger
 import config as cfg
 from pathlib import Path
@@ -21,21 +25,546 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    TimeoutException,
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    ElementNotInteractableException,
+    ElementClickInterceptedException,
+)
 from datetime import datetime
 
+# 静态页面优先用httpx直接请求，未安装时所有页面都通过浏览器获取
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# 已解析的浏览器驱动路径，键为浏览器类型；同时持久化到用户缓存目录，进程重启后仍可复用，
+# 避免每次初始化浏览器都让webdriver_manager联网检查驱动版本。
+# 不放在全局可写的临时目录，防止其他本地用户预先写入文件，让程序执行任意驱动路径
+_DRIVER_PATH_CACHE = {}
+_DRIVER_PATH_CACHE_FILE = Path.home() / ".cache" / "aihawk" / "webdriver_paths.json"
+
+
+# 已找到的浏览器可执行文件路径，键为浏览器类型；同时持久化到用户缓存目录，
+# 找到一次后不再重复检查文件和调用where/which，进程重启后仍然有效
+_BINARY_PATH_CACHE = {}
+_BINARY_PATH_CACHE_FILE = Path.home() / ".cache" / "aihawk" / "binaries.json"
+
+
+# Firefox常见安装位置，导入时按平台生成一次并展开环境变量
+if os.name == 'nt':  # Windows
+    _FIREFOX_CANDIDATES = (
+        r"C:\Program Files\Mozilla Firefox\firefox.exe",
+        r"C:\Program Files (x86)\Mozilla Firefox\firefox.exe",
+        os.path.expandvars(r"%LOCALAPPDATA%\Mozilla Firefox\firefox.exe"),
+        # 尝试特定的安装路径
+        r"C:\Program Files\Firefox Developer Edition\firefox.exe",
+        r"C:\Program Files\Firefox Nightly\firefox.exe",
+        # 可能从网站下载的便携版路径
+        os.path.expandvars(r"%USERPROFILE%\Downloads\Firefox\firefox.exe"),
+        os.path.expandvars(r"%USERPROFILE%\Desktop\Firefox\firefox.exe"),
+    )
+elif os.name == 'posix':  # Linux/Mac
+    _FIREFOX_CANDIDATES = (
+        "/usr/bin/firefox",
+        "/usr/lib/firefox/firefox",
+        "/usr/local/bin/firefox",
+        "/snap/bin/firefox",
+        "/Applications/Firefox.app/Contents/MacOS/firefox",
+        os.path.expanduser("~/Applications/Firefox.app/Contents/MacOS/firefox"),
+    )
+else:
+    _FIREFOX_CANDIDATES = ()
+
+
+# Chrome不在PATH中时检查的常见安装位置，导入时按平台生成一次
+if os.name == 'nt':  # Windows
+    _CHROME_CANDIDATES = (
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+        os.path.join(os.environ.get('LOCALAPPDATA', ''), r"Google\Chrome\Application\chrome.exe"),
+    )
+else:  # Linux/Mac
+    _CHROME_CANDIDATES = (
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    )
+
+
+# 通过CDP屏蔽的资源：eager/none页面加载策略和禁用图片
+_EAGER_BLOCKED_URLS = ("*.jpg", "*.jpeg", "*.png", "*.gif", "*.css", "*.woff", "*.woff2", "*.ttf")
+_NONE_BLOCKED_URLS = ("*.jpg", "*.jpeg", "*.png", "*.gif", "*.css", "*.js", "*.woff", "*.woff2", "*.ttf")
+_IMAGE_BLOCKED_URLS = ("*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp")
+
+
+# add_cookie格式的cookie字段与CDP Network.setCookies参数的对应关系
+_COOKIE_CDP_FIELDS = (
+    ("secure", "secure"),
+    ("httpOnly", "httpOnly"),
+    ("sameSite", "sameSite"),
+    ("expiry", "expires"),
+)
+
+
+# 在浏览器内依次点击可见元素，一次execute_script完成全部点击，返回每个选择器是否点击成功
+_CLICK_VISIBLE_JS = """
+return Array.from(arguments[0], function(selector) {
+    var el = document.querySelector(selector);
+    if (el && el.offsetParent !== null && !el.disabled) {
+        el.click();
+        return true;
+    }
+    return false;
+});
+"""
+
+# 可模拟的设备：屏幕参数和对应的User-Agent
+_DEVICE_EMULATION = {
+    "mobile": {
+        "label": "移动设备",
+        "deviceMetrics": {"width": 360, "height": 640, "deviceScaleFactor": 3.0, "mobile": True},
+        "userAgent": "Mozilla/5.0 (Linux; Android 10; SM-G981B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36",
+    },
+    "tablet": {
+        "label": "平板设备",
+        "deviceMetrics": {"width": 768, "height": 1024, "deviceScaleFactor": 2.0, "mobile": True},
+        "userAgent": "Mozilla/5.0 (iPad; CPU OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1",
+    },
+}
+
+# 隐身模式脚本，在每个新文档加载前执行；
+# navigator.webdriver已由Chrome初始化时注册的脚本隐藏，这里不能再次定义，否则脚本会因重复定义属性而中断
+_STEALTH_JS = """
+    // 清除自动化相关的标志
+    if (window.navigator.plugins) {
+        Object.defineProperty(navigator, 'plugins', {
+            get: () => {
+                return {
+                    length: 5,
+                    item: function(index) { return this[index]; },
+                    0: {name: 'Chrome PDF Plugin'},
+                    1: {name: 'Chrome PDF Viewer'},
+                    2: {name: 'Native Client'},
+                    3: {name: 'Widevine Content Decryption Module'},
+                    4: {name: 'Microsoft Edge PDF Plugin'}
+                };
+            }
+        });
+    }
+
+    // 添加语言和平台信息
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['zh-CN', 'zh', 'en-US', 'en']
+    });
+
+    // 移除自动化测试标记
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+        Promise.resolve({ state: Notification.permission }) :
+        originalQuery(parameters)
+    );
+
+    // 调整Chrome对象
+    if (window.chrome) {
+        window.chrome.runtime = {};
+    }
+"""
+
+
+def _build_header_script(headers):
+    """生成给XMLHttpRequest添加自定义请求头的脚本，User-Agent通过CDP单独设置"""
+    # json.dumps生成转义后的JS字符串字面量，避免请求头中的引号破坏脚本
+    set_headers = "\n".join(
+        f"    this.setRequestHeader({json.dumps(str(name))}, {json.dumps(str(value))});"
+        for name, value in headers.items() if name != "User-Agent"
+    )
+    return (
+        "// 修改XMLHttpRequest以添加自定义头\n"
+        "const originalOpen = XMLHttpRequest.prototype.open;\n"
+        "XMLHttpRequest.prototype.open = function(method, url) {\n"
+        "    originalOpen.apply(this, arguments);\n"
+        f"{set_headers}\n"
+        "};\n"
+    )
+
+
+def _with_driver_lock(method):
+    """让BrowserManager的方法在持有驱动锁时执行，多个线程共用同一个驱动时依次操作"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._driver_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+# 在浏览器内完成整个滚动过程：每次滚动到底部（随机模式下有时回滚一点），等待页面高度增加，
+# 超时未变化时再滚动一次并等待，仍未变化或达到最大次数时结束，通过回调返回[最终高度, 滚动次数]。
+# 参数依次为最大滚动次数、每次最长等待毫秒数、是否模拟人类的随机滚动和等待
+_AUTOSCROLL_JS = """
+var maxScrolls = arguments[0], waitMs = arguments[1], randomize = arguments[2];
+var done = arguments[arguments.length - 1];
+var lastHeight = document.body.scrollHeight, count = 0;
+function waitForGrowth(timeout, callback) {
+    if (document.body.scrollHeight > lastHeight) {
+        callback(true);
+        return;
+    }
+    var finished = false, timer = null;
+    var observer = new MutationObserver(function() {
+        if (document.body.scrollHeight > lastHeight) {
+            finish();
+        }
+    });
+    function finish() {
+        if (finished) {
+            return;
+        }
+        finished = true;
+        observer.disconnect();
+        clearTimeout(timer);
+        callback(document.body.scrollHeight > lastHeight);
+    }
+    observer.observe(document.body, {childList: true, subtree: true});
+    timer = setTimeout(finish, timeout);
+}
+function step() {
+    if (count >= maxScrolls) {
+        done([document.body.scrollHeight, count]);
+        return;
+    }
+    var timeout = waitMs;
+    window.scrollTo(0, document.body.scrollHeight);
+    if (randomize) {
+        if (Math.random() < 0.3) {
+            window.scrollBy(0, -(100 + Math.random() * 200));
+        }
+        timeout = Math.max(500, waitMs + Math.random() * 1300 - 500);
+    }
+    waitForGrowth(timeout, function(grown) {
+        if (grown) {
+            next();
+            return;
+        }
+        // 有时第一次滚动没有触发加载，再滚动一次
+        window.scrollTo(0, document.body.scrollHeight);
+        waitForGrowth(timeout, function(grownAgain) {
+            if (grownAgain) {
+                next();
+            } else {
+                done([document.body.scrollHeight, count]);
+            }
+        });
+    });
+}
+function next() {
+    lastHeight = document.body.scrollHeight;
+    count += 1;
+    step();
+}
+step();
+"""
+
+
+# HTTP直接获取的页面至少达到该长度才直接使用，更短的通常是需要脚本渲染的空壳页面
+_HTTP_MIN_CONTENT_SIZE = 5000
+# 页面依赖前端框架渲染或要求启用JavaScript的标记，出现时改用浏览器获取
+_JS_REQUIRED_RE = re.compile(r'ng-app|data-reactroot|id="__next"|id="__nuxt"|enable JavaScript', re.IGNORECASE)
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client():
+    """返回共享的httpx客户端，首次使用时创建，复用连接"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                proxy = None
+                if cfg.PROXY_ENABLED and (cfg.PROXY_HTTP or cfg.PROXY_HTTPS):
+                    proxy = cfg.PROXY_HTTPS or cfg.PROXY_HTTP
+                _http_client = httpx.Client(
+                    headers={
+                        "User-Agent": cfg.BROWSER_USER_AGENT,
+                        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    },
+                    follow_redirects=True,
+                    timeout=cfg.PAGE_LOAD_TIMEOUT,
+                    proxy=proxy,
+                )
+    return _http_client
+
+
+def _fetch_static_html(url):
+    """
+    不启动浏览器，直接通过HTTP获取服务端渲染的页面
+
+    Returns:
+        Optional[str]: 页面HTML；请求失败、内容过短、需要脚本渲染或被重定向到LinkedIn登录页时返回None
+    """
+    if httpx is None:
+        return None
+    try:
+        response = _get_http_client().get(url)
+    except Exception as e:
+        logger.debug(f"HTTP直接获取页面失败，改用浏览器: {str(e)}")
+        return None
+    if response.status_code != 200 or "text/html" not in response.headers.get("content-type", ""):
+        return None
+    if "linkedin.com" in url.lower() and _LINKEDIN_LOGIN_RE.search(str(response.url)):
+        return None
+    content = response.text
+    if len(content) < _HTTP_MIN_CONTENT_SIZE or _JS_REQUIRED_RE.search(content):
+        return None
+    return content
+
+
+# 错误截图保存目录；截图由后台线程写入磁盘，不阻塞重试
+_SCREENSHOT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs", "screenshots")
+_screenshot_queue = queue.Queue()
+_screenshot_writer = None
+_screenshot_writer_lock = threading.Lock()
+
+
+def _write_screenshots():
+    """后台线程：把队列中的截图解码后写入磁盘"""
+    while True:
+        screenshot_path, image_base64 = _screenshot_queue.get()
+        try:
+            os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
+            with open(screenshot_path, "wb") as f:
+                f.write(base64.b64decode(image_base64))
+            logger.info(f"错误截图已保存: {screenshot_path}")
+        except Exception as e:
+            logger.warning(f"无法保存错误截图: {str(e)}")
+        finally:
+            _screenshot_queue.task_done()
+
+
+def _queue_screenshot(screenshot_path, image_base64):
+    """把Base64编码的截图放入写入队列，首次调用时启动后台写入线程"""
+    global _screenshot_writer
+    if _screenshot_writer is None:
+        with _screenshot_writer_lock:
+            if _screenshot_writer is None:
+                _screenshot_writer = threading.Thread(target=_write_screenshots, name="screenshot-writer", daemon=True)
+                _screenshot_writer.start()
+    _screenshot_queue.put((screenshot_path, image_base64))
+
+
+# random_delay模式下点击前模拟鼠标移动的概率，每次移动都需要额外的驱动命令
+_MOUSE_MOVE_PROBABILITY = 0.2
+
+
+# 在浏览器内计算页面HTML长度，只返回一个整数
+_CONTENT_SIZE_JS = "return document.documentElement ? document.documentElement.outerHTML.length : 0;"
+
+
+# LinkedIn跳转到登录页时URL中包含的关键字，忽略大小写匹配，无需每次复制小写URL
+_LINKEDIN_LOGIN_RE = re.compile(r"login|sign-in", re.IGNORECASE)
+
+
+# CSS选择器对应的定位元组和等待条件，选择器集合通常固定，构造一次后反复使用
+_LOCATOR_CACHE = {}
+_CONDITION_CACHE = {}
+
+
+def _css(selector):
+    """返回选择器的(By.CSS_SELECTOR, selector)定位元组"""
+    locator = _LOCATOR_CACHE.get(selector)
+    if locator is None:
+        locator = _LOCATOR_CACHE.setdefault(selector, (By.CSS_SELECTOR, selector))
+    return locator
+
+
+def _css_condition(condition, selector):
+    """
+    返回选择器对应的expected_conditions等待条件
+
+    Args:
+        condition: 条件工厂，如EC.presence_of_element_located
+        selector: CSS选择器
+    """
+    key = (condition, selector)
+    predicate = _CONDITION_CACHE.get(key)
+    if predicate is None:
+        predicate = _CONDITION_CACHE.setdefault(key, condition(_css(selector)))
+    return predicate
+
+
+# 通过data URL加载的HTML最大长度，Chrome限制URL长度约为2MB
+_DATA_URL_MAX_LENGTH = 2_000_000
+
+
+def _pdf_page_ready(driver):
+    """WebDriverWait条件：页面加载完成且网页字体已加载，避免PDF中使用回退字体"""
+    return driver.execute_script(
+        "return document.readyState === 'complete' && (!document.fonts || document.fonts.status === 'loaded');"
+    )
+
+
+def _document_ready(driver):
+    """WebDriverWait条件：页面document.readyState为complete"""
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def _page_idle(driver):
+    """WebDriverWait条件：页面加载完成且没有进行中的jQuery请求"""
+    return driver.execute_script(
+        "return document.readyState === 'complete' && !(window.jQuery && window.jQuery.active);"
+    )
+
+
+def _load_path_cache(cache_file):
+    """读取持久化的路径缓存，文件不存在或损坏时返回空字典"""
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_path_cache(cache_file, data):
+    """写入持久化的路径缓存，失败时只记录日志"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except OSError as e:
+        logger.warning(f"保存路径缓存失败: {e}")
+
+
+def _binary_cache_key(browser_type):
+    """持久化浏览器路径的键，包含平台信息，共享主目录的不同机器互不影响"""
+    return f"{browser_type}:{os.name}:{platform.machine()}"
+
+
+def _cached_binary_path(browser_type):
+    """
+    返回缓存中仍然存在的浏览器可执行文件路径
+
+    依次检查进程内缓存和持久化文件，持久化的路径已失效时将其移除。
+
+    Returns:
+        Optional[str]: 浏览器路径，未缓存时返回None
+    """
+    binary_path = _BINARY_PATH_CACHE.get(browser_type)
+    if binary_path:
+        return binary_path
+
+    key = _binary_cache_key(browser_type)
+    persisted = _load_path_cache(_BINARY_PATH_CACHE_FILE)
+    binary_path = persisted.get(key)
+    if not binary_path:
+        return None
+    if os.path.isfile(binary_path):
+        _BINARY_PATH_CACHE[browser_type] = binary_path
+        return binary_path
+    del persisted[key]
+    _save_path_cache(_BINARY_PATH_CACHE_FILE, persisted)
+    return None
+
+
+def _remember_binary_path(browser_type, binary_path):
+    """把找到的浏览器路径写入进程内缓存和持久化文件"""
+    binary_path = str(binary_path)
+    _BINARY_PATH_CACHE[browser_type] = binary_path
+    persisted = _load_path_cache(_BINARY_PATH_CACHE_FILE)
+    persisted[_binary_cache_key(browser_type)] = binary_path
+    _save_path_cache(_BINARY_PATH_CACHE_FILE, persisted)
+
+
+def _resolve_driver_path(browser_type, install):
+    """
+    返回浏览器驱动路径，优先使用缓存中仍然存在的驱动文件
+
+    Args:
+        browser_type: 浏览器类型，如'chrome'
+        install: 缓存未命中时调用的安装函数，如_install_chromedriver
+
+    Returns:
+        str: 驱动可执行文件路径
+    """
+    driver_path = _DRIVER_PATH_CACHE.get(browser_type)
+    if driver_path and os.path.isfile(driver_path):
+        return driver_path
+
+    driver_path = _load_path_cache(_DRIVER_PATH_CACHE_FILE).get(browser_type)
+    if driver_path and os.path.isfile(driver_path):
+        logger.debug(f"使用缓存的 {browser_type} 驱动: {driver_path}")
+        _DRIVER_PATH_CACHE[browser_type] = driver_path
+        return driver_path
+
+    driver_path = install()
+    _DRIVER_PATH_CACHE[browser_type] = driver_path
+    persisted = _load_path_cache(_DRIVER_PATH_CACHE_FILE)
+    persisted[browser_type] = driver_path
+    _save_path_cache(_DRIVER_PATH_CACHE_FILE, persisted)
+    return driver_path
+
+
+# webdriver_manager只在驱动缓存未命中时才导入，它会连带加载requests等模块，
+# 只使用Chrome或驱动已缓存时不必承担这部分导入开销
+def _install_geckodriver():
+    """下载Firefox驱动并返回路径"""
+    from webdriver_manager.firefox import GeckoDriverManager
+    return GeckoDriverManager().install()
+
+
+def _install_chromedriver():
+    """下载Chrome驱动并返回路径"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def _install_edgedriver():
+    """下载Edge驱动并返回路径"""
+    from webdriver_manager.microsoft import EdgeChromiumDriverManager
+    return EdgeChromiumDriverManager().install()
+
+
+def _forget_driver_path(browser_type):
+    """驱动启动失败时丢弃缓存的路径（如浏览器升级后驱动版本不匹配），下次重新安装"""
+    _DRIVER_PATH_CACHE.pop(browser_type, None)
+    persisted = _load_path_cache(_DRIVER_PATH_CACHE_FILE)
+    if persisted.pop(browser_type, None) is not None:
+        _save_path_cache(_DRIVER_PATH_CACHE_FILE, persisted)
+
+
 class BrowserManager:
     """浏览器管理器单例类"""
     _instance = None
+    _instance_lock = threading.Lock()
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(BrowserManager, cls).__new__(cls)
-            cls._instance.driver = None
-            cls._instance.is_initialized = False
-            cls._instance.restart_attempted = False  # 用于跟踪是否已尝试重启浏览器
+            # 加锁后再检查一次，避免多个线程同时创建实例
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls._create_instance()
         return cls._instance
 
+    @classmethod
+    def _create_instance(cls):
+        """创建并初始化单例实例的状态"""
+        instance = super(BrowserManager, cls).__new__(cls)
+        instance._driver_lock = threading.RLock()  # 同一时间只允许一个线程操作驱动
+        instance.driver = None
+        instance.is_initialized = False
+        instance.restart_attempted = False  # 用于跟踪是否已尝试重启浏览器
+        instance._wait_cache = {}  # 按超时和轮询间隔复用的WebDriverWait，驱动重建时清空
+        instance._blocked_urls_sig = None  # 当前驱动上已设置的资源屏蔽规则
+        instance._network_enabled = False  # 当前驱动是否已调用Network.enable
+        instance._stealth_registered = False  # 当前驱动是否已注册隐身模式脚本
+        instance._header_script_id = None  # 已注册的自定义请求头脚本标识
+        instance._header_script_sig = None  # 已注册脚本对应的请求头
+        instance._emulated_device = None  # 当前驱动上已应用的设备模拟
+        instance._stop_event = threading.Event()  # 调用shutdown时置位，中断get_page_content中的等待
+        return instance
+
+    @_with_driver_lock
     def initialize_browser(self):
         """初始化浏览器"""
         try:
@@ -47,18 +576,20 @@ class BrowserManager:
                 os.environ['HTTPS_PROXY'] = cfg.PROXY_HTTPS if cfg.PROXY_HTTPS else ''
                 logger.info(f"设置代理: HTTP={cfg.PROXY_HTTP}, HTTPS={cfg.PROXY_HTTPS}")
             
-            browser_types = [cfg.BROWSER_TYPE.lower()]
+            preferred_browser = cfg.BROWSER_TYPE.lower()
+            browser_types = [preferred_browser]
             
             # 如果用户选择的浏览器不是chrome，添加chrome作为备选
-            if cfg.BROWSER_TYPE.lower() != 'chrome':
+            if preferred_browser != 'chrome':
                 browser_types.append('chrome')
             
             # 如果既不是firefox也不是chrome，添加firefox作为另一个备选
-            if cfg.BROWSER_TYPE.lower() not in ['firefox', 'chrome']:
+            if preferred_browser not in ('firefox', 'chrome'):
                 browser_types.append('firefox')
             
             # 尝试初始化浏览器，如果失败则尝试备选浏览器
             last_error = None
+            self._reset_driver_state()
             for browser_type in browser_types:
                 try:
                     logger.info(f"尝试初始化 {browser_type} 浏览器...")
@@ -109,6 +640,8 @@ class BrowserManager:
         """初始化 Firefox 浏览器"""
         try:
             logger.debug("初始化 Firefox 浏览器...")
+            from selenium.webdriver.firefox.service import Service as FirefoxService
+            from selenium.webdriver.firefox.options import Options as FirefoxOptions
             
             # 创建日志目录
             log_dir = os.path.dirname(cfg.GECKODRIVER_LOG_PATH)
@@ -121,6 +654,7 @@ class BrowserManager:
                 firefox_options.add_argument('--headless')
             firefox_options.add_argument(f'--width={cfg.BROWSER_WIDTH}')
             firefox_options.add_argument(f'--height={cfg.BROWSER_HEIGHT}')
+            firefox_options.page_load_strategy = getattr(cfg, 'PAGE_LOAD_STRATEGY', 'normal')
             
             # 设置用户代理
             firefox_options.set_preference('general.useragent.override', cfg.BROWSER_USER_AGENT)
@@ -130,76 +664,10 @@ class BrowserManager:
             firefox_options.set_preference('privacy.file_unique_origin', False)
             
             # 设置Firefox二进制文件路径
-            firefox_found = False
-            if hasattr(cfg, 'FIREFOX_BINARY') and cfg.FIREFOX_BINARY:
-                logger.debug(f"使用配置中的 Firefox 路径: {cfg.FIREFOX_BINARY}")
-                if os.path.exists(cfg.FIREFOX_BINARY):
-                    firefox_options.binary_location = cfg.FIREFOX_BINARY
-                    firefox_found = True
-                else:
-                    logger.warning(f"配置的Firefox路径不存在: {cfg.FIREFOX_BINARY}")
-            
-            if not firefox_found:
-                logger.warning("未找到Firefox浏览器路径，尝试使用默认路径")
-                
-                # 尝试手动查找常见路径
-                common_paths = []
-                
-                if os.name == 'nt':  # Windows
-                    common_paths = [
-                        r"C:\Program Files\Mozilla Firefox\firefox.exe",
-                        r"C:\Program Files (x86)\Mozilla Firefox\firefox.exe",
-                        os.path.expandvars(r"%LOCALAPPDATA%\Mozilla Firefox\firefox.exe"),
-                        # 尝试特定的安装路径
-                        r"C:\Program Files\Firefox Developer Edition\firefox.exe",
-                        r"C:\Program Files\Firefox Nightly\firefox.exe",
-                        # 可能从网站下载的便携版路径
-                        os.path.expandvars(r"%USERPROFILE%\Downloads\Firefox\firefox.exe"),
-                        os.path.expandvars(r"%USERPROFILE%\Desktop\Firefox\firefox.exe")
-                    ]
-                elif os.name == 'posix':  # Linux/Mac
-                    common_paths = [
-                        "/usr/bin/firefox",
-                        "/usr/lib/firefox/firefox",
-                        "/usr/local/bin/firefox",
-                        "/snap/bin/firefox",
-                        "/Applications/Firefox.app/Contents/MacOS/firefox",
-                        os.path.expanduser("~/Applications/Firefox.app/Contents/MacOS/firefox")
-                    ]
-                
-                for path in common_paths:
-                    if os.path.exists(path):
-                        logger.info(f"找到Firefox路径: {path}")
-                        firefox_options.binary_location = path
-                        firefox_found = True
-                        break
-            
-            if not firefox_found:
-                # 使用"where"或"which"命令查找Firefox
-                try:
-                    if os.name == 'nt':  # Windows
-                        result = subprocess.run(["where", "firefox"], 
-                                            capture_output=True, 
-                                            text=True,
-                                            encoding=cfg.DEFAULT_ENCODING,
-                                            errors='replace')
-                    else:  # Linux/Mac
-                        result = subprocess.run(["which", "firefox"], 
-                                            capture_output=True, 
-                                            text=True,
-                                            encoding=cfg.DEFAULT_ENCODING,
-                                            errors='replace')
-                    
-                    if result.returncode == 0 and result.stdout.strip():
-                        firefox_path = result.stdout.strip().split('\n')[0]
-                        logger.info(f"通过系统命令找到Firefox路径: {firefox_path}")
-                        firefox_options.binary_location = firefox_path
-                        firefox_found = True
-                except Exception as e:
-                    logger.warning(f"通过系统命令查找Firefox失败: {e}")
-            
-            if not firefox_found:
+            firefox_binary = self._find_firefox_binary()
+            if not firefox_binary:
                 raise RuntimeError("无法找到Firefox浏览器，请在配置中指定正确的路径")
+            firefox_options.binary_location = firefox_binary
             
             # 使用自定义驱动路径或自动下载
             if cfg.DRIVER_PATH:
@@ -207,14 +675,19 @@ class BrowserManager:
                 service = FirefoxService(executable_path=cfg.DRIVER_PATH, log_path=cfg.GECKODRIVER_LOG_PATH)
             elif cfg.DOWNLOAD_DRIVER:
                 logger.debug("自动下载 Firefox 驱动")
-                driver_path = GeckoDriverManager().install()
+                driver_path = _resolve_driver_path('firefox', _install_geckodriver)
                 service = FirefoxService(executable_path=driver_path, log_path=cfg.GECKODRIVER_LOG_PATH)
             else:
                 logger.debug("使用系统默认 Firefox 驱动")
                 service = FirefoxService(log_path=cfg.GECKODRIVER_LOG_PATH)
             
             # 初始化 Firefox 浏览器
-            driver = webdriver.Firefox(service=service, options=firefox_options)
+            try:
+                driver = webdriver.Firefox(service=service, options=firefox_options)
+            except Exception:
+                if not cfg.DRIVER_PATH and cfg.DOWNLOAD_DRIVER:
+                    _forget_driver_path('firefox')
+                raise
             logger.debug("Firefox 浏览器初始化成功")
             return driver
             
@@ -236,6 +709,7 @@ class BrowserManager:
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument(f"--window-size={cfg.BROWSER_WIDTH},{cfg.BROWSER_HEIGHT}")
             chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+            chrome_options.page_load_strategy = getattr(cfg, 'PAGE_LOAD_STRATEGY', 'normal')
             
             # 添加用户代理
             chrome_options.add_argument(f"--user-agent={cfg.BROWSER_USER_AGENT}")
@@ -254,21 +728,18 @@ class BrowserManager:
                 logger.warning(f"未找到Chrome二进制文件: {e}")
                 # 尝试继续，让WebDriver管理器处理
             
-            # 初始化WebDriver
-            try:
+            # 初始化WebDriver，与Firefox/Edge一致：优先使用自定义驱动路径，其次自动下载
+            if cfg.DRIVER_PATH:
+                logger.debug(f"使用自定义 Chrome 驱动路径: {cfg.DRIVER_PATH}")
                 driver = webdriver.Chrome(
-                    service=ChromeService(ChromeDriverManager().install()),
+                    service=ChromeService(executable_path=cfg.DRIVER_PATH),
                     options=chrome_options
                 )
-            except Exception as chrome_error:
-                logger.error(f"使用ChromeDriverManager初始化失败: {chrome_error}")
-                # 尝试使用不同的方式初始化
-                try:
-                    driver = webdriver.Chrome(options=chrome_options)
-                    logger.info("使用默认Chrome驱动初始化成功")
-                except Exception as e:
-                    logger.error(f"使用默认Chrome驱动初始化也失败: {e}")
-                    raise chrome_error  # 抛出原始错误
+            elif not cfg.DOWNLOAD_DRIVER:
+                logger.debug("使用系统默认 Chrome 驱动")
+                driver = webdriver.Chrome(service=ChromeService(), options=chrome_options)
+            else:
+                driver = self._start_chrome_with_managed_driver(chrome_options)
             
             # 设置页面加载超时
             driver.set_page_load_timeout(cfg.PAGE_LOAD_TIMEOUT)
@@ -281,6 +752,8 @@ class BrowserManager:
                     })
                 """
             })
+            if getattr(cfg, 'STEALTH_MODE_DEFAULT', False):
+                self._register_stealth_script(driver)
             
             logger.debug("Chrome 浏览器初始化成功")
             return driver
@@ -289,10 +762,32 @@ class BrowserManager:
             logger.error(f"Chrome 浏览器初始化失败: {str(e)}")
             raise
     
+    def _start_chrome_with_managed_driver(self, chrome_options):
+        """使用ChromeDriverManager管理的驱动启动Chrome，失败时回退到Selenium默认驱动"""
+        try:
+            driver_path = _resolve_driver_path('chrome', _install_chromedriver)
+            return webdriver.Chrome(
+                service=ChromeService(driver_path),
+                options=chrome_options
+            )
+        except Exception as chrome_error:
+            logger.error(f"使用ChromeDriverManager初始化失败: {chrome_error}")
+            _forget_driver_path('chrome')
+            # 尝试使用不同的方式初始化
+            try:
+                driver = webdriver.Chrome(options=chrome_options)
+                logger.info("使用默认Chrome驱动初始化成功")
+                return driver
+            except Exception as e:
+                logger.error(f"使用默认Chrome驱动初始化也失败: {e}")
+                raise chrome_error  # 抛出原始错误
+    
     def _initialize_edge(self):
         """初始化 Edge 浏览器"""
         try:
             logger.debug("初始化 Edge 浏览器...")
+            from selenium.webdriver.edge.service import Service as EdgeService
+            from selenium.webdriver.edge.options import Options as EdgeOptions
             
             # 设置 Edge 选项
             edge_options = EdgeOptions()
@@ -302,6 +797,7 @@ class BrowserManager:
             edge_options.add_argument('--disable-dev-shm-usage')
             edge_options.add_argument('--disable-gpu')
             edge_options.add_argument(f'--window-size={cfg.BROWSER_WIDTH},{cfg.BROWSER_HEIGHT}')
+            edge_options.page_load_strategy = getattr(cfg, 'PAGE_LOAD_STRATEGY', 'normal')
             
             # 设置用户代理
             edge_options.add_argument(f'--user-agent={cfg.BROWSER_USER_AGENT}')
@@ -316,14 +812,19 @@ class BrowserManager:
                 service = EdgeService(executable_path=cfg.DRIVER_PATH)
             elif cfg.DOWNLOAD_DRIVER:
                 logger.debug("自动下载 Edge 驱动")
-                driver_path = EdgeChromiumDriverManager().install()
+                driver_path = _resolve_driver_path('edge', _install_edgedriver)
                 service = EdgeService(executable_path=driver_path)
             else:
                 logger.debug("使用系统默认 Edge 驱动")
                 service = EdgeService()
             
             # 初始化 Edge 浏览器
-            driver = webdriver.Edge(service=service, options=edge_options)
+            try:
+                driver = webdriver.Edge(service=service, options=edge_options)
+            except Exception:
+                if not cfg.DRIVER_PATH and cfg.DOWNLOAD_DRIVER:
+                    _forget_driver_path('edge')
+                raise
             logger.debug("Edge 浏览器初始化成功")
             return driver
             
@@ -331,13 +832,14 @@ class BrowserManager:
             logger.error(f"初始化 Edge 浏览器失败: {str(e)}")
             raise
 
+    @_with_driver_lock
     def get_page_content(self, url, wait_for_selector=None, wait_time=10, click_selectors=None, scroll=False, scroll_wait=1, max_scrolls=5, execute_scripts=None, cookies=None, check_content_size=True, browser_options=None):
         """
         获取页面内容，支持等待特定元素、点击元素和滚动页面
         
         Args:
             url: 页面URL
-            wait_for_selector: 等待特定元素出现的CSS选择器
+            wait_for_selector: 等待特定元素出现的CSS选择器，也可以是候选选择器列表（任一出现即可）
             wait_time: 页面加载后等待的基本时间(秒)
             click_selectors: 需要点击的元素的CSS选择器列表
             scroll: 是否滚动页面以加载更多内容
@@ -351,6 +853,15 @@ class BrowserManager:
         Returns:
             str: 页面HTML内容
         """
+        # 不需要任何浏览器交互时先尝试直接HTTP请求，服务端渲染的页面无需启动浏览器
+        needs_browser = (wait_for_selector or click_selectors or scroll or execute_scripts
+                         or cookies or browser_options)
+        if not needs_browser and getattr(cfg, 'HTTP_FAST_PATH', True):
+            content = _fetch_static_html(url)
+            if content:
+                logger.info(f"通过HTTP直接获取页面内容: {url} ({len(content)} 字节)")
+                return content
+        
         if not self.is_initialized:
             if not self.initialize_browser():
                 raise Exception("浏览器初始化失败")
@@ -374,119 +885,43 @@ class BrowserManager:
         # 尝试多次获取页面内容
         for attempt in range(cfg.MAX_RETRIES):
             try:
+                # 重试前确认会话仍然可用，只有会话失效时才重建浏览器，其他错误沿用当前会话
+                if attempt > 0 and not self._ensure_live_session():
+                    raise Exception("浏览器会话失效且重新初始化失败")
                 logger.info(f"正在访问页面: {url} (尝试 {attempt + 1}/{cfg.MAX_RETRIES})")
                 
-                # 设置页面加载策略
-                if page_load_strategy:
-                    try:
-                        # 可选值: normal, eager, none
-                        # normal (默认) - 等待所有资源加载完成
-                        # eager - 仅等待HTML和DOM完成
-                        # none - 不等待任何资源加载
-                        self.driver.execute_cdp_cmd('Page.setDocumentContent', {'content': ''})
-                        self.driver.execute_cdp_cmd('Page.setLifecycleEventsEnabled', {'enabled': True})
-                        
-                        if page_load_strategy == 'eager':
-                            logger.info("使用eager页面加载策略，仅等待DOM完成")
-                            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {
-                                "urls": ["*.jpg", "*.jpeg", "*.png", "*.gif", "*.css", "*.woff", "*.woff2", "*.ttf"]
-                            })
-                        elif page_load_strategy == 'none':
-                            logger.info("使用none页面加载策略，不等待任何资源加载")
-                            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {
-                                "urls": ["*.jpg", "*.jpeg", "*.png", "*.gif", "*.css", "*.js", "*.woff", "*.woff2", "*.ttf"]
-                            })
-                        elif page_load_strategy == 'normal':
-                            logger.info("使用normal页面加载策略，等待所有资源加载")
-                        else:
-                            logger.warning(f"未知的页面加载策略: {page_load_strategy}，使用默认策略")
-                        
-                        self.driver.execute_cdp_cmd('Network.enable', {})
-                    except Exception as e:
-                        logger.warning(f"设置页面加载策略失败: {str(e)}")
+                # 页面加载策略本身在创建驱动时通过cfg.PAGE_LOAD_STRATEGY设置，会话中途无法更改；
+                # 单次请求的page_load_strategy只决定屏蔽哪些资源，与禁用图片的规则合并后一次设置
+                # 可选值: normal, eager, none
+                # normal (默认) - 加载所有资源
+                # eager - 屏蔽图片、样式和字体
+                # none - 另外屏蔽脚本
+                blocked_urls = []
+                if page_load_strategy == 'eager':
+                    logger.info("使用eager页面加载策略，屏蔽图片、样式和字体")
+                    blocked_urls.extend(_EAGER_BLOCKED_URLS)
+                elif page_load_strategy == 'none':
+                    logger.info("使用none页面加载策略，屏蔽图片、样式、字体和脚本")
+                    blocked_urls.extend(_NONE_BLOCKED_URLS)
+                elif page_load_strategy and page_load_strategy != 'normal':
+                    logger.warning(f"未知的页面加载策略: {page_load_strategy}，使用默认策略")
                 
                 # 应用隐身模式脚本，使浏览器更难被识别为自动化工具
                 if stealth_mode:
                     logger.info("应用隐身模式以避免被检测为自动化工具")
-                    stealth_script = """
-                    // 覆盖navigator对象的一些属性，使其看起来更像真实浏览器
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => false
-                    });
-                    
-                    // 清除自动化相关的标志
-                    if (window.navigator.plugins) {
-                        Object.defineProperty(navigator, 'plugins', {
-                            get: () => {
-                                return {
-                                    length: 5,
-                                    item: function(index) { return this[index]; },
-                                    0: {name: 'Chrome PDF Plugin'},
-                                    1: {name: 'Chrome PDF Viewer'},
-                                    2: {name: 'Native Client'},
-                                    3: {name: 'Widevine Content Decryption Module'},
-                                    4: {name: 'Microsoft Edge PDF Plugin'}
-                                };
-                            }
-                        });
-                    }
-                    
-                    // 添加语言和平台信息
-                    Object.defineProperty(navigator, 'languages', {
-                        get: () => ['zh-CN', 'zh', 'en-US', 'en']
-                    });
-                    
-                    // 移除自动化测试标记
-                    const originalQuery = window.navigator.permissions.query;
-                    window.navigator.permissions.query = (parameters) => (
-                        parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                    );
-                    
-                    // 调整Chrome对象
-                    if (window.chrome) {
-                        window.chrome.runtime = {};
-                    }
-                    """
-                    try:
-                        self.driver.execute_script(stealth_script)
-                        logger.debug("隐身模式脚本执行成功")
-                    except Exception as e:
-                        logger.warning(f"隐身模式脚本执行失败: {str(e)}")
+                    self._register_stealth_script(self.driver)
                 
                 # 禁用图片加载以提高速度（如果需要）
                 if disable_images:
                     logger.info("禁用图片加载以提高速度")
-                    try:
-                        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {"urls": ["*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp"]})
-                        self.driver.execute_cdp_cmd('Network.enable', {})
-                    except Exception as e:
-                        logger.warning(f"禁用图片加载失败: {str(e)}")
+                    blocked_urls.extend(pattern for pattern in _IMAGE_BLOCKED_URLS if pattern not in blocked_urls)
+                
+                if blocked_urls:
+                    self._set_blocked_urls(blocked_urls)
                 
                 # 设置设备模拟（如桌面、手机等）
                 if emulate_device:
-                    try:
-                        if emulate_device.lower() == "mobile":
-                            # 模拟移动设备
-                            mobile_emulation = {
-                                "deviceMetrics": { "width": 360, "height": 640, "pixelRatio": 3.0 },
-                                "userAgent": "Mozilla/5.0 (Linux; Android 10; SM-G981B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36"
-                            }
-                            self.driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', mobile_emulation['deviceMetrics'])
-                            self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": mobile_emulation['userAgent']})
-                            logger.info("已启用移动设备模拟")
-                        elif emulate_device.lower() == "tablet":
-                            # 模拟平板设备
-                            tablet_emulation = {
-                                "deviceMetrics": { "width": 768, "height": 1024, "pixelRatio": 2.0 },
-                                "userAgent": "Mozilla/5.0 (iPad; CPU OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1"
-                            }
-                            self.driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', tablet_emulation['deviceMetrics'])
-                            self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": tablet_emulation['userAgent']})
-                            logger.info("已启用平板设备模拟")
-                    except Exception as e:
-                        logger.warning(f"设备模拟设置失败: {str(e)}")
+                    self._apply_device_emulation(emulate_device.lower())
                 
                 # 设置自定义请求头（如果有）
                 if headers:
@@ -496,125 +931,137 @@ class BrowserManager:
                             self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": headers["User-Agent"]})
                         
                         # 添加其他请求头
-                        header_script = """
-                        // 修改XMLHttpRequest以添加自定义头
-                        const originalOpen = XMLHttpRequest.prototype.open;
-                        XMLHttpRequest.prototype.open = function(method, url) {
-                            originalOpen.apply(this, arguments);
-                            
-                            // 添加自定义请求头
-                            """
-                        
-                        for header_name, header_value in headers.items():
-                            if header_name not in ["User-Agent"]:  # User-Agent已单独处理
-                                header_script += f'this.setRequestHeader("{header_name}", "{header_value}");\n'
-                        
-                        header_script += """
-                        };
-                        """
-                        
-                        self.driver.execute_script(header_script)
+                        self._register_header_script(headers)
                         logger.info("已设置自定义请求头")
                     except Exception as e:
                         logger.warning(f"设置自定义请求头失败: {str(e)}")
                 
                 # 如果有cookies，先添加
                 if cookies:
-                    logger.info(f"添加 {len(cookies) if isinstance(cookies, list) else '未知数量'} 个cookies")
-                    # 先访问域名根路径
-                    domain = url.split('/')[2]
-                    domain_url = f"{url.split(':')[0]}://{domain}"
-                    self.driver.get(domain_url)
+                    logger.info(f"添加 {len(cookies) if isinstance(cookies, (list, dict)) else '未知数量'} 个cookies")
+                    url_parts = urllib.parse.urlsplit(url)
+                    domain = url_parts.hostname
                     
-                    # 随机延迟以模拟人类行为
-                    if random_delay:
-                        delay = random.uniform(1.0, 3.0)
-                        time.sleep(delay)
-                    else:
-                        time.sleep(2)
-                    
-                    # 添加cookies
-                    if isinstance(cookies, list):
-                        for cookie in cookies:
-                            try:
-                                self.driver.add_cookie(cookie)
-                                logger.debug(f"添加cookie: {cookie.get('name')}")
-                            except Exception as e:
-                                logger.warning(f"添加cookie失败: {str(e)}")
-                    elif isinstance(cookies, dict):
-                        # 如果cookies是字典格式
-                        for name, value in cookies.items():
-                            try:
-                                self.driver.add_cookie({"name": name, "value": value, "domain": domain})
-                                logger.debug(f"添加cookie: {name}")
-                            except Exception as e:
-                                logger.warning(f"添加cookie失败: {str(e)}")
-                    
-                    logger.info("所有cookies添加完成，准备重新加载页面")
-                    # 随机延迟
-                    if random_delay:
-                        time.sleep(random.uniform(0.5, 1.5))
-                    else:
-                        time.sleep(1)
+                    # 优先通过CDP一次设置全部cookies，无需先打开目标域名；不支持CDP的浏览器逐个添加
+                    if not self._set_cookies_via_cdp(cookies, domain):
+                        # add_cookie要求当前页面属于cookie所在域名，先访问域名根路径
+                        domain_url = f"{url_parts.scheme}://{url_parts.netloc}"
+                        self.driver.get(domain_url)
+                        
+                        # 随机延迟以模拟人类行为
+                        if random_delay:
+                            delay = random.uniform(1.0, 3.0)
+                            if self._sleep(delay):
+                                return None
+                        else:
+                            if self._sleep(2):
+                                return None
+                        
+                        # 添加cookies
+                        if isinstance(cookies, list):
+                            for cookie in cookies:
+                                try:
+                                    self.driver.add_cookie(cookie)
+                                    logger.debug(f"添加cookie: {cookie.get('name')}")
+                                except Exception as e:
+                                    logger.warning(f"添加cookie失败: {str(e)}")
+                        elif isinstance(cookies, dict):
+                            # 如果cookies是字典格式
+                            for name, value in cookies.items():
+                                try:
+                                    self.driver.add_cookie({"name": name, "value": value, "domain": domain})
+                                    logger.debug(f"添加cookie: {name}")
+                                except Exception as e:
+                                    logger.warning(f"添加cookie失败: {str(e)}")
+                        
+                        logger.info("所有cookies添加完成，准备重新加载页面")
+                        # 随机延迟
+                        if random_delay:
+                            if self._sleep(random.uniform(0.5, 1.5)):
+                                return None
+                        else:
+                            if self._sleep(1):
+                                return None
                 
                 # 访问目标URL
                 self.driver.get(url)
                 
-                # 等待页面基本加载
-                logger.info(f"等待页面加载，基本等待时间: {wait_time}秒")
-                if random_delay:
-                    actual_wait = wait_time + random.uniform(-1.0, 1.0)
-                    actual_wait = max(1.0, actual_wait)  # 确保至少等待1秒
-                    time.sleep(actual_wait)
-                    logger.debug(f"随机等待时间: {actual_wait:.2f}秒")
-                else:
-                    time.sleep(wait_time)
-                
-                # 检查页面是否加载完成
-                ready_state = self.driver.execute_script("return document.readyState")
-                if ready_state != "complete":
-                    logger.warning(f"页面未完全加载，状态: {ready_state}")
-                    # 继续等待一段时间
-                    extra_wait = 5
-                    if random_delay:
-                        extra_wait += random.uniform(0, 3)
-                    logger.info(f"页面未完全加载，额外等待{extra_wait:.1f}秒")
-                    time.sleep(extra_wait)
-                else:
-                    logger.info("页面加载完成")
-                
-                # 获取页面标题和URL，用于调试
-                page_title = self.driver.title
-                current_url = self.driver.current_url
-                logger.info(f"当前页面标题: {page_title}, URL: {current_url}")
-                
-                # 检测是否需要登录（针对LinkedIn）
-                if "linkedin.com" in url.lower() and ("login" in current_url.lower() or "sign-in" in current_url.lower()):
-                    logger.warning("检测到LinkedIn登录页面，需要提供登录凭据")
-                    # 这里可以添加自动登录的代码，或返回特殊状态
-                    raise Exception("LinkedIn需要登录，请提供有效的登录Cookie")
-                
-                # 等待特定元素出现
+                # 指定了等待元素时直接显式等待该元素，元素出现即说明页面已可用，不再单独等待整页加载
                 if wait_for_selector:
-                    logger.info(f"等待元素出现: {wait_for_selector}")
+                    # 多个候选选择器合并为一个选择器组，一次页面加载内等待任一元素出现
+                    if isinstance(wait_for_selector, str):
+                        candidate_selectors = [wait_for_selector]
+                    else:
+                        candidate_selectors = list(wait_for_selector)
+                    selector_group = ", ".join(candidate_selectors)
+                    logger.info(f"等待元素出现: {selector_group}")
                     try:
-                        element = WebDriverWait(self.driver, wait_time).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, wait_for_selector))
-                        )
-                        logger.info(f"元素已找到: {wait_for_selector}")
+                        # 元素通常在页面加载后已经存在，先直接查找一次，找不到时才进入显式等待
+                        with self._explicit_wait_only():
+                            existing = self.driver.find_elements(*_css(selector_group))
+                            if existing:
+                                element = existing[0]
+                            else:
+                                element = self._get_wait(wait_time).until(
+                                    _css_condition(EC.presence_of_element_located, selector_group)
+                                )
+                        if len(candidate_selectors) > 1:
+                            matched_selector = self.driver.execute_script(
+                                "return arguments[0].find(s => document.querySelector(s)) || null;",
+                                candidate_selectors
+                            )
+                            logger.info(f"元素已找到: {matched_selector or selector_group}")
+                        else:
+                            logger.info(f"元素已找到: {wait_for_selector}")
                         # 随机模拟人类行为 - 鼠标移动到元素上
                         if random_delay and not emulate_device:  # 移动设备不需要模拟鼠标移动
                             try:
                                 action = ActionChains(self.driver)
                                 action.move_to_element(element).perform()
                                 logger.debug("已移动鼠标到目标元素")
-                                time.sleep(random.uniform(0.3, 0.8))
+                                if self._sleep(random.uniform(0.3, 0.8)):
+                                    return None
                             except Exception as e:
                                 logger.warning(f"鼠标移动失败: {str(e)}")
                     except TimeoutException:
                         logger.warning(f"等待元素超时: {wait_for_selector}")
                     except Exception as e:
                         logger.warning(f"等待元素时出错: {str(e)}")
+                else:
+                    # 轮询document.readyState等待页面加载完成，就绪后立即继续，wait_time为最长等待时间
+                    logger.info(f"等待页面加载，最长等待时间: {wait_time}秒")
+                    try:
+                        self._get_wait(wait_time, poll_frequency=0.2).until(_document_ready)
+                        ready_state = "complete"
+                    except TimeoutException:
+                        ready_state = self.driver.execute_script("return document.readyState")
+                    
+                    if ready_state != "complete":
+                        logger.warning(f"页面未完全加载，状态: {ready_state}")
+                        # 继续等待一段时间
+                        extra_wait = 5
+                        if random_delay:
+                            extra_wait += random.uniform(0, 3)
+                        logger.info(f"页面未完全加载，额外等待{extra_wait:.1f}秒")
+                        if self._sleep(extra_wait):
+                            return None
+                    else:
+                        logger.info("页面加载完成")
+                        # 随机模拟人类行为，加载完成后再短暂停顿
+                        if random_delay:
+                            if self._sleep(random.uniform(0.1, 0.3)):
+                                return None
+                
+                # 获取页面标题和URL，用于调试
+                page_title = self.driver.title
+                current_url = self.driver.current_url
+                logger.info(f"当前页面标题: {page_title}, URL: {current_url}")
+                
+                # 检测是否需要登录（针对LinkedIn）
+                if "linkedin.com" in url.lower() and _LINKEDIN_LOGIN_RE.search(current_url):
+                    logger.warning("检测到LinkedIn登录页面，需要提供登录凭据")
+                    # 这里可以添加自动登录的代码，或返回特殊状态
+                    raise Exception("LinkedIn需要登录，请提供有效的登录Cookie")
                 
                 # 执行自定义JavaScript
                 if execute_scripts:
@@ -625,52 +1072,55 @@ class BrowserManager:
                             
                             # 随机延迟以模拟人类行为
                             if random_delay:
-                                time.sleep(random.uniform(0.2, 1.0))
+                                if self._sleep(random.uniform(0.2, 1.0)):
+                                    return None
                             else:
-                                time.sleep(0.5)
+                                if self._sleep(0.5):
+                                    return None
                         except Exception as e:
                             logger.warning(f"执行JavaScript脚本失败: {str(e)}")
                 
                 # 点击指定的元素
                 if click_selectors:
-                    for selector in click_selectors:
+                    pending_selectors = list(click_selectors)
+                    # 不模拟人类行为时在浏览器内批量点击，所有选择器共用一个等待期限；
+                    # 只有批量脚本执行失败时，剩余的选择器才逐个等待并点击
+                    if not random_delay:
+                        pending_selectors = self._batch_click(pending_selectors, 5)
+                    
+                    for selector in pending_selectors:
                         try:
                             logger.info(f"尝试点击元素: {selector}")
-                            # 首先尝试用 JavaScript 点击，然后回退到 Selenium 点击
-                            try:
-                                element = WebDriverWait(self.driver, 5).until(
-                                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+                            with self._explicit_wait_only():
+                                element = self._get_wait(5).until(
+                                    _css_condition(EC.element_to_be_clickable, selector)
                                 )
-                                
-                                # 随机模拟人类行为 - 鼠标移动和延迟
-                                if random_delay and not emulate_device:
-                                    try:
-                                        action = ActionChains(self.driver)
-                                        action.move_to_element(element).pause(random.uniform(0.1, 0.3)).perform()
-                                    except Exception as e:
-                                        logger.debug(f"鼠标移动模拟失败: {str(e)}")
-                                
-                                # 使用JavaScript点击
+                            
+                            # 随机模拟人类行为 - 只在部分点击前移动鼠标，停顿由点击后的随机等待提供
+                            if random_delay and not emulate_device and random.random() < _MOUSE_MOVE_PROBABILITY:
+                                try:
+                                    ActionChains(self.driver).move_to_element(element).perform()
+                                except Exception as e:
+                                    logger.debug(f"鼠标移动模拟失败: {str(e)}")
+                            
+                            # 首先使用Selenium点击，元素被遮挡或不可交互时回退到JavaScript点击
+                            try:
+                                element.click()
+                                logger.info(f"成功通过Selenium点击元素: {selector}")
+                            except (ElementNotInteractableException, ElementClickInterceptedException) as click_e:
+                                logger.debug(f"Selenium点击失败，尝试JavaScript点击: {str(click_e)}")
                                 self.driver.execute_script("arguments[0].click();", element)
                                 logger.info(f"成功通过JavaScript点击元素: {selector}")
-                            except Exception as js_e:
-                                logger.warning(f"JavaScript点击失败，尝试Selenium点击: {str(js_e)}")
-                                try:
-                                    element = WebDriverWait(self.driver, 5).until(
-                                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                                    )
-                                    element.click()
-                                    logger.info(f"成功通过Selenium点击元素: {selector}")
-                                except Exception as sel_e:
-                                    logger.error(f"Selenium点击也失败: {str(sel_e)}")
-                                    continue
                             
-                            # 点击后等待页面响应
-                            wait_after_click = 2
+                            # 点击后等待页面响应；模拟人类行为时保留随机停顿，否则页面空闲后立即继续
                             if random_delay:
                                 wait_after_click = random.uniform(1.5, 3.0)
-                            logger.info(f"点击后等待页面响应 {wait_after_click:.1f} 秒")
-                            time.sleep(wait_after_click)
+                                logger.info(f"点击后等待页面响应 {wait_after_click:.1f} 秒")
+                                if self._sleep(wait_after_click):
+                                    return None
+                            else:
+                                logger.info("点击后等待页面响应，最长 2.0 秒")
+                                self._wait_page_idle(2)
                             
                         except TimeoutException:
                             logger.warning(f"查找点击元素超时: {selector}")
@@ -680,54 +1130,12 @@ class BrowserManager:
                 # 滚动页面以加载更多内容
                 if scroll:
                     logger.info(f"开始滚动页面，最大滚动次数: {max_scrolls}")
-                    
-                    last_height = self.driver.execute_script("return document.body.scrollHeight")
-                    scroll_count = 0
-                    
-                    while scroll_count < max_scrolls:
-                        # 滚动到页面底部
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        
-                        # 添加随机滚动行为以模拟人类
-                        if random_delay:
-                            # 有时随机滚动回上方一点
-                            if random.random() < 0.3:  # 30%的概率
-                                scroll_up = random.uniform(100, 300)
-                                self.driver.execute_script(f"window.scrollBy(0, -{scroll_up});")
-                                logger.debug(f"随机向上滚动 {scroll_up:.0f} 像素")
-                                time.sleep(random.uniform(0.3, 0.7))
-                        
-                        # 等待页面加载
-                        actual_scroll_wait = scroll_wait
-                        if random_delay:
-                            actual_scroll_wait = scroll_wait + random.uniform(-0.5, 0.8)
-                            actual_scroll_wait = max(0.5, actual_scroll_wait)  # 确保最少等待0.5秒
-                        
-                        logger.debug(f"滚动等待时间: {actual_scroll_wait:.1f}秒")
-                        time.sleep(actual_scroll_wait)
-                        
-                        # 计算新的滚动高度并与最后的滚动高度进行比较
-                        new_height = self.driver.execute_script("return document.body.scrollHeight")
-                        if new_height == last_height:
-                            # 尝试再次滚动，有时第一次滚动可能没有触发加载
-                            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                            time.sleep(actual_scroll_wait)
-                            
-                            new_height = self.driver.execute_script("return document.body.scrollHeight")
-                            if new_height == last_height:
-                                logger.info("页面高度未变化，停止滚动")
-                                break
-                        
-                        last_height = new_height
-                        scroll_count += 1
-                        logger.info(f"完成第 {scroll_count}/{max_scrolls} 次滚动")
-                
-                # 获取页面内容
-                content = self.driver.page_source
+                    final_height, scroll_count = self._autoscroll(max_scrolls, scroll_wait, random_delay)
+                    logger.info(f"完成 {scroll_count}/{max_scrolls} 次滚动，页面高度: {final_height}")
                 
-                # 检查内容大小（如果需要）
-                if check_content_size and content:
-                    content_size = len(content)
+                # 检查内容大小（如果需要）；先在浏览器内计算HTML长度，确定内容可用后才传输完整页面源码
+                if check_content_size:
+                    content_size = self.driver.execute_script(_CONTENT_SIZE_JS)
                     if content_size < 1000:  # 内容太小可能表示加载不完整
                         logger.warning(f"页面内容大小过小 ({content_size} 字节)，可能未完全加载")
                         
@@ -736,42 +1144,36 @@ class BrowserManager:
                         if random_delay:
                             extra_wait += random.uniform(0, 3)
                         logger.info(f"内容过小，额外等待 {extra_wait:.1f} 秒")
-                        time.sleep(extra_wait)
+                        if self._sleep(extra_wait):
+                            return None
                         
-                        # 再次尝试获取内容
-                        content = self.driver.page_source
-                        new_size = len(content)
+                        # 再次检查内容大小
+                        new_size = self.driver.execute_script(_CONTENT_SIZE_JS)
                         
                         logger.info(f"重新获取内容大小: {new_size} 字节 (之前: {content_size} 字节)")
                     else:
                         logger.info(f"页面内容大小: {content_size} 字节")
                 
+                # 获取页面内容
+                content = self._read_page_source()
+                
                 logger.info(f"成功获取页面内容: {url}")
                 return content
                 
             except Exception as e:
                 logger.error(f"获取页面内容时出错: {str(e)}")
-                # 捕获页面截图以便调试
-                try:
-                    screenshot_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs", "screenshots")
-                    os.makedirs(screenshot_dir, exist_ok=True)
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"error_{timestamp}_{attempt}.png"
-                    screenshot_path = os.path.join(screenshot_dir, filename)
-                    self.driver.save_screenshot(screenshot_path)
-                    logger.info(f"错误截图已保存: {screenshot_path}")
-                except Exception as ss_e:
-                    logger.warning(f"无法保存错误截图: {str(ss_e)}")
+                # 捕获页面截图以便调试，仅在cfg.DEBUG_SCREENSHOTS开启时截图，写入文件在后台线程完成
+                if getattr(cfg, 'DEBUG_SCREENSHOTS', False):
+                    self._capture_error_screenshot(attempt)
                 
                 if attempt < cfg.MAX_RETRIES - 1:
                     wait_time = (attempt + 1) * 3  # 递增等待时间
                     logger.info(f"将在 {wait_time} 秒后重试...")
-                    time.sleep(wait_time)
+                    if self._sleep(wait_time):
+                        return None
                     # 尝试刷新浏览器状态
                     try:
-                        self.driver.delete_all_cookies()
-                        self.driver.execute_script("window.localStorage.clear();")
-                        self.driver.execute_script("window.sessionStorage.clear();")
+                        self._clear_browser_state()
                         logger.info("已清除cookies和存储")
                     except Exception as clear_e:
                         logger.warning(f"清除浏览器状态时出错: {str(clear_e)}")
@@ -781,7 +1183,8 @@ class BrowserManager:
                         logger.info("尝试重启浏览器...")
                         self.restart_attempted = True
                         self.close_browser()
-                        time.sleep(5)
+                        if self._sleep(5):
+                            return None
                         if self.initialize_browser():
                             logger.info("浏览器已重启，再次尝试获取页面内容")
                             # 递归调用，但不传递restart_attempted标志，以避免无限循环
@@ -796,12 +1199,293 @@ class BrowserManager:
         logger.error(f"无法获取页面内容: {url}")
         return None
 
+    def _ensure_live_session(self):
+        """
+        检查当前浏览器会话是否可用，会话或窗口已失效时重新初始化浏览器
+
+        Returns:
+            bool: 会话可用或重新初始化成功时返回True
+        """
+        try:
+            self.driver.current_window_handle
+            return True
+        except (InvalidSessionIdException, NoSuchWindowException) as e:
+            logger.warning(f"浏览器会话已失效，重新初始化浏览器: {str(e)}")
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        return self.initialize_browser()
+
+    def _set_cookies_via_cdp(self, cookies, domain):
+        """
+        通过CDP的Network.setCookies一次设置全部cookies
+
+        Args:
+            cookies: cookie字典列表（与add_cookie格式相同），或{名称: 值}字典
+            domain: 未指定domain的cookie使用的域名
+
+        Returns:
+            bool: 设置成功返回True，浏览器不支持CDP或设置失败时返回False
+        """
+        if isinstance(cookies, dict):
+            cookies = [{"name": name, "value": value} for name, value in cookies.items()]
+        elif not isinstance(cookies, list):
+            return False
+        
+        try:
+            cdp_cookies = []
+            for cookie in cookies:
+                cdp_cookie = {
+                    "name": cookie["name"],
+                    "value": str(cookie["value"]),
+                    "domain": cookie.get("domain") or domain,
+                    "path": cookie.get("path", "/"),
+                }
+                for key, cdp_key in _COOKIE_CDP_FIELDS:
+                    if key in cookie:
+                        cdp_cookie[cdp_key] = cookie[key]
+                cdp_cookies.append(cdp_cookie)
+            
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+        except Exception as e:
+            logger.debug(f"通过CDP设置cookies失败，改为逐个添加: {str(e)}")
+            return False
+        logger.info(f"已通过CDP设置 {len(cdp_cookies)} 个cookies")
+        return True
+
+    def _set_blocked_urls(self, urls):
+        """
+        通过CDP设置要屏蔽的资源URL
+
+        屏蔽规则保存在驱动上，与上次设置相同时不再重复发送；Network.enable每个驱动只调用一次。
+        """
+        signature = frozenset(urls)
+        try:
+            if signature != self._blocked_urls_sig:
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {"urls": list(urls)})
+                self._blocked_urls_sig = signature
+            if not self._network_enabled:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self._network_enabled = True
+        except Exception as e:
+            logger.warning(f"设置资源屏蔽失败: {str(e)}")
+
+    def _register_stealth_script(self, driver):
+        """
+        通过Page.addScriptToEvaluateOnNewDocument注册隐身模式脚本
+
+        脚本对之后加载的每个页面自动生效，每个驱动只需注册一次。
+        """
+        if self._stealth_registered:
+            return
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _STEALTH_JS})
+            self._stealth_registered = True
+            logger.debug("隐身模式脚本注册成功")
+        except Exception as e:
+            logger.warning(f"隐身模式脚本注册失败: {str(e)}")
+
+    def _apply_device_emulation(self, device):
+        """
+        通过CDP模拟移动设备或平板
+
+        模拟设置保存在驱动上，与当前已应用的设备相同时不再重复发送。
+        """
+        emulation = _DEVICE_EMULATION.get(device)
+        if emulation is None or device == self._emulated_device:
+            return
+        try:
+            self.driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', emulation['deviceMetrics'])
+            self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": emulation['userAgent']})
+            self._emulated_device = device
+            logger.info(f"已启用{emulation['label']}模拟")
+        except Exception as e:
+            logger.warning(f"设备模拟设置失败: {str(e)}")
+
+    def _register_header_script(self, headers):
+        """
+        注册给XMLHttpRequest添加自定义请求头的脚本，对之后加载的每个页面生效
+
+        请求头未变化时不重复注册；变化时先移除上次注册的脚本，避免多层包装open。
+        """
+        signature = tuple((str(name), str(value)) for name, value in headers.items())
+        if signature == self._header_script_sig:
+            return
+        if self._header_script_id is not None:
+            self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument",
+                                        {"identifier": self._header_script_id})
+            self._header_script_id = None
+            self._header_script_sig = None
+        result = self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                             {"source": _build_header_script(headers)})
+        self._header_script_id = result.get("identifier") if isinstance(result, dict) else None
+        self._header_script_sig = signature
+
+    def _reset_driver_state(self):
+        """清空与当前驱动绑定的缓存状态，驱动重建或关闭时调用"""
+        self._wait_cache.clear()
+        self._blocked_urls_sig = None
+        self._network_enabled = False
+        self._stealth_registered = False
+        self._header_script_id = None
+        self._header_script_sig = None
+        self._emulated_device = None
+
+    def _capture_error_screenshot(self, attempt):
+        """截取当前页面并交给后台线程保存，Chrome和Edge使用体积更小、编码更快的JPEG"""
+        try:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            if cfg.BROWSER_TYPE.lower() in ('chrome', 'edge'):
+                result = self.driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "jpeg", "quality": 60})
+                image_base64, extension = result["data"], "jpg"
+            else:
+                image_base64, extension = self.driver.get_screenshot_as_base64(), "png"
+            screenshot_path = os.path.join(_SCREENSHOT_DIR, f"error_{timestamp}_{attempt}.{extension}")
+            _queue_screenshot(screenshot_path, image_base64)
+        except Exception as ss_e:
+            logger.warning(f"无法保存错误截图: {str(ss_e)}")
+
+    def _clear_browser_state(self):
+        """清除cookies以及当前页面的localStorage和sessionStorage"""
+        if cfg.BROWSER_TYPE.lower() in ('chrome', 'edge'):
+            try:
+                # 一条CDP命令清除全部cookies，无需先读取再逐个删除
+                self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception as e:
+                logger.debug(f"通过CDP清除cookies失败，改用delete_all_cookies: {str(e)}")
+                self.driver.delete_all_cookies()
+        else:
+            self.driver.delete_all_cookies()
+        # 两种存储在一次脚本调用中清除；about:blank等页面访问存储会抛出异常，忽略即可
+        self.driver.execute_script(
+            "try { window.localStorage.clear(); } catch (e) {}"
+            "try { window.sessionStorage.clear(); } catch (e) {}"
+        )
+
+    def _read_page_source(self):
+        """
+        读取当前页面的HTML
+
+        Chrome和Edge通过CDP的DOM.getOuterHTML直接读取文档HTML，
+        其他浏览器或CDP调用失败时使用page_source。
+        """
+        if cfg.BROWSER_TYPE.lower() in ('chrome', 'edge'):
+            try:
+                # 只需要根节点的nodeId，depth为0时不返回子节点
+                document = self.driver.execute_cdp_cmd("DOM.getDocument", {"depth": 0})
+                result = self.driver.execute_cdp_cmd("DOM.getOuterHTML", {"nodeId": document["root"]["nodeId"]})
+                return result["outerHTML"]
+            except Exception as e:
+                logger.debug(f"通过CDP读取页面HTML失败，改用page_source: {str(e)}")
+        return self.driver.page_source
+
+    @contextlib.contextmanager
+    def _explicit_wait_only(self):
+        """显式等待期间关闭隐式等待，避免每次查找元素都叠加cfg.IMPLICIT_WAIT秒"""
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            try:
+                self.driver.implicitly_wait(cfg.IMPLICIT_WAIT)
+            except Exception as e:
+                logger.debug(f"恢复隐式等待失败: {str(e)}")
+
+    def _get_wait(self, timeout, poll_frequency=0.5):
+        """返回当前驱动上指定超时和轮询间隔的WebDriverWait，相同参数复用同一个实例"""
+        key = (timeout, poll_frequency)
+        wait = self._wait_cache.get(key)
+        if wait is None:
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency)
+            self._wait_cache[key] = wait
+        return wait
+
+    def _batch_click(self, selectors, timeout):
+        """
+        在浏览器内批量点击可见元素，未出现的元素在timeout秒内反复尝试
+
+        所有选择器共用同一个等待期限，每次轮询只需一次execute_script，
+        点击一个元素后新出现的元素会在下一次轮询中被点击。
+
+        Args:
+            selectors: CSS选择器列表
+            timeout: 最长等待时间(秒)
+
+        Returns:
+            list: 需要改为逐个点击的选择器；仅在批量脚本执行失败时非空
+        """
+        remaining = list(selectors)
+        clicked_any = False
+
+        def click_remaining(driver):
+            nonlocal remaining, clicked_any
+            results = driver.execute_script(_CLICK_VISIBLE_JS, remaining)
+            clicked = [selector for selector, ok in zip(remaining, results) if ok]
+            if clicked:
+                logger.info(f"成功通过JavaScript批量点击 {len(clicked)} 个元素: {clicked}")
+                clicked_any = True
+                remaining = [selector for selector, ok in zip(remaining, results) if not ok]
+            return not remaining
+
+        try:
+            self._get_wait(timeout, poll_frequency=0.2).until(click_remaining)
+        except TimeoutException:
+            for selector in remaining:
+                logger.warning(f"查找点击元素超时: {selector}")
+            remaining = []
+        except Exception as e:
+            logger.warning(f"批量点击元素失败，改为逐个点击: {str(e)}")
+
+        if clicked_any:
+            logger.info("点击后等待页面响应，最长 2.0 秒")
+            self._wait_page_idle(2)
+        return remaining
+
+    def _autoscroll(self, max_scrolls, scroll_wait, randomize):
+        """
+        通过一次异步脚本完成全部滚动，页面高度不再增加时提前结束
+
+        每次滚动最多等待两次（首次滚动未触发加载时再滚动一次），随机模式下单次等待最多增加0.8秒；
+        最长耗时超过脚本超时时间时临时延长超时。
+
+        Returns:
+            tuple: (最终页面高度, 实际滚动次数)
+        """
+        max_duration = max_scrolls * 2 * (scroll_wait + (0.8 if randomize else 0)) + 5
+        extend_timeout = max_duration > cfg.SCRIPT_TIMEOUT
+        if extend_timeout:
+            self.driver.set_script_timeout(max_duration)
+        try:
+            final_height, scroll_count = self.driver.execute_async_script(
+                _AUTOSCROLL_JS, max_scrolls, int(scroll_wait * 1000), bool(randomize)
+            )
+        finally:
+            if extend_timeout:
+                self.driver.set_script_timeout(cfg.SCRIPT_TIMEOUT)
+        return final_height, scroll_count
+
+    def _wait_page_idle(self, timeout):
+        """
+        等待页面加载完成且没有进行中的jQuery请求，最长等待timeout秒
+
+        Returns:
+            bool: 在超时前进入空闲状态返回True
+        """
+        try:
+            self._get_wait(timeout, poll_frequency=0.2).until(_page_idle)
+            return True
+        except TimeoutException:
+            logger.debug(f"等待页面空闲超时 ({timeout} 秒)")
+            return False
+
     def get_driver(self):
         """获取浏览器驱动实例"""
         if not self.is_initialized:
             self.initialize_browser()
         return self.driver
 
+    @_with_driver_lock
     def close(self):
         """关闭浏览器"""
         if self.driver:
@@ -822,6 +1506,7 @@ class BrowserManager:
                         # 确保状态被重置
                         self.is_initialized = False
                         self.driver = None
+                        self._reset_driver_state()
                         self.restart_attempted = False  # 重置重启标志
                         logger.info("浏览器状态已重置")
             except Exception as e:
@@ -829,88 +1514,284 @@ class BrowserManager:
                 # 确保状态被重置
                 self.is_initialized = False
                 self.driver = None
+                self._reset_driver_state()
                 self.restart_attempted = False  # 重置重启标志
 
     def close_browser(self):
         """关闭浏览器并重置状态，供get_page_content使用"""
         self.close()  # 复用已有的关闭逻辑
 
+    def shutdown(self):
+        """
+        中断正在进行的get_page_content并关闭浏览器，可从其他线程调用
+
+        正在等待的get_page_content立即返回None；浏览器关闭后管理器可以重新使用。
+        """
+        self._stop_event.set()
+        try:
+            self.close()
+        finally:
+            self._stop_event.clear()
+
+    def _sleep(self, seconds):
+        """
+        等待指定秒数，调用shutdown时提前结束
+
+        Returns:
+            bool: 被shutdown中断时返回True
+        """
+        return self._stop_event.wait(seconds)
+
+    @classmethod
+    def clear_binary_cache(cls):
+        """清空浏览器可执行文件路径缓存（包括持久化文件），重新加载配置后调用"""
+        _BINARY_PATH_CACHE.clear()
+        try:
+            _BINARY_PATH_CACHE_FILE.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"删除浏览器路径缓存失败: {e}")
+
+    def _find_firefox_binary(self):
+        """
+        查找Firefox可执行文件，依次检查配置、常见安装位置和where/which命令
+
+        Returns:
+            Optional[str]: Firefox路径，找不到时返回None
+        """
+        if hasattr(cfg, 'FIREFOX_BINARY') and cfg.FIREFOX_BINARY:
+            logger.debug(f"使用配置中的 Firefox 路径: {cfg.FIREFOX_BINARY}")
+            if os.path.exists(cfg.FIREFOX_BINARY):
+                return cfg.FIREFOX_BINARY
+            logger.warning(f"配置的Firefox路径不存在: {cfg.FIREFOX_BINARY}")
+
+        cached_path = _cached_binary_path('firefox')
+        if cached_path:
+            return cached_path
+
+        logger.warning("未找到Firefox浏览器路径，尝试使用默认路径")
+        
+        # 尝试手动查找常见路径
+        firefox_path = next((path for path in _FIREFOX_CANDIDATES if os.path.exists(path)), None)
+        if firefox_path:
+            logger.info(f"找到Firefox路径: {firefox_path}")
+            _remember_binary_path('firefox', firefox_path)
+            return firefox_path
+        
+        # 使用"where"或"which"命令查找Firefox
+        try:
+            if os.name == 'nt':  # Windows
+                result = subprocess.run(["where", "firefox"], 
+                                    capture_output=True, 
+                                    text=True,
+                                    encoding=cfg.DEFAULT_ENCODING,
+                                    errors='replace')
+            else:  # Linux/Mac
+                result = subprocess.run(["which", "firefox"], 
+                                    capture_output=True, 
+                                    text=True,
+                                    encoding=cfg.DEFAULT_ENCODING,
+                                    errors='replace')
+            
+            if result.returncode == 0 and result.stdout.strip():
+                firefox_path = result.stdout.strip().split('\n')[0]
+                logger.info(f"通过系统命令找到Firefox路径: {firefox_path}")
+                _remember_binary_path('firefox', firefox_path)
+                return firefox_path
+        except Exception as e:
+            logger.warning(f"通过系统命令查找Firefox失败: {e}")
+        return None
+
     def _find_chrome_binary(self) -> Path:
-        """Find the Chrome binary on the system."""
+        """Find the Chrome binary on the system, caching the first hit."""
+        # 用户通过环境变量或配置指定的路径优先，无需搜索
+        for configured_path in (os.environ.get("CHROME_BINARY"), getattr(cfg, 'CHROME_BINARY', None)):
+            if configured_path and os.path.isfile(configured_path):
+                return Path(configured_path)
+
+        cached_path = _cached_binary_path('chrome')
+        if cached_path:
+            return Path(cached_path)
+
+        chrome_path = self._search_chrome_binary()
+        _remember_binary_path('chrome', chrome_path)
+        return chrome_path
+
+    def _search_chrome_binary(self) -> Path:
+        """Search the system for the Chrome binary."""
         logger.debug("Looking for Chrome binary...")
         
+        # 使用shutil.which在PATH中查找，不再为where/which命令启动子进程
         if os.name == 'nt':  # Windows
             try:
-                result = subprocess.run(
-                    ["where", "chrome"], 
-                    capture_output=True, 
-                    text=True,
-                    encoding=cfg.DEFAULT_ENCODING,
-                    errors='replace'  # 替换无法解码的字符
-                )
-                
-                if result.returncode == 0:
-                    # 第一行是可执行文件路径
-                    chrome_path = result.stdout.strip().split('\n')[0]
+                chrome_path = shutil.which("chrome")
+                if chrome_path:
                     logger.debug(f"Chrome found at: {chrome_path}")
                     return Path(chrome_path)
                 else:
                     # 检查常见安装位置
-                    logger.debug("Chrome not found with 'where', checking common locations...")
-                    common_locations = [
-                        Path("C:/Program Files/Google/Chrome/Application/chrome.exe"),
-                        Path("C:/Program Files (x86)/Google/Chrome/Application/chrome.exe"),
-                        Path(os.environ.get('LOCALAPPDATA', '')) / "Google/Chrome/Application/chrome.exe",
-                    ]
-                    
-                    for location in common_locations:
-                        if location.exists():
-                            logger.debug(f"Chrome found at common location: {location}")
-                            return location
+                    logger.debug("Chrome not found on PATH, checking common locations...")
+                    location = next((path for path in _CHROME_CANDIDATES if os.path.isfile(path)), None)
+                    if location:
+                        logger.debug(f"Chrome found at common location: {location}")
+                        return Path(location)
             except Exception as e:
                 logger.error(f"Error finding Chrome on Windows: {e}")
         else:  # Linux/Mac
             try:
-                result = subprocess.run(
-                    ["which", "google-chrome"], 
-                    capture_output=True, 
-                    text=True,
-                    encoding=cfg.DEFAULT_ENCODING,
-                    errors='replace'  # 替换无法解码的字符
-                )
-                
-                if result.returncode == 0:
-                    chrome_path = result.stdout.strip()
+                chrome_path = shutil.which("google-chrome")
+                if chrome_path:
                     logger.debug(f"Chrome found at: {chrome_path}")
                     return Path(chrome_path)
                 else:
                     # 尝试其他名字和位置
                     alternatives = ["google-chrome-stable", "chromium", "chromium-browser"]
                     for alt in alternatives:
-                        result = subprocess.run(
-                            ["which", alt], 
-                            capture_output=True, 
-                            text=True,
-                            encoding=cfg.DEFAULT_ENCODING,
-                            errors='replace'
-                        )
-                        if result.returncode == 0:
-                            chrome_path = result.stdout.strip()
+                        chrome_path = shutil.which(alt)
+                        if chrome_path:
                             logger.debug(f"Chrome alternative found at: {chrome_path}")
                             return Path(chrome_path)
                     
                     # 检查Mac上的常见位置
-                    mac_path = Path("/Applications/Google Chrome.app/Contents/MacOS/Google Chrome")
-                    if mac_path.exists():
+                    mac_path = next((path for path in _CHROME_CANDIDATES if os.path.isfile(path)), None)
+                    if mac_path:
                         logger.debug(f"Chrome found at Mac location: {mac_path}")
-                        return mac_path
+                        return Path(mac_path)
             except Exception as e:
                 logger.error(f"Error finding Chrome on Linux/Mac: {e}")
         
         raise FileNotFoundError("Unable to find Chrome browser on your system")
 
-# 创建单例实例
-browser_manager = BrowserManager()
+
+def _get_browser_manager():
+    """返回BrowserManager单例，首次使用时才创建"""
+    return BrowserManager()
+
+
+def __getattr__(name):
+    # browser_manager在首次访问时才创建，只导入本模块的进程不会构造浏览器管理器
+    if name == 'browser_manager':
+        return _get_browser_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# 浏览器池向同一域名连续发起请求的最小间隔(秒)，避免并发请求被目标网站封禁
+_DOMAIN_STAGGER = 0.1
+
+
+class BrowserPool:
+    """
+    多个浏览器实例组成的池，并发获取多个页面
+
+    第一个工作实例复用browser_manager单例，其余实例按需创建，各自拥有独立的驱动。
+    """
+
+    def __init__(self, size=None):
+        """
+        Args:
+            size: 最多同时运行的浏览器数量，默认使用cfg.BROWSER_POOL_SIZE
+        """
+        self.size = max(1, size or getattr(cfg, 'BROWSER_POOL_SIZE', 4))
+        self._idle = queue.Queue()
+        self._managers = []
+        self._managers_lock = threading.Lock()
+        self._last_hit = {}  # 每个域名下一次允许发起请求的时间
+        self._last_hit_lock = threading.Lock()
+
+    def _checkout(self):
+        """取出一个空闲的浏览器管理器，没有空闲实例且未达到上限时创建新实例"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._managers_lock:
+            if len(self._managers) < self.size:
+                manager = _get_browser_manager() if not self._managers else BrowserManager._create_instance()
+                self._managers.append(manager)
+                return manager
+        return self._idle.get()
+
+    def _wait_domain_turn(self, url):
+        """同一域名的请求之间至少间隔_DOMAIN_STAGGER秒"""
+        domain = urllib.parse.urlsplit(url).hostname or ""
+        with self._last_hit_lock:
+            now = time.monotonic()
+            start_at = max(now, self._last_hit.get(domain, 0.0))
+            self._last_hit[domain] = start_at + _DOMAIN_STAGGER
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def _run_on_idle(self, func, item):
+        """取出一个空闲的浏览器管理器执行func(manager, item)，结束后放回池中"""
+        manager = self._checkout()
+        try:
+            return func(manager, item)
+        finally:
+            self._idle.put(manager)
+
+    def run(self, func, items, max_workers=None):
+        """
+        在池中的多个浏览器上并发执行func(manager, item)
+
+        Args:
+            func: 接收浏览器管理器和单个元素的函数
+            items: 要处理的元素列表
+            max_workers: 并发数量，默认与池大小相同
+
+        Returns:
+            list: 与items顺序一致的结果；func抛出的异常会在这里重新抛出
+        """
+        items = list(items)
+        if not items:
+            return []
+        workers = min(max_workers or self.size, self.size, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._run_on_idle, func, item) for item in items]
+        return [future.result() for future in futures]
+
+    def _fetch(self, manager, url, fetch, kwargs):
+        """使用指定的浏览器获取页面内容，失败时返回None"""
+        try:
+            self._wait_domain_turn(url)
+            if fetch is not None:
+                return fetch(manager, url)
+            return manager.get_page_content(url, **kwargs)
+        except Exception as e:
+            logger.error(f"浏览器池获取页面失败 {url}: {str(e)}")
+            return None
+
+    def get_page_contents(self, urls, max_workers=None, fetch=None, **kwargs):
+        """
+        并发获取多个页面的内容
+
+        Args:
+            urls: 页面URL列表
+            max_workers: 并发数量，默认与池大小相同
+            fetch: 自定义获取函数fetch(manager, url)，需要按页面类型使用不同参数时传入；
+                默认调用manager.get_page_content(url, **kwargs)
+            kwargs: 传给get_page_content的其他参数
+
+        Returns:
+            dict: URL到页面HTML内容的映射，获取失败的页面对应None
+        """
+        urls = list(dict.fromkeys(urls))
+        contents = self.run(lambda manager, url: self._fetch(manager, url, fetch, kwargs), urls, max_workers)
+        return dict(zip(urls, contents))
+
+    def close(self):
+        """关闭池中除browser_manager单例以外的所有浏览器，之后再使用时按需重新创建"""
+        with self._managers_lock:
+            managers, self._managers = self._managers, []
+        self._idle = queue.Queue()
+        for manager in managers:
+            if manager is not BrowserManager._instance:
+                manager.close()
+
+
+browser_pool = BrowserPool()
+# 进程退出时关闭池中额外创建的浏览器，避免遗留chromedriver/Chrome进程
+atexit.register(browser_pool.close)
 
 def init_browser():
     """
@@ -920,7 +1801,7 @@ def init_browser():
         WebDriver: 浏览器驱动实例
     """
     try:
-        return browser_manager.get_driver()
+        return _get_browser_manager().get_driver()
     except Exception as e:
         logger.error(f"浏览器初始化失败: {str(e)}")
         raise RuntimeError(f"浏览器初始化失败: {str(e)}")
@@ -941,17 +1822,26 @@ def HTML_to_PDF(html_content, driver=None):
         
         # 如果没有提供 driver，使用 browser_manager 初始化一个新的
         if driver is None:
-            driver = browser_manager.get_driver()
+            driver = _get_browser_manager().get_driver()
         
-        # 创建临时 HTML 文件
-        with tempfile.NamedTemporaryFile('w', suffix='.html', delete=False, encoding='utf-8') as f:
-            f.write(html_content)
-            temp_path = f.name
+        # HTML直接编码为data URL加载，无需写临时文件；超过URL长度限制时才使用临时文件
+        encoded_html = base64.b64encode(html_content.encode('utf-8')).decode('ascii')
+        temp_path = None
+        if len(encoded_html) <= _DATA_URL_MAX_LENGTH:
+            page_url = f"data:text/html;base64,{encoded_html}"
+        else:
+            with tempfile.NamedTemporaryFile('w', suffix='.html', delete=False, encoding='utf-8') as f:
+                f.write(html_content)
+                temp_path = f.name
+            page_url = f'file:///{temp_path}'
         
         try:
-            # 加载 HTML 文件
-            driver.get(f'file:///{temp_path}')
-            time.sleep(2)  # 等待页面加载
+            # 加载 HTML，页面和字体加载完成后立即继续
+            driver.get(page_url)
+            try:
+                WebDriverWait(driver, 10, poll_frequency=0.1).until(_pdf_page_ready)
+            except TimeoutException:
+                logger.warning("等待PDF页面加载超时，继续生成PDF")
             
             # 获取页面高度
             height = driver.execute_script('return document.body.scrollHeight')
@@ -989,11 +1879,32 @@ def HTML_to_PDF(html_content, driver=None):
             
         finally:
             # 清理临时文件
-            try:
-                os.unlink(temp_path)
-            except Exception as e:
-                logger.warning(f"清理临时文件失败: {str(e)}")
+            if temp_path:
+                try:
+                    os.unlink(temp_path)
+                except Exception as e:
+                    logger.warning(f"清理临时文件失败: {str(e)}")
         
     except Exception as e:
         logger.error(f"HTML 转换为 PDF 失败: {str(e)}")
         raise
+
+
+def HTML_to_PDFs(html_docs, max_workers=None):
+    """
+    批量将 HTML 内容转换为 PDF
+
+    每个浏览器在单个会话中依次渲染分到的文档，多个文档分配到browser_pool的多个浏览器并行渲染。
+
+    Args:
+        html_docs (list): 要转换的 HTML 内容列表
+        max_workers (int, optional): 同时使用的浏览器数量，默认与浏览器池大小相同
+
+    Returns:
+        list: 与html_docs顺序一致的 Base64 编码 PDF 内容
+    """
+    def render(manager, html_content):
+        with manager._driver_lock:
+            return HTML_to_PDF(html_content, manager.get_driver())
+
+    return browser_pool.run(render, html_docs, max_workers)
@@ -0,0 +1,27 @@
+import pytest
+
+from src.libs.resume_and_cover_builder.llm.llm_job_parser import _REQUIREMENT_PATTERNS
+
+
+def _first_requirements(text):
+    for pattern in _REQUIREMENT_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Requirements: 5+ years of Python and SQL Benefits: health insurance\nApply today",
+     "5+ years of Python and SQL"),
+    ("岗位要求：熟悉Python，三年以上经验福利待遇：五险一金\n欢迎投递",
+     "熟悉Python，三年以上经验"),
+])
+def test_requirements_stop_at_inline_heading(text, expected):
+    assert _first_requirements(text) == expected
+
+
+def test_requirements_stop_at_blank_line():
+    text = "Requirements:\n- Python\n- Docker\n\nAbout the team"
+    assert _first_requirements(text) == "- Python\n- Docker"
+
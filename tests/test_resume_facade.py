@@ -0,0 +1,43 @@
+from src.libs.resume_and_cover_builder.resume_facade import ResumeFacade
+
+
+JOB_URL = "https://www.linkedin.com/jobs/view/1234567890"
+
+
+class _FlakyParser:
+    """第一次获取返回模拟数据（模拟页面获取失败），之后返回真实解析结果"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def parse_job(self, job_url):
+        self.calls += 1
+        if self.calls == 1:
+            return {"title": "软件工程师1234", "company": "模拟公司", "url": job_url, "is_mock": True}
+        return {"title": "Backend Engineer", "company": "Acme", "description": "Build APIs",
+                "location": "Remote", "url": job_url}
+
+
+def _make_facade(parser):
+    facade = ResumeFacade.__new__(ResumeFacade)
+    facade._job_cache = {}
+    facade.llm_job_parser = parser
+    return facade
+
+
+def test_link_to_job_retries_after_failed_fetch():
+    parser = _FlakyParser()
+    facade = _make_facade(parser)
+
+    first = facade.link_to_job(JOB_URL)
+    assert first["is_mock"] is True
+    assert JOB_URL not in facade._job_cache
+
+    second = facade.link_to_job(JOB_URL)
+    assert parser.calls == 2
+    assert second["title"] == "Backend Engineer"
+    assert facade.job.company == "Acme"
+
+    # 真实解析结果会被缓存，第三次调用不再重新获取
+    facade.link_to_job(JOB_URL)
+    assert parser.calls == 2